@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Iterator, Sequence
+
+from app.core.config import SETTINGS
+from app.core.responses import encode_json
+from app.edits.transforms import TransformError, apply_pipeline, compile_pipeline
+from app.exports.formats import (
+    EXPORT_FORMATS,
+    iter_csv_export,
+    iter_export_rows,
+    iter_ndjson_export,
+    write_xlsx_export,
+)
+from app.ingest.ingest import IngestError, ingest_file, upload_suffix
+from app.validation.validate import revalidate_cells, validate_working_csv
+
+
+@dataclass(frozen=True)
+class BatchOptions:
+    out_dir: Path
+    max_rows: int
+    max_decompressed_bytes: int
+    sheet: str | None = None
+    steps: list[dict] | None = None
+    apply_to: str = "all"
+    export_format: str | None = "csv"
+
+
+@dataclass
+class FileReport:
+    file: str
+    status: str
+    output_dir: str
+    total_rows: int = 0
+    error_count: int = 0
+    warning_count: int = 0
+    pipeline_changes: int = 0
+    export: str | None = None
+    error: dict[str, object] | None = None
+    elapsed_ms: float = 0.0
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    steps = None
+    if args.pipeline is not None:
+        try:
+            steps = json.loads(Path(args.pipeline).read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            parser.error(f"cannot read --pipeline file: {exc}")
+        if isinstance(steps, dict):
+            steps = steps.get("steps")
+        if not isinstance(steps, list):
+            parser.error("--pipeline must contain a list of steps or {\"steps\": [...]}.")
+    files = list(_expand_inputs(args.inputs))
+    if not files:
+        parser.error("no CSV/XLSX files found in the given inputs.")
+
+    options = BatchOptions(
+        out_dir=Path(args.out),
+        max_rows=args.max_rows,
+        max_decompressed_bytes=SETTINGS.max_decompressed_bytes,
+        sheet=args.sheet,
+        steps=steps,
+        apply_to=args.apply_to,
+        export_format=None if args.format == "none" else args.format,
+    )
+    options.out_dir.mkdir(parents=True, exist_ok=True)
+    started = time.perf_counter()
+    reports = run_batch(files, options, args.workers)
+    summary = _summary(reports, time.perf_counter() - started)
+    (options.out_dir / "summary.json").write_bytes(encode_json(summary))
+
+    for report in reports:
+        detail = report.error["message"] if report.error else f"{report.error_count} errors"
+        print(f"{report.status:<9} {report.total_rows:>8} rows  {detail:<40} {report.file}")
+    print(
+        f"{summary['files']} files, {summary['failed']} failed, "
+        f"{summary['total_rows']} rows, {summary['error_count']} errors "
+        f"in {summary['elapsed_ms'] / 1000:.1f}s"
+    )
+    if summary["failed"]:
+        return 1
+    if args.fail_on_issues and summary["error_count"]:
+        return 2
+    return 0
+
+
+def run_batch(files: list[Path], options: BatchOptions, workers: int) -> list[FileReport]:
+    names = _output_names(files)
+    if workers <= 1 or len(files) == 1:
+        return [process_file(path, names[path], options) for path in files]
+    reports: dict[Path, FileReport] = {}
+    context = get_context("spawn")
+    with ProcessPoolExecutor(min(workers, len(files)), mp_context=context) as pool:
+        futures = {
+            pool.submit(process_file, path, names[path], options): path for path in files
+        }
+        for future in as_completed(futures):
+            reports[futures[future]] = future.result()
+    return [reports[path] for path in files]
+
+
+def process_file(path: Path, name: str, options: BatchOptions) -> FileReport:
+    started = time.perf_counter()
+    output_dir = options.out_dir / name
+    shutil.rmtree(output_dir, ignore_errors=True)
+    output_dir.mkdir(parents=True)
+    report = FileReport(file=str(path), status="ok", output_dir=str(output_dir))
+    with tempfile.TemporaryDirectory(prefix="databuddy-batch-") as scratch:
+        working_path = Path(scratch) / "working.csv"
+        try:
+            _process(path, working_path, output_dir, options, report)
+        except Exception as exc:
+            report.status = "rejected"
+            report.error = _error_payload(exc)
+    report.elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+    (output_dir / "report.json").write_bytes(encode_json(asdict(report)))
+    return report
+
+
+def _process(
+    path: Path,
+    working_path: Path,
+    output_dir: Path,
+    options: BatchOptions,
+    report: FileReport,
+) -> None:
+    dataset = ingest_file(
+        path, working_path, options.max_rows, options.max_decompressed_bytes, options.sheet
+    )
+    report.total_rows = dataset["total_rows"]
+    validation = validate_working_csv(working_path)
+    canonical_columns = list(dataset["canonical_columns"])
+
+    if options.steps:
+        pipeline = compile_pipeline(options.steps, canonical_columns)
+        error_rows = None
+        if options.apply_to == "errors":
+            targets = {name for name, _ in pipeline.targets}
+            error_rows = {
+                issue["row_id"]
+                for issue in validation.issues
+                if issue.get("severity") == "error" and issue.get("column") in targets
+            }
+        result = apply_pipeline(working_path, pipeline, error_rows=error_rows)
+        report.pipeline_changes = len(result.changes)
+        cells = (
+            (change.row_id, change.row_number, change.column, change.new)
+            for change in result.changes
+        )
+        validation = revalidate_cells(validation.issues, cells)
+
+    (output_dir / "dataset.json").write_bytes(encode_json(dataset))
+    (output_dir / "issues.json").write_bytes(encode_json(validation.issues))
+    report.error_count = validation.summary["error_count"]
+    report.warning_count = validation.summary["warning_count"]
+    if options.export_format is not None:
+        report.export = str(_export(working_path, canonical_columns, output_dir, options))
+
+
+def _export(
+    working_path: Path, canonical_columns: list[str], output_dir: Path, options: BatchOptions
+) -> Path:
+    export_format = options.export_format or "csv"
+    _, filename = EXPORT_FORMATS[export_format]
+    dest_path = output_dir / filename
+    rows = iter_export_rows(working_path, None)
+    columns = canonical_columns if export_format != "csv" else ["row_id", *canonical_columns]
+    if export_format == "xlsx":
+        os.replace(write_xlsx_export(rows, columns, output_dir), dest_path)
+        return dest_path
+    if export_format == "ndjson":
+        chunks = iter_ndjson_export(rows, columns)
+    else:
+        chunks = iter_csv_export(rows, columns)
+    with dest_path.open("wb") as out_file:
+        for chunk in chunks:
+            out_file.write(chunk)
+    return dest_path
+
+
+def _summary(reports: list[FileReport], elapsed: float) -> dict[str, object]:
+    return {
+        "files": len(reports),
+        "failed": sum(1 for report in reports if report.status != "ok"),
+        "total_rows": sum(report.total_rows for report in reports),
+        "error_count": sum(report.error_count for report in reports),
+        "warning_count": sum(report.warning_count for report in reports),
+        "elapsed_ms": round(elapsed * 1000, 1),
+        "reports": [asdict(report) for report in reports],
+    }
+
+
+def _error_payload(exc: Exception) -> dict[str, object]:
+    if isinstance(exc, IngestError):
+        return {"error": exc.error, "message": exc.message, "details": exc.details}
+    if isinstance(exc, TransformError):
+        return {"error": "invalid_pipeline", "message": str(exc), "details": exc.details}
+    if isinstance(exc, UnicodeDecodeError):
+        reason, message = "invalid_encoding", "File rejected: file is not valid UTF-8."
+    elif isinstance(exc, zipfile.BadZipFile):
+        reason, message = "invalid_archive", "File rejected: archive or workbook is corrupt."
+    elif isinstance(exc, OSError):
+        reason, message = "read_error", f"File rejected: could not be read ({exc})."
+    else:
+        reason, message = "parse_error", f"File rejected: failed to process ({exc})."
+    return {
+        "error": "upload_rejected",
+        "message": message,
+        "details": {"reason": reason, "exception": type(exc).__name__},
+    }
+
+
+def _expand_inputs(inputs: list[str]) -> Iterator[Path]:
+    for item in inputs:
+        path = Path(item)
+        if path.is_dir():
+            yield from (
+                child
+                for child in sorted(path.iterdir())
+                if child.is_file() and upload_suffix(child.name) is not None
+            )
+        elif upload_suffix(path.name) is not None:
+            yield path
+
+
+def _output_names(files: list[Path]) -> dict[Path, str]:
+    names: dict[Path, str] = {}
+    used: set[str] = set()
+    for path in files:
+        base = path.name[: -len(upload_suffix(path.name) or "")] or path.name
+        name = base
+        counter = 2
+        while name in used:
+            name = f"{base}-{counter}"
+            counter += 1
+        used.add(name)
+        names[path] = name
+    return names
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.cli",
+        description="Ingest, validate, transform, and export census files without the API.",
+    )
+    parser.add_argument("inputs", nargs="+", help="Files or directories to process.")
+    parser.add_argument("--out", required=True, help="Directory for reports and exports.")
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1, help="Parallel worker processes."
+    )
+    parser.add_argument("--pipeline", help="JSON file with bulk transform steps to apply.")
+    parser.add_argument("--apply-to", choices=["all", "errors"], default="all")
+    parser.add_argument(
+        "--format", choices=[*EXPORT_FORMATS, "none"], default="csv", help="Export format."
+    )
+    parser.add_argument("--sheet", help="XLSX sheet name, or * to merge all sheets.")
+    parser.add_argument("--max-rows", type=int, default=SETTINGS.max_rows)
+    parser.add_argument(
+        "--fail-on-issues",
+        action="store_true",
+        help="Exit with status 2 when any file has validation errors.",
+    )
+    return parser
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,14 +3,58 @@ import os
 from pathlib import Path
 
 
+LARGE_FILE_MAX_BYTES = 500_000_000
+LARGE_FILE_MAX_ROWS = 2_000_000
+
+
 @dataclass(frozen=True)
 class Settings:
     storage_root: Path
+    max_bytes: int = 10_000_000
+    max_rows: int = 50_000
+    max_decompressed_bytes: int = 100_000_000
+    large_file_mode: bool = False
+    compress_min_bytes: int = 1024
+    timing_enabled: bool = False
+    profiling_enabled: bool = False
+    profile_slow_ms: float = 1000.0
+    profile_sample_rate: float = 0.0
+    profile_max_per_minute: int = 6
+    job_ttl_seconds: float = 86_400.0
+    storage_quota_bytes: int = 0
+    sweep_interval_seconds: float = 300.0
+    ingest_cache_bytes: int = 200_000_000
 
 
 def load_settings() -> Settings:
     root = Path(os.getenv("DATABUDDY_STORAGE_ROOT", "./storage"))
-    return Settings(storage_root=root)
+    large_file_mode = _env_flag("DATABUDDY_LARGE_FILE_MODE")
+    default_max_bytes = LARGE_FILE_MAX_BYTES if large_file_mode else 10_000_000
+    default_max_rows = LARGE_FILE_MAX_ROWS if large_file_mode else 50_000
+    max_bytes = int(os.getenv("DATABUDDY_MAX_BYTES", str(default_max_bytes)))
+    return Settings(
+        storage_root=root,
+        max_bytes=max_bytes,
+        max_decompressed_bytes=int(
+            os.getenv("DATABUDDY_MAX_DECOMPRESSED_BYTES", str(max_bytes * 10))
+        ),
+        max_rows=int(os.getenv("DATABUDDY_MAX_ROWS", str(default_max_rows))),
+        large_file_mode=large_file_mode,
+        compress_min_bytes=int(os.getenv("DATABUDDY_COMPRESS_MIN_BYTES", "1024")),
+        timing_enabled=_env_flag("DATABUDDY_TIMING"),
+        profiling_enabled=_env_flag("DATABUDDY_PROFILING"),
+        profile_slow_ms=float(os.getenv("DATABUDDY_PROFILE_SLOW_MS", "1000")),
+        profile_sample_rate=float(os.getenv("DATABUDDY_PROFILE_SAMPLE_RATE", "0")),
+        profile_max_per_minute=int(os.getenv("DATABUDDY_PROFILE_MAX_PER_MINUTE", "6")),
+        job_ttl_seconds=float(os.getenv("DATABUDDY_JOB_TTL_SECONDS", "86400")),
+        storage_quota_bytes=int(os.getenv("DATABUDDY_STORAGE_QUOTA_BYTES", "0")),
+        sweep_interval_seconds=float(os.getenv("DATABUDDY_SWEEP_INTERVAL_SECONDS", "300")),
+        ingest_cache_bytes=int(os.getenv("DATABUDDY_INGEST_CACHE_BYTES", "200000000")),
+    )
+
+
+def _env_flag(name: str) -> bool:
+    return os.getenv(name, "").strip().lower() in {"1", "true", "yes", "on"}
 
 
 SETTINGS = load_settings()
@@ -1,5 +1,15 @@
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
 from threading import Lock
+from uuid import uuid4
+import json
+import os
+import time
+
+from app.core.locks import file_lock, job_lock_path, registry_lock_path
+
+
+TOUCH_INTERVAL_SECONDS = 30.0
 
 
 @dataclass
@@ -12,25 +22,109 @@ class JobState:
     dataset: dict[str, object] | None
     validation: dict[str, object] | None
     issues: list[dict[str, object]]
+    dataset_version: int = 1
 
 
 _lock = Lock()
 _active_job: JobState | None = None
+_last_access: dict[str, float] = {}
+_registry_root: Path | None = None
+
+
+def configure_job_store(root: Path | None) -> None:
+    global _registry_root, _active_job
+    with _lock:
+        _registry_root = root
+        _active_job = None
 
 
 def get_active_job() -> JobState | None:
     with _lock:
-        return _active_job
+        if _registry_root is None:
+            return _active_job
+    return _read_registry(_registry_root)
 
 
 def set_active_job(state: JobState) -> JobState:
+    global _active_job
     with _lock:
-        global _active_job
         _active_job = state
-        return state
+        root = _registry_root
+    if root is not None:
+        with file_lock(registry_lock_path(root)):
+            _write_registry(root, state)
+    return state
 
 
-def clear_active_job() -> None:
+def claim_active_job(state: JobState) -> bool:
+    global _active_job
     with _lock:
-        global _active_job
-        _active_job = None
+        root = _registry_root
+        if root is None:
+            if _active_job is not None:
+                return False
+            _active_job = state
+            return True
+    with file_lock(registry_lock_path(root)):
+        if _read_registry(root) is not None:
+            return False
+        _write_registry(root, state)
+    return True
+
+
+def clear_active_job(job_id: str | None = None) -> None:
+    global _active_job
+    with _lock:
+        if job_id is None or (_active_job is not None and _active_job.job_id == job_id):
+            _active_job = None
+        root = _registry_root
+    if root is None:
+        return
+    with file_lock(registry_lock_path(root)):
+        current = _read_registry(root)
+        if current is not None and (job_id is None or current.job_id == job_id):
+            _registry_path(root).unlink(missing_ok=True)
+
+
+def touch_job(job_id: str) -> None:
+    now = time.time()
+    with _lock:
+        previous = _last_access.get(job_id, 0.0)
+        _last_access[job_id] = now
+        root = _registry_root
+    if root is None or now - previous < TOUCH_INTERVAL_SECONDS:
+        return
+    path = job_lock_path(root, job_id)
+    if path.parent.is_dir():
+        path.touch()
+
+
+def job_last_access(job_id: str) -> float | None:
+    with _lock:
+        return _last_access.get(job_id)
+
+
+def _registry_path(root: Path) -> Path:
+    return root / "active_job.json"
+
+
+def _read_registry(root: Path) -> JobState | None:
+    try:
+        raw = json.loads(_registry_path(root).read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return None
+    names = {item.name for item in fields(JobState)} - {"issues"}
+    try:
+        return JobState(**{key: value for key, value in raw.items() if key in names}, issues=[])
+    except TypeError:
+        return None
+
+
+def _write_registry(root: Path, state: JobState) -> None:
+    path = _registry_path(root)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = asdict(state)
+    payload.pop("issues", None)
+    temp_path = path.with_suffix(f".{uuid4().hex}.tmp")
+    temp_path.write_text(json.dumps(payload), encoding="utf-8")
+    os.replace(temp_path, path)
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import os
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+from threading import Lock
+from typing import Callable, Iterator, TypeVar
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
+
+
+F = TypeVar("F", bound=Callable[..., object])
+
+_local_locks: dict[str, Lock] = {}
+_local_locks_guard = Lock()
+
+
+@contextmanager
+def file_lock(path: Path, blocking: bool = True) -> Iterator[bool]:
+    if fcntl is None:
+        with _local_file_lock(path, blocking) as acquired:
+            yield acquired
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        flags = fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+        try:
+            fcntl.flock(fd, flags)
+        except BlockingIOError:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+
+def job_lock_path(root: Path, job_id: str) -> Path:
+    return root / "jobs" / job_id / ".lock"
+
+
+def registry_lock_path(root: Path) -> Path:
+    return root / ".registry.lock"
+
+
+@contextmanager
+def job_lock(
+    root: Path, job_id: str, blocking: bool = True, create: bool = False
+) -> Iterator[bool]:
+    path = job_lock_path(root, job_id)
+    if not create and not path.parent.is_dir():
+        yield True
+        return
+    while True:
+        if create:
+            path.parent.mkdir(parents=True, exist_ok=True)
+        with file_lock(path, blocking) as acquired:
+            if create and acquired and not path.parent.is_dir():
+                continue
+            yield acquired
+            return
+
+
+def locked_by_job(root: Path) -> Callable[[F], F]:
+    def decorator(func: F) -> F:
+        @wraps(func)
+        def wrapper(*args: object, **kwargs: object) -> object:
+            with job_lock(root, str(kwargs["job_id"])):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+@contextmanager
+def _local_file_lock(path: Path, blocking: bool) -> Iterator[bool]:
+    with _local_locks_guard:
+        lock = _local_locks.setdefault(str(path), Lock())
+    acquired = lock.acquire(blocking)
+    try:
+        yield acquired
+    finally:
+        if acquired:
+            lock.release()
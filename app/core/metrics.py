@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from bisect import bisect_left
+from pathlib import Path
+from threading import Lock
+from typing import Callable
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.timing import stage_stats
+
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+LOOP_LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+LabelValues = tuple[str, ...]
+
+
+class Counter:
+    def __init__(self, name: str, help_text: str, labelnames: tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = labelnames
+        self._values: dict[LabelValues, float] = {}
+        self._lock = Lock()
+
+    def inc(self, amount: float = 1.0, *labels: str) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for labels, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_labels(self.labelnames, labels)} {_number(value)}")
+        return lines
+
+
+class Gauge:
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        callback: Callable[[], float] | None = None,
+    ) -> None:
+        self.name = name
+        self.help_text = help_text
+        self.callback = callback
+        self._value = 0.0
+
+    def set(self, value: float) -> None:
+        self._value = value
+
+    def render(self) -> list[str]:
+        value = self.callback() if self.callback is not None else self._value
+        return [
+            f"# HELP {self.name} {self.help_text}",
+            f"# TYPE {self.name} gauge",
+            f"{self.name} {_number(value)}",
+        ]
+
+
+class Histogram:
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        buckets: tuple[float, ...],
+        labelnames: tuple[str, ...] = (),
+    ) -> None:
+        self.name = name
+        self.help_text = help_text
+        self.buckets = buckets
+        self.labelnames = labelnames
+        self._series: dict[LabelValues, list[float]] = {}
+        self._lock = Lock()
+
+    def observe(self, value: float, *labels: str) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = [0.0] * (len(self.buckets) + 3)
+                self._series[labels] = series
+            series[index] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        label_names = (*self.labelnames, "le")
+        with self._lock:
+            for labels, series in sorted(self._series.items()):
+                cumulative = 0.0
+                for bound, count in zip((*self.buckets, math.inf), series):
+                    cumulative += count
+                    bucket_labels = _labels(label_names, (*labels, _bound(bound)))
+                    lines.append(f"{self.name}_bucket{bucket_labels} {_number(cumulative)}")
+                series_labels = _labels(self.labelnames, labels)
+                lines.append(f"{self.name}_sum{series_labels} {series[-2]:.6f}")
+                lines.append(f"{self.name}_count{series_labels} {_number(series[-1])}")
+        return lines
+
+
+REQUEST_LATENCY = Histogram(
+    "databuddy_request_duration_seconds",
+    "HTTP request latency by route.",
+    LATENCY_BUCKETS,
+    ("method", "route", "status"),
+)
+ROWS_INGESTED = Counter("databuddy_rows_ingested_total", "Rows written to working datasets.")
+ROWS_VALIDATED = Counter(
+    "databuddy_rows_validated_total", "Rows validated on ingest and append."
+)
+ISSUES_FOUND = Counter(
+    "databuddy_validation_issues_total",
+    "Validation issues found on ingest and append, by type.",
+    ("type",),
+)
+LOOP_LAG = Histogram(
+    "databuddy_event_loop_lag_seconds",
+    "Delay between scheduled and actual event loop wakeups.",
+    LOOP_LAG_BUCKETS,
+)
+RECLAIMED_BYTES = Counter(
+    "databuddy_storage_reclaimed_bytes_total", "Bytes freed by the storage sweeper."
+)
+JOBS_EVICTED = Counter(
+    "databuddy_jobs_evicted_total", "Jobs removed by the storage sweeper, by reason.", ("reason",)
+)
+INGEST_CACHE_LOOKUPS = Counter(
+    "databuddy_ingest_cache_lookups_total", "Ingest cache lookups, by result.", ("result",)
+)
+LOOP_LAG_LAST = Gauge(
+    "databuddy_event_loop_lag_last_seconds", "Most recent event loop lag sample."
+)
+
+
+def record_validation(row_count: int, issues: list[dict[str, object]]) -> None:
+    ROWS_VALIDATED.inc(row_count)
+    counts: dict[str, int] = {}
+    for issue in issues:
+        issue_type = str(issue.get("type") or "unknown")
+        counts[issue_type] = counts.get(issue_type, 0) + 1
+    for issue_type, count in counts.items():
+        ISSUES_FOUND.inc(count, issue_type)
+
+
+def render_metrics(storage_root: Path) -> str:
+    active_jobs, storage_bytes = _storage_usage(storage_root)
+    lines: list[str] = []
+    for metric in (
+        REQUEST_LATENCY,
+        ROWS_INGESTED,
+        ROWS_VALIDATED,
+        ISSUES_FOUND,
+        RECLAIMED_BYTES,
+        JOBS_EVICTED,
+        INGEST_CACHE_LOOKUPS,
+        LOOP_LAG,
+    ):
+        lines.extend(metric.render())
+    lines.extend(LOOP_LAG_LAST.render())
+    lines.extend(
+        Gauge("databuddy_active_jobs", "Jobs present in storage.", lambda: active_jobs).render()
+    )
+    lines.extend(
+        Gauge(
+            "databuddy_storage_bytes",
+            "Bytes used under the storage root.",
+            lambda: storage_bytes,
+        ).render()
+    )
+    lines.extend(_render_stage_stats())
+    return "\n".join(lines) + "\n"
+
+
+async def monitor_event_loop_lag(interval: float = 0.5) -> None:
+    loop = asyncio.get_running_loop()
+    while True:
+        scheduled = loop.time() + interval
+        await asyncio.sleep(interval)
+        lag = max(loop.time() - scheduled, 0.0)
+        LOOP_LAG.observe(lag)
+        LOOP_LAG_LAST.set(lag)
+
+
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            route_path = getattr(route, "path", None) or "unmatched"
+            REQUEST_LATENCY.observe(
+                time.perf_counter() - started,
+                scope.get("method", ""),
+                route_path,
+                str(status_code),
+            )
+
+
+def _storage_usage(storage_root: Path) -> tuple[int, int]:
+    jobs_root = storage_root / "jobs"
+    if not jobs_root.exists():
+        return 0, 0
+    active_jobs = 0
+    storage_bytes = 0
+    for job_dir in jobs_root.iterdir():
+        if job_dir.is_dir():
+            active_jobs += 1
+    for path in storage_root.rglob("*"):
+        try:
+            if path.is_file():
+                storage_bytes += path.stat().st_size
+        except FileNotFoundError:
+            continue
+    return active_jobs, storage_bytes
+
+
+def _render_stage_stats() -> list[str]:
+    stats = stage_stats()
+    if not stats:
+        return []
+    lines = [
+        "# HELP databuddy_stage_seconds_total Time spent per pipeline stage.",
+        "# TYPE databuddy_stage_seconds_total counter",
+    ]
+    for stage, values in sorted(stats.items()):
+        seconds = values["total_ms"] / 1000
+        lines.append(f'databuddy_stage_seconds_total{{stage="{stage}"}} {seconds:.6f}')
+    lines.append("# HELP databuddy_stage_rows_total Rows processed per pipeline stage.")
+    lines.append("# TYPE databuddy_stage_rows_total counter")
+    for stage, values in sorted(stats.items()):
+        lines.append(f'databuddy_stage_rows_total{{stage="{stage}"}} {values["rows"]}')
+    return lines
+
+
+def _labels(names: tuple[str, ...], values: tuple[str, ...]) -> str:
+    if not names:
+        return ""
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    return "{" + ",".join(pairs) + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _bound(value: float) -> str:
+    return "+Inf" if math.isinf(value) else repr(value)
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(value)
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import cProfile
+import io
+import pstats
+import random
+import time
+import tracemalloc
+from collections import deque
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import wraps
+from pathlib import Path
+from threading import Lock
+from typing import Callable, TypeVar
+
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+PROFILE_HEADER = "x-databuddy-profile"
+TOP_STATS = 40
+TOP_ALLOCATIONS = 25
+
+F = TypeVar("F", bound=Callable[..., object])
+
+
+@dataclass(frozen=True)
+class ProfilingConfig:
+    enabled: bool = False
+    slow_ms: float = 1000.0
+    sample_rate: float = 0.0
+    max_per_minute: int = 6
+    storage_root: Path = Path("./storage")
+
+
+class RateLimiter:
+    def __init__(self, max_events: int, window_seconds: float = 60.0) -> None:
+        self.max_events = max_events
+        self.window_seconds = window_seconds
+        self._events: deque[float] = deque()
+        self._lock = Lock()
+
+    def try_acquire(self) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            while self._events and now - self._events[0] > self.window_seconds:
+                self._events.popleft()
+            if len(self._events) >= self.max_events:
+                return False
+            self._events.append(now)
+            return True
+
+
+_config = ProfilingConfig()
+_limiter = RateLimiter(_config.max_per_minute)
+_session_lock = Lock()
+_requested: ContextVar[bool | None] = ContextVar("databuddy_profile_requested", default=None)
+
+
+def configure_profiling(config: ProfilingConfig) -> None:
+    global _config, _limiter
+    _config = config
+    _limiter = RateLimiter(config.max_per_minute)
+
+
+class ProfilingMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not _config.enabled:
+            await self.app(scope, receive, send)
+            return
+        forced = Headers(scope=scope).get(PROFILE_HEADER, "").lower() in {"1", "true"}
+        token = _requested.set(forced)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _requested.reset(token)
+
+
+def profiled(func: F) -> F:
+    @wraps(func)
+    def wrapper(*args: object, **kwargs: object) -> object:
+        forced = _requested.get()
+        if forced is None or not _should_profile(forced):
+            return func(*args, **kwargs)
+        if not _session_lock.acquire(blocking=False):
+            return func(*args, **kwargs)
+        try:
+            return _run_profiled(func, forced, args, kwargs)
+        finally:
+            _session_lock.release()
+
+    return wrapper  # type: ignore[return-value]
+
+
+def _should_profile(forced: bool) -> bool:
+    if forced:
+        return _limiter.try_acquire()
+    return _config.sample_rate > 0 and random.random() < _config.sample_rate
+
+
+def _run_profiled(
+    func: Callable[..., object],
+    forced: bool,
+    args: tuple[object, ...],
+    kwargs: dict[str, object],
+) -> object:
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    profiler = cProfile.Profile()
+    started = time.perf_counter()
+    try:
+        result = profiler.runcall(func, *args, **kwargs)
+    finally:
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        snapshot = tracemalloc.take_snapshot()
+        if started_tracing:
+            tracemalloc.stop()
+
+    job_id = kwargs.get("job_id")
+    if not isinstance(job_id, str):
+        return result
+    if not forced and (elapsed_ms < _config.slow_ms or not _limiter.try_acquire()):
+        return result
+    profile_name = _write_profile(
+        _config.storage_root / "jobs" / job_id / "profiles",
+        func.__name__,
+        elapsed_ms,
+        profiler,
+        snapshot,
+    )
+    if profile_name is not None and isinstance(result, Response):
+        result.headers["X-Databuddy-Profile-Id"] = profile_name
+    return result
+
+
+def _write_profile(
+    profile_dir: Path,
+    handler_name: str,
+    elapsed_ms: float,
+    profiler: cProfile.Profile,
+    snapshot: tracemalloc.Snapshot,
+) -> str | None:
+    if not profile_dir.parent.exists():
+        return None
+    profile_dir.mkdir(parents=True, exist_ok=True)
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+    name = f"{stamp}-{handler_name}"
+    profiler.dump_stats(profile_dir / f"{name}.prof")
+
+    stats_buffer = io.StringIO()
+    stats = pstats.Stats(profiler, stream=stats_buffer)
+    stats.sort_stats("cumulative").print_stats(TOP_STATS)
+
+    lines = [f"handler: {handler_name}", f"elapsed_ms: {elapsed_ms:.2f}", "", "top allocations:"]
+    for stat in snapshot.statistics("lineno")[:TOP_ALLOCATIONS]:
+        lines.append(str(stat))
+    lines.extend(["", "cumulative time:", stats_buffer.getvalue()])
+    (profile_dir / f"{name}.txt").write_text("\n".join(lines), encoding="utf-8")
+    return name
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from dataclasses import dataclass, field, fields
+from pathlib import Path
+
+from app.core.job_store import JobState, clear_active_job, get_active_job, set_active_job
+from app.core.locks import job_lock
+from app.core.responses import decode_json
+from app.core.storage import (
+    read_job_metadata,
+    remove_job_dirs,
+    validation_issues_path,
+    working_csv_path,
+    write_job_metadata,
+    write_validation_issues,
+)
+from app.core.sweeper import TEMP_FILE_GRACE_SECONDS
+from app.rows.index import get_row_index
+from app.rows.profile import get_profile
+from app.validation.validate import validate_working_csv
+
+
+@dataclass
+class RecoveryReport:
+    active_job: str | None = None
+    recovered: list[str] = field(default_factory=list)
+    revalidated: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+    temp_files_removed: int = 0
+
+
+def recover_jobs(root: Path, warm: bool = True) -> RecoveryReport:
+    report = RecoveryReport()
+    jobs_root = root / "jobs"
+    if not jobs_root.is_dir():
+        return report
+
+    newest: tuple[str, dict[str, object]] | None = None
+    for job_root in sorted(jobs_root.iterdir()):
+        if not job_root.is_dir():
+            continue
+        with job_lock(root, job_root.name, blocking=False) as acquired:
+            if not acquired:
+                report.skipped.append(job_root.name)
+                continue
+            metadata = _recover_job(root, job_root, report)
+        if metadata is not None and (
+            newest is None
+            or str(metadata.get("created_at", "")) >= str(newest[1].get("created_at", ""))
+        ):
+            newest = (job_root.name, metadata)
+
+    if newest is None:
+        active = get_active_job()
+        if active is not None and not (jobs_root / active.job_id).is_dir():
+            clear_active_job(active.job_id)
+        return report
+
+    job_id, metadata = newest
+    active = get_active_job()
+    if active is not None and active.job_id != job_id and (jobs_root / active.job_id).is_dir():
+        report.active_job = active.job_id
+        return report
+    names = {item.name for item in fields(JobState)}
+    values = {key: value for key, value in metadata.items() if key in names}
+    values["issues"] = []
+    try:
+        set_active_job(JobState(**values))
+    except TypeError:
+        report.skipped.append(job_id)
+        return report
+    report.active_job = job_id
+    if warm:
+        threading.Thread(
+            target=warm_job_caches,
+            args=(working_csv_path(root, job_id),),
+            name="databuddy-warm-caches",
+            daemon=True,
+        ).start()
+    return report
+
+
+def _recover_job(
+    root: Path, job_root: Path, report: RecoveryReport
+) -> dict[str, object] | None:
+    job_id = job_root.name
+    report.temp_files_removed += _remove_temp_files(job_root)
+    if not (job_root / "metadata.json").exists():
+        remove_job_dirs(root, job_id)
+        report.removed.append(job_id)
+        return None
+    try:
+        metadata = read_job_metadata(root, job_id)
+    except ValueError:
+        metadata = None
+    working_path = working_csv_path(root, job_id)
+    if not isinstance(metadata, dict) or not _working_intact(working_path, metadata):
+        report.skipped.append(job_id)
+        return None
+    if not _issues_intact(validation_issues_path(root, job_id)):
+        validation_result = validate_working_csv(working_path)
+        write_validation_issues(root, job_id, validation_result.issues)
+        metadata["validation"] = validation_result.summary
+        write_job_metadata(root, job_id, metadata)
+        report.revalidated.append(job_id)
+    report.recovered.append(job_id)
+    return metadata
+
+
+def warm_job_caches(working_path: Path) -> None:
+    try:
+        get_row_index(working_path)
+        get_profile(working_path)
+    except (OSError, ValueError):
+        return
+
+
+def _remove_temp_files(job_root: Path) -> int:
+    removed = 0
+    now = time.time()
+    for path in job_root.rglob("*.tmp"):
+        if path.parent.name == "exports":
+            continue
+        try:
+            if now - path.stat().st_mtime <= TEMP_FILE_GRACE_SECONDS:
+                continue
+        except FileNotFoundError:
+            continue
+        path.unlink(missing_ok=True)
+        removed += 1
+    return removed
+
+
+def _working_intact(working_path: Path, metadata: dict[str, object]) -> bool:
+    dataset = metadata.get("dataset")
+    total_rows = dataset.get("total_rows") if isinstance(dataset, dict) else None
+    try:
+        with working_path.open("rb") as handle:
+            size = handle.seek(0, os.SEEK_END)
+            if size == 0:
+                return False
+            handle.seek(size - 1)
+            if handle.read(1) != b"\n":
+                return False
+            return get_row_index(working_path, handle).total_rows == total_rows
+    except (OSError, ValueError):
+        return False
+
+
+def _issues_intact(path: Path) -> bool:
+    try:
+        issues = decode_json(path.read_bytes())
+    except (OSError, ValueError):
+        return False
+    return isinstance(issues, list)
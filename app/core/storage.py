@@ -1,7 +1,12 @@
 from pathlib import Path
+from uuid import uuid4
 import json
+import os
 import shutil
 
+from app.core.job_store import touch_job
+from app.core.responses import decode_json, encode_json
+
 
 def ensure_storage_layout(root: Path) -> None:
     root.mkdir(parents=True, exist_ok=True)
@@ -37,6 +42,14 @@ def export_csv_path(root: Path, job_id: str) -> Path:
     return root / "jobs" / job_id / "exports" / "output.csv"
 
 
+def exports_dir(root: Path, job_id: str) -> Path:
+    return root / "jobs" / job_id / "exports"
+
+
+def history_dir(root: Path, job_id: str) -> Path:
+    return root / "jobs" / job_id / "history"
+
+
 def validation_issues_path(root: Path, job_id: str) -> Path:
     return root / "jobs" / job_id / "validation" / "issues.json"
 
@@ -44,24 +57,36 @@ def validation_issues_path(root: Path, job_id: str) -> Path:
 def write_job_metadata(root: Path, job_id: str, metadata: dict[str, object]) -> None:
     path = job_metadata_path(root, job_id)
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(metadata, indent=2), encoding="utf-8")
+    temp_path = path.with_suffix(f".{uuid4().hex}.tmp")
+    temp_path.write_text(json.dumps(metadata, indent=2), encoding="utf-8")
+    os.replace(temp_path, path)
 
 
 def read_job_metadata(root: Path, job_id: str) -> dict[str, object] | None:
     path = job_metadata_path(root, job_id)
     if not path.exists():
         return None
+    touch_job(job_id)
     return json.loads(path.read_text(encoding="utf-8"))
 
 
 def write_validation_issues(root: Path, job_id: str, issues: list[dict[str, object]]) -> None:
     path = validation_issues_path(root, job_id)
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(issues, indent=2), encoding="utf-8")
+    temp_path = path.with_suffix(f".{uuid4().hex}.tmp")
+    temp_path.write_bytes(encode_json(issues))
+    os.replace(temp_path, path)
+
+
+def read_validation_issues_bytes(root: Path, job_id: str) -> bytes | None:
+    path = validation_issues_path(root, job_id)
+    if not path.exists():
+        return None
+    return path.read_bytes()
 
 
 def read_validation_issues(root: Path, job_id: str) -> list[dict[str, object]] | None:
     path = validation_issues_path(root, job_id)
     if not path.exists():
         return None
-    return json.loads(path.read_text(encoding="utf-8"))
+    return decode_json(path.read_bytes())
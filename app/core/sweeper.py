@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import asyncio
+import shutil
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from app.core.job_store import clear_active_job, get_active_job, job_last_access
+from app.core.locks import file_lock, job_lock
+from app.core.metrics import JOBS_EVICTED, RECLAIMED_BYTES
+from app.core.storage import exports_dir, remove_job_dirs, working_csv_path
+from app.ingest.uploads import uploads_root
+
+
+TEMP_FILE_GRACE_SECONDS = 3600.0
+
+
+@dataclass
+class SweepReport:
+    reclaimed_bytes: int = 0
+    expired_jobs: list[str] = field(default_factory=list)
+    evicted_jobs: list[str] = field(default_factory=list)
+    stale_exports: int = 0
+    expired_uploads: list[str] = field(default_factory=list)
+    storage_bytes: int = 0
+
+
+@dataclass
+class _JobUsage:
+    job_id: str
+    size: int
+    last_used: float
+    complete: bool
+
+
+def sweep_storage(
+    root: Path,
+    job_ttl_seconds: float,
+    quota_bytes: int,
+    now: float | None = None,
+) -> SweepReport:
+    report = SweepReport()
+    if not (root / "jobs").is_dir():
+        return report
+    with file_lock(root / ".sweeper.lock", blocking=False) as acquired:
+        if acquired:
+            _sweep(root, job_ttl_seconds, quota_bytes, time.time() if now is None else now, report)
+    RECLAIMED_BYTES.inc(report.reclaimed_bytes)
+    return report
+
+
+def _sweep(
+    root: Path, job_ttl_seconds: float, quota_bytes: int, now: float, report: SweepReport
+) -> None:
+    jobs_root = root / "jobs"
+    _sweep_uploads(root, job_ttl_seconds, now, report)
+    active = get_active_job()
+    active_id = active.job_id if active is not None else None
+
+    usages: list[_JobUsage] = []
+    for job_root in jobs_root.iterdir():
+        if not job_root.is_dir():
+            continue
+        job_id = job_root.name
+        report.reclaimed_bytes += _sweep_exports(root, job_id, now, report)
+        usage = _job_usage(job_root)
+        expired = job_ttl_seconds > 0 and now - usage.last_used > job_ttl_seconds
+        if expired and _evict(root, usage, active_id, "ttl", report):
+            report.expired_jobs.append(job_id)
+            continue
+        usages.append(usage)
+
+    total = sum(usage.size for usage in usages)
+    if quota_bytes > 0 and total > quota_bytes:
+        for usage in sorted(usages, key=lambda item: item.last_used):
+            if total <= quota_bytes:
+                break
+            if usage.job_id == active_id or not usage.complete:
+                continue
+            if _evict(root, usage, active_id, "quota", report):
+                report.evicted_jobs.append(usage.job_id)
+                total -= usage.size
+    report.storage_bytes = total
+
+
+async def run_storage_sweeper(
+    root: Path, interval_seconds: float, job_ttl_seconds: float, quota_bytes: int
+) -> None:
+    while True:
+        await asyncio.sleep(interval_seconds)
+        await asyncio.to_thread(sweep_storage, root, job_ttl_seconds, quota_bytes)
+
+
+def _evict(
+    root: Path, usage: _JobUsage, active_id: str | None, reason: str, report: SweepReport
+) -> bool:
+    with job_lock(root, usage.job_id, blocking=False) as acquired:
+        if not acquired:
+            return False
+        remove_job_dirs(root, usage.job_id)
+    if usage.job_id == active_id:
+        clear_active_job(usage.job_id)
+    report.reclaimed_bytes += usage.size
+    JOBS_EVICTED.inc(1, reason)
+    return True
+
+
+def _job_usage(job_root: Path) -> _JobUsage:
+    size = 0
+    last_modified = job_root.stat().st_mtime
+    for path in job_root.rglob("*"):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        if path.is_file():
+            size += stat.st_size
+        last_modified = max(last_modified, stat.st_mtime)
+    last_access = job_last_access(job_root.name) or 0.0
+    return _JobUsage(
+        job_id=job_root.name,
+        size=size,
+        last_used=max(last_modified, last_access),
+        complete=(job_root / "metadata.json").exists(),
+    )
+
+
+def _sweep_exports(root: Path, job_id: str, now: float, report: SweepReport) -> int:
+    directory = exports_dir(root, job_id)
+    working_path = working_csv_path(root, job_id)
+    if not directory.is_dir():
+        return 0
+    try:
+        working_mtime = working_path.stat().st_mtime
+    except FileNotFoundError:
+        working_mtime = now
+    reclaimed = 0
+    for path in directory.iterdir():
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        if path.suffix == ".tmp":
+            stale = now - stat.st_mtime > TEMP_FILE_GRACE_SECONDS
+        else:
+            stale = path.name == "output.csv" or stat.st_mtime < working_mtime
+        if stale and path.is_file():
+            path.unlink(missing_ok=True)
+            reclaimed += stat.st_size
+            report.stale_exports += 1
+    return reclaimed
+
+
+def _sweep_uploads(root: Path, ttl_seconds: float, now: float, report: SweepReport) -> None:
+    directory = uploads_root(root)
+    if ttl_seconds <= 0 or not directory.is_dir():
+        return
+    for session_dir in directory.iterdir():
+        size = 0
+        last_modified = 0.0
+        for path in [session_dir, *session_dir.rglob("*")]:
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            if path.is_file():
+                size += stat.st_size
+            last_modified = max(last_modified, stat.st_mtime)
+        if now - last_modified <= ttl_seconds:
+            continue
+        with file_lock(session_dir / ".lock", blocking=False) as acquired:
+            if not acquired:
+                continue
+            shutil.rmtree(session_dir, ignore_errors=True)
+        report.reclaimed_bytes += size
+        report.expired_uploads.append(session_dir.name)
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from threading import Lock
+from typing import Iterator
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+@dataclass
+class Span:
+    name: str
+    duration_ms: float = 0.0
+    rows: int | None = None
+    bytes: int | None = None
+
+
+@dataclass
+class StageStats:
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    rows: int = 0
+    bytes: int = 0
+
+
+class _NullSpan:
+    def __setattr__(self, name: str, value: object) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+_enabled = False
+_spans: ContextVar[list[Span] | None] = ContextVar("databuddy_spans", default=None)
+_stats_lock = Lock()
+_stats: dict[str, StageStats] = {}
+
+
+def configure_timing(enabled: bool) -> None:
+    global _enabled
+    _enabled = enabled
+
+
+def timing_enabled() -> bool:
+    return _enabled
+
+
+@contextmanager
+def timed(name: str) -> Iterator[Span]:
+    if not _enabled:
+        yield _NULL_SPAN  # type: ignore[misc]
+        return
+    span = Span(name=name)
+    started = time.perf_counter()
+    try:
+        yield span
+    finally:
+        span.duration_ms = (time.perf_counter() - started) * 1000
+        _record(span)
+
+
+def stage_stats() -> dict[str, dict[str, float | int]]:
+    with _stats_lock:
+        return {
+            name: {
+                "count": stats.count,
+                "total_ms": round(stats.total_ms, 3),
+                "avg_ms": round(stats.total_ms / stats.count, 3) if stats.count else 0.0,
+                "max_ms": round(stats.max_ms, 3),
+                "rows": stats.rows,
+                "bytes": stats.bytes,
+            }
+            for name, stats in _stats.items()
+        }
+
+
+def reset_stage_stats() -> None:
+    with _stats_lock:
+        _stats.clear()
+
+
+def server_timing_header(spans: list[Span]) -> str:
+    entries: list[str] = []
+    for span in spans:
+        entry = f"{span.name};dur={span.duration_ms:.2f}"
+        details = []
+        if span.rows is not None:
+            details.append(f"rows={span.rows}")
+        if span.bytes is not None:
+            details.append(f"bytes={span.bytes}")
+        if details:
+            entry += f';desc="{" ".join(details)}"'
+        entries.append(entry)
+    return ", ".join(entries)
+
+
+def _record(span: Span) -> None:
+    request_spans = _spans.get()
+    if request_spans is not None:
+        request_spans.append(span)
+    with _stats_lock:
+        stats = _stats.setdefault(span.name, StageStats())
+        stats.count += 1
+        stats.total_ms += span.duration_ms
+        stats.max_ms = max(stats.max_ms, span.duration_ms)
+        stats.rows += span.rows or 0
+        stats.bytes += span.bytes or 0
+
+
+class ServerTimingMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not _enabled:
+            await self.app(scope, receive, send)
+            return
+
+        request_spans: list[Span] = []
+        token = _spans.set(request_spans)
+        started = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                total = Span(name="total", duration_ms=(time.perf_counter() - started) * 1000)
+                headers = MutableHeaders(raw=message["headers"])
+                headers.append("Server-Timing", server_timing_header([*request_spans, total]))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _spans.reset(token)
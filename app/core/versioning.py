@@ -0,0 +1,22 @@
+def dataset_version(metadata: dict[str, object]) -> int:
+    value = metadata.get("dataset_version")
+    return value if isinstance(value, int) else 1
+
+
+def bump_dataset_version(metadata: dict[str, object]) -> int:
+    version = dataset_version(metadata) + 1
+    metadata["dataset_version"] = version
+    return version
+
+
+def dataset_etag(job_id: str, version: int) -> str:
+    return f'"{job_id}-v{version}"'
+
+
+def etag_matches(header: str | None, etag: str) -> bool:
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    candidates = {item.strip().removeprefix("W/") for item in header.split(",")}
+    return etag.removeprefix("W/") in candidates
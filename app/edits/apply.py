@@ -1,8 +1,34 @@
 from __future__ import annotations
 
 import csv
+import io
 import os
+import shutil
+from bisect import bisect_right
+from dataclasses import dataclass
 from pathlib import Path
+from typing import BinaryIO, Callable
+
+from app.core.timing import timed
+from app.rows.index import (
+    RowIndex,
+    RowIndexBuilder,
+    TrackedLines,
+    get_row_index,
+    write_row_index,
+)
+
+
+COPY_CHUNK = 1024 * 1024
+
+
+@dataclass
+class CellChange:
+    row_id: str
+    row_number: int
+    column: str
+    old: str
+    new: str
 
 
 def apply_single_edit(
@@ -10,29 +36,122 @@ def apply_single_edit(
     row_id: str,
     column: str,
     value: object,
-) -> bool:
-    temp_path = working_path.with_suffix(".tmp")
-    found = False
+) -> CellChange | None:
     write_value = "" if value is None else str(value)
+    temp_path = working_path.with_suffix(".tmp")
 
-    with working_path.open("r", newline="", encoding="utf-8") as in_file, temp_path.open(
-        "w", newline="", encoding="utf-8"
-    ) as out_file:
-        reader = csv.DictReader(in_file)
-        writer = csv.DictWriter(out_file, fieldnames=reader.fieldnames or [])
-        writer.writeheader()
-        for row in reader:
-            if row.get("row_id") == row_id:
-                row[column] = write_value
-                found = True
-            writer.writerow(row)
-
-    if not found:
+    try:
+        with timed("edit_rewrite") as span, working_path.open("rb") as in_file:
+            row_index = get_row_index(working_path, in_file)
+            in_file.seek(0)
+            fieldnames = next(csv.reader([in_file.readline().decode("utf-8")]))
+            if column not in fieldnames:
+                return None
+            located = _locate_record(in_file, row_index, row_id)
+            if located is None:
+                return None
+            start, end, row_number, record = located
+            old_value = record[fieldnames.index(column)]
+            record[fieldnames.index(column)] = write_value
+            buffer = io.StringIO()
+            csv.writer(buffer, lineterminator="\r\n").writerow(record)
+            new_bytes = buffer.getvalue().encode("utf-8")
+
+            with temp_path.open("wb") as out_file:
+                in_file.seek(0)
+                _copy_bytes(in_file, out_file, start)
+                out_file.write(new_bytes)
+                in_file.seek(end)
+                shutil.copyfileobj(in_file, out_file, COPY_CHUNK)
+                span.bytes = out_file.tell()
+                out_file.flush()
+                stat = os.fstat(out_file.fileno())
+            span.rows = 1
+    except BaseException:
         temp_path.unlink(missing_ok=True)
-        return False
+        raise
 
     os.replace(temp_path, working_path)
-    return True
+    delta = len(new_bytes) - (end - start)
+    offsets = [offset + delta if offset > start else offset for offset in row_index.offsets]
+    write_row_index(
+        working_path,
+        RowIndex(
+            stride=row_index.stride,
+            offsets=offsets,
+            total_rows=row_index.total_rows,
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+        ),
+    )
+    return CellChange(
+        row_id=row_id,
+        row_number=row_number,
+        column=column,
+        old=old_value,
+        new=write_value,
+    )
+
+
+def _locate_record(
+    handle: BinaryIO, row_index: RowIndex, row_id: str
+) -> tuple[int, int, int, list[str]] | None:
+    needle = b"\n" + row_id.encode("utf-8") + b","
+    search_from = 0
+    while True:
+        match = _find_bytes(handle, needle, search_from)
+        if match is None:
+            return None
+        located = _parse_record_at(handle, row_index, match + 1)
+        if located is not None and located[3] and located[3][0] == row_id:
+            return located
+        search_from = match + 1
+
+
+def _parse_record_at(
+    handle: BinaryIO, row_index: RowIndex, record_start: int
+) -> tuple[int, int, int, list[str]] | None:
+    slot = bisect_right(row_index.offsets, record_start) - 1
+    if slot < 0:
+        return None
+    handle.seek(row_index.offsets[slot])
+    lines = TrackedLines(handle, row_index.offsets[slot])
+    reader = csv.reader(lines)
+    row_number = slot * row_index.stride
+    while True:
+        start = lines.position
+        record = next(reader, None)
+        if record is None or start > record_start:
+            return None
+        row_number += 1
+        if start == record_start:
+            return start, lines.position, row_number, record
+
+
+def _find_bytes(handle: BinaryIO, needle: bytes, search_from: int) -> int | None:
+    handle.seek(search_from)
+    position = search_from
+    tail = b""
+    while True:
+        chunk = handle.read(COPY_CHUNK)
+        if not chunk:
+            return None
+        window = tail + chunk
+        found = window.find(needle)
+        if found != -1:
+            return position - len(tail) + found
+        tail = window[-(len(needle) - 1):]
+        position += len(chunk)
+
+
+def _copy_bytes(in_file: BinaryIO, out_file: BinaryIO, length: int) -> None:
+    remaining = length
+    while remaining > 0:
+        chunk = in_file.read(min(COPY_CHUNK, remaining))
+        if not chunk:
+            break
+        out_file.write(chunk)
+        remaining -= len(chunk)
 
 
 def apply_bulk_map(
@@ -43,31 +162,129 @@ def apply_bulk_map(
     apply_to: str = "all",
     error_rows: set[str] | None = None,
     case_insensitive: bool = False,
-) -> None:
+    dry_run: bool = False,
+) -> list[CellChange]:
     temp_path = working_path.with_suffix(".tmp")
-    default_value = "" if default is None else str(default)
-    normalized_mapping = _normalize_mapping(mapping, case_insensitive)
+    mapped_value = bulk_mapper(mapping, default, case_insensitive)
+    changes: list[CellChange] = []
+    index = RowIndexBuilder()
 
-    with working_path.open("r", newline="", encoding="utf-8") as in_file, temp_path.open(
-        "w", newline="", encoding="utf-8"
-    ) as out_file:
+    with timed("bulk_rewrite") as span, working_path.open(
+        "r", newline="", encoding="utf-8"
+    ) as in_file:
         reader = csv.DictReader(in_file)
-        writer = csv.DictWriter(out_file, fieldnames=reader.fieldnames or [])
-        writer.writeheader()
-        for row in reader:
-            current = row.get(column, "") or ""
-            if not _eligible_for_bulk(row, column, current, apply_to, error_rows):
-                writer.writerow(row)
-                continue
-            lookup_value = current.lower() if case_insensitive else current
-            if lookup_value in normalized_mapping:
-                mapped = normalized_mapping[lookup_value]
-                row[column] = "" if mapped is None else str(mapped)
-            elif default is not None:
-                row[column] = default_value
-            writer.writerow(row)
+        out_file = None if dry_run else temp_path.open("w", newline="", encoding="utf-8")
+        try:
+            writer = None
+            if out_file is not None:
+                writer = csv.DictWriter(out_file, fieldnames=reader.fieldnames or [])
+                writer.writeheader()
+            for row_number, row in enumerate(reader, start=1):
+                if out_file is not None:
+                    index.before_row(out_file)
+                current = row.get(column, "") or ""
+                if _eligible_for_bulk(row, column, current, apply_to, error_rows):
+                    row[column] = mapped_value(current)
+                    if row[column] != current:
+                        changes.append(
+                            CellChange(
+                                row_id=row.get("row_id") or "",
+                                row_number=row_number,
+                                column=column,
+                                old=current,
+                                new=row[column],
+                            )
+                        )
+                if writer is not None:
+                    writer.writerow(row)
+                span.rows = row_number
+            if out_file is not None:
+                span.bytes = out_file.tell()
+                row_index = index.finish(out_file)
+        except BaseException:
+            if out_file is not None:
+                out_file.close()
+                temp_path.unlink(missing_ok=True)
+            raise
+        finally:
+            if out_file is not None:
+                out_file.close()
+
+    if not dry_run:
+        os.replace(temp_path, working_path)
+        write_row_index(working_path, row_index)
+    return changes
+
+
+def apply_cell_values(
+    working_path: Path, cells: list[tuple[str, int, str, str]]
+) -> list[CellChange]:
+    if len(cells) == 1:
+        row_id, _, column, value = cells[0]
+        change = apply_single_edit(working_path, row_id, column, value)
+        return [change] if change is not None else []
+
+    targets: dict[int, list[tuple[str, str, str]]] = {}
+    for row_id, row_number, column, value in cells:
+        targets.setdefault(row_number, []).append((row_id, column, value))
+    temp_path = working_path.with_suffix(".tmp")
+    changes: list[CellChange] = []
+    index = RowIndexBuilder()
+
+    try:
+        with timed("cell_rewrite") as span, working_path.open(
+            "r", newline="", encoding="utf-8"
+        ) as in_file, temp_path.open("w", newline="", encoding="utf-8") as out_file:
+            reader = csv.reader(in_file)
+            writer = csv.writer(out_file)
+            header = next(reader, [])
+            positions = {name: position for position, name in enumerate(header)}
+            writer.writerow(header)
+            for row_number, record in enumerate(reader, start=1):
+                index.before_row(out_file)
+                for row_id, column, value in targets.get(row_number, ()):
+                    position = positions.get(column)
+                    if position is None or record[0] != row_id:
+                        continue
+                    changes.append(
+                        CellChange(
+                            row_id=row_id,
+                            row_number=row_number,
+                            column=column,
+                            old=record[position],
+                            new=value,
+                        )
+                    )
+                    record[position] = value
+                writer.writerow(record)
+            span.rows = len(changes)
+            span.bytes = out_file.tell()
+            row_index = index.finish(out_file)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
 
     os.replace(temp_path, working_path)
+    write_row_index(working_path, row_index)
+    return changes
+
+
+def bulk_mapper(
+    mapping: dict[str, object], default: object | None, case_insensitive: bool = False
+) -> Callable[[str], str]:
+    default_value = "" if default is None else str(default)
+    normalized_mapping = _normalize_mapping(mapping, case_insensitive)
+
+    def mapped_value(current: str) -> str:
+        lookup_value = current.lower() if case_insensitive else current
+        if lookup_value in normalized_mapping:
+            mapped = normalized_mapping[lookup_value]
+            return "" if mapped is None else str(mapped)
+        if default is not None:
+            return default_value
+        return current
+
+    return mapped_value
 
 
 def _normalize_mapping(
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from app.core.responses import decode_json, encode_json
+from app.edits.apply import CellChange
+
+
+MAX_HISTORY = 50
+MAX_LOGGED_VERSIONS = 500
+
+
+@dataclass
+class HistoryState:
+    oldest: int = 1
+    cursor: int = 0
+    latest: int = 0
+
+    @property
+    def can_undo(self) -> bool:
+        return self.cursor >= self.oldest
+
+    @property
+    def can_redo(self) -> bool:
+        return self.cursor < self.latest
+
+
+@dataclass
+class HistoryEntry:
+    seq: int
+    action: str
+    changes: list[CellChange]
+
+
+def load_history_state(history_dir: Path) -> HistoryState:
+    try:
+        return HistoryState(**decode_json((history_dir / "state.json").read_bytes()))
+    except (FileNotFoundError, ValueError, TypeError):
+        return HistoryState()
+
+
+def record_operation(history_dir: Path, action: str, changes: list[CellChange]) -> HistoryState:
+    state = load_history_state(history_dir)
+    if not changes:
+        return state
+    history_dir.mkdir(parents=True, exist_ok=True)
+    for seq in range(state.cursor + 1, state.latest + 1):
+        _entry_path(history_dir, seq).unlink(missing_ok=True)
+    state.cursor += 1
+    state.latest = state.cursor
+    _write_atomic(
+        _entry_path(history_dir, state.cursor),
+        encode_json(
+            {
+                "seq": state.cursor,
+                "action": action,
+                "changes": [
+                    [change.row_id, change.row_number, change.column, change.old, change.new]
+                    for change in changes
+                ],
+            }
+        ),
+    )
+    while state.latest - state.oldest + 1 > MAX_HISTORY:
+        _entry_path(history_dir, state.oldest).unlink(missing_ok=True)
+        state.oldest += 1
+    _write_state(history_dir, state)
+    return state
+
+
+def undo_entry(history_dir: Path) -> HistoryEntry | None:
+    state = load_history_state(history_dir)
+    return _read_entry(history_dir, state.cursor) if state.can_undo else None
+
+
+def redo_entry(history_dir: Path) -> HistoryEntry | None:
+    state = load_history_state(history_dir)
+    return _read_entry(history_dir, state.cursor + 1) if state.can_redo else None
+
+
+def move_cursor(history_dir: Path, cursor: int) -> HistoryState:
+    state = load_history_state(history_dir)
+    state.cursor = cursor
+    _write_state(history_dir, state)
+    return state
+
+
+def log_version_cells(history_dir: Path, version: int, changes: list[CellChange]) -> None:
+    history_dir.mkdir(parents=True, exist_ok=True)
+    path = history_dir / "versions.jsonl"
+    line = encode_json(
+        {"version": version, "cells": [[change.row_id, change.column] for change in changes]}
+    )
+    with path.open("a+b") as log:
+        size = log.seek(0, os.SEEK_END)
+        if size:
+            log.seek(size - 1)
+            if log.read(1) != b"\n":
+                line = b"\n" + line
+        log.write(line + b"\n")
+    if version % MAX_LOGGED_VERSIONS == 0:
+        lines = path.read_bytes().splitlines(keepends=True)
+        _write_atomic(path, b"".join(lines[-MAX_LOGGED_VERSIONS:]))
+
+
+def cells_changed_since(
+    history_dir: Path, base_version: int, current_version: int
+) -> set[tuple[str, str]] | None:
+    if base_version >= current_version:
+        return set()
+    try:
+        lines = (history_dir / "versions.jsonl").read_bytes().splitlines()
+    except FileNotFoundError:
+        return None
+    changed: set[tuple[str, str]] = set()
+    seen: set[int] = set()
+    for line in lines:
+        try:
+            entry = decode_json(line)
+            version = entry["version"]
+            in_range = base_version < version <= current_version
+            cells = [(row_id, column) for row_id, column in entry["cells"]]
+        except (ValueError, KeyError, TypeError):
+            continue
+        if in_range:
+            seen.add(version)
+            changed.update(cells)
+    if len(seen) != current_version - base_version:
+        return None
+    return changed
+
+
+def _read_entry(history_dir: Path, seq: int) -> HistoryEntry | None:
+    try:
+        raw = decode_json(_entry_path(history_dir, seq).read_bytes())
+    except (FileNotFoundError, ValueError):
+        return None
+    return HistoryEntry(
+        seq=raw["seq"],
+        action=raw["action"],
+        changes=[CellChange(*change) for change in raw["changes"]],
+    )
+
+
+def _entry_path(history_dir: Path, seq: int) -> Path:
+    return history_dir / f"{seq:06d}.json"
+
+
+def _write_state(history_dir: Path, state: HistoryState) -> None:
+    history_dir.mkdir(parents=True, exist_ok=True)
+    _write_atomic(history_dir / "state.json", encode_json(asdict(state)))
+
+
+def _write_atomic(path: Path, body: bytes) -> None:
+    temp_path = path.with_suffix(".tmp")
+    temp_path.write_bytes(body)
+    os.replace(temp_path, path)
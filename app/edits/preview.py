@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import csv
+import os
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from threading import Lock
+from typing import Callable
+
+from app.core.timing import timed
+from app.edits.apply import bulk_mapper
+from app.validation.validate import validate_cell
+
+
+SAMPLE_LIMIT = 10
+DISTRIBUTION_CACHE_SIZE = 16
+
+_CachedDistribution = tuple[tuple[int, int], Counter[str]]
+_DISTRIBUTIONS: OrderedDict[tuple[str, str, bool], _CachedDistribution] = OrderedDict()
+_DISTRIBUTIONS_LOCK = Lock()
+
+
+@dataclass
+class BulkPreview:
+    affected_rows: int = 0
+    key_rows: dict[str, int] = field(default_factory=dict)
+    default_rows: int = 0
+    samples: list[dict[str, object]] = field(default_factory=list)
+    issues_resolved: int = 0
+    issues_introduced: int = 0
+
+
+def preview_bulk_map(
+    working_path: Path,
+    column: str,
+    mapping: dict[str, object],
+    default: object | None,
+    apply_to: str = "all",
+    error_rows: Callable[[], set[str]] | None = None,
+    case_insensitive: bool = False,
+) -> BulkPreview:
+    distribution = column_distribution(
+        working_path, column, error_rows if apply_to == "errors" else None
+    )
+    mapped_value = bulk_mapper(mapping, default, case_insensitive)
+    key_labels = {
+        (str(key).lower() if case_insensitive else str(key)): str(key) for key in mapping
+    }
+    preview = BulkPreview(key_rows={label: 0 for label in key_labels.values()})
+    changed: list[tuple[int, str, str]] = []
+
+    with timed("bulk_preview") as span:
+        for current, rows in distribution.items():
+            if apply_to == "missing" and current.strip() != "":
+                continue
+            after = mapped_value(current)
+            if after == current:
+                continue
+            preview.affected_rows += rows
+            label = key_labels.get(current.lower() if case_insensitive else current)
+            if label is None:
+                preview.default_rows += rows
+            else:
+                preview.key_rows[label] += rows
+            before_issues = len(validate_cell(None, 0, column, current))
+            after_issues = len(validate_cell(None, 0, column, after))
+            preview.issues_resolved += rows * max(before_issues - after_issues, 0)
+            preview.issues_introduced += rows * max(after_issues - before_issues, 0)
+            changed.append((rows, current, after))
+        span.rows = len(distribution)
+
+    changed.sort(key=lambda item: -item[0])
+    preview.samples = [
+        {"before": before, "after": after, "rows": rows}
+        for rows, before, after in changed[:SAMPLE_LIMIT]
+    ]
+    return preview
+
+
+def column_distribution(
+    working_path: Path,
+    column: str,
+    error_rows: Callable[[], set[str]] | None = None,
+) -> Counter[str]:
+    key = (str(working_path), column, error_rows is not None)
+    with working_path.open("r", newline="", encoding="utf-8") as in_file:
+        stat = os.fstat(in_file.fileno())
+        stamp = (stat.st_size, stat.st_mtime_ns)
+        with _DISTRIBUTIONS_LOCK:
+            cached = _DISTRIBUTIONS.get(key)
+            if cached is not None and cached[0] == stamp:
+                _DISTRIBUTIONS.move_to_end(key)
+                return cached[1]
+
+        only_rows = error_rows() if error_rows is not None else None
+        counts: Counter[str] = Counter()
+        with timed("column_distribution") as span:
+            reader = csv.reader(in_file)
+            header = next(reader, [])
+            position = header.index(column)
+            row_count = 0
+            for record in reader:
+                row_count += 1
+                if only_rows is not None and record[0] not in only_rows:
+                    continue
+                counts[record[position] if position < len(record) else ""] += 1
+            span.rows = row_count
+
+    with _DISTRIBUTIONS_LOCK:
+        _DISTRIBUTIONS[key] = (stamp, counts)
+        _DISTRIBUTIONS.move_to_end(key)
+        while len(_DISTRIBUTIONS) > DISTRIBUTION_CACHE_SIZE:
+            _DISTRIBUTIONS.popitem(last=False)
+    return counts
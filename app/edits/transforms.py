@@ -0,0 +1,323 @@
+from __future__ import annotations
+
+import csv
+import os
+import re
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable
+
+from app.core.timing import timed
+from app.edits.apply import CellChange
+from app.rows.index import RowIndexBuilder, write_row_index
+
+
+CASE_MODES = {"upper", "lower", "title"}
+CONDITION_OPS = {"equals", "not_equals", "empty", "not_empty", "matches"}
+
+RowTransform = Callable[[list[str]], None]
+
+
+class TransformError(ValueError):
+    def __init__(self, message: str, details: dict[str, object] | None = None) -> None:
+        super().__init__(message)
+        self.details = details or {}
+
+
+@dataclass
+class Pipeline:
+    steps: list[RowTransform]
+    targets: list[tuple[str, int]]
+
+
+@dataclass
+class PipelineResult:
+    affected_rows: int = 0
+    changes: list[CellChange] = field(default_factory=list)
+
+
+def compile_pipeline(steps: object, columns: list[str]) -> Pipeline:
+    if not isinstance(steps, list) or not steps:
+        raise TransformError("Bulk action rejected: pipeline needs at least one step.")
+    positions = {name: position for position, name in enumerate(columns, start=1)}
+    compiled: list[RowTransform] = []
+    targets: list[tuple[str, int]] = []
+    for step_number, step in enumerate(steps):
+        if not isinstance(step, dict):
+            raise TransformError(
+                "Bulk action rejected: invalid pipeline step.", {"step": step_number}
+            )
+        op = step.get("op")
+        builder = _STEP_BUILDERS.get(str(op))
+        if builder is None:
+            raise TransformError(
+                f"Bulk action rejected: unknown pipeline op '{op}'.",
+                {"step": step_number, "op": op},
+            )
+        transform, written = builder(step, _ColumnLookup(positions, step_number))
+        compiled.append(transform)
+        for name in written:
+            if (name, positions[name]) not in targets:
+                targets.append((name, positions[name]))
+    return Pipeline(steps=compiled, targets=targets)
+
+
+def apply_pipeline(
+    working_path: Path,
+    pipeline: Pipeline,
+    error_rows: set[str] | None = None,
+    dry_run: bool = False,
+) -> PipelineResult:
+    result = PipelineResult()
+    temp_path = working_path.with_suffix(".tmp")
+    index = RowIndexBuilder()
+
+    with timed("bulk_pipeline") as span, working_path.open(
+        "r", newline="", encoding="utf-8"
+    ) as in_file:
+        reader = csv.reader(in_file)
+        header = next(reader, [])
+        out_file = None if dry_run else temp_path.open("w", newline="", encoding="utf-8")
+        try:
+            writer = csv.writer(out_file) if out_file is not None else None
+            if writer is not None:
+                writer.writerow(header)
+            for row_number, record in enumerate(reader, start=1):
+                if out_file is not None:
+                    index.before_row(out_file)
+                row_id = record[0] if record else ""
+                if error_rows is None or row_id in error_rows:
+                    _transform_row(record, row_id, row_number, pipeline, result)
+                if writer is not None:
+                    writer.writerow(record)
+                span.rows = row_number
+            if out_file is not None:
+                span.bytes = out_file.tell()
+                row_index = index.finish(out_file)
+        except BaseException:
+            if out_file is not None:
+                out_file.close()
+                temp_path.unlink(missing_ok=True)
+            raise
+        finally:
+            if out_file is not None:
+                out_file.close()
+
+    if not dry_run:
+        os.replace(temp_path, working_path)
+        write_row_index(working_path, row_index)
+    return result
+
+
+def _transform_row(
+    record: list[str],
+    row_id: str,
+    row_number: int,
+    pipeline: Pipeline,
+    result: PipelineResult,
+) -> None:
+    before = [record[position] for _, position in pipeline.targets]
+    for step in pipeline.steps:
+        step(record)
+    changed = False
+    for (name, position), old in zip(pipeline.targets, before):
+        if record[position] != old:
+            changed = True
+            result.changes.append(
+                CellChange(
+                    row_id=row_id,
+                    row_number=row_number,
+                    column=name,
+                    old=old,
+                    new=record[position],
+                )
+            )
+    if changed:
+        result.affected_rows += 1
+
+
+class _ColumnLookup:
+    def __init__(self, positions: dict[str, int], step_number: int) -> None:
+        self.positions = positions
+        self.step_number = step_number
+
+    def __call__(self, step: dict[str, object], key: str) -> tuple[str, int]:
+        name = step.get(key)
+        if not isinstance(name, str) or name not in self.positions:
+            raise TransformError(
+                f"Bulk action rejected: unknown column '{name}'.",
+                {"step": self.step_number, "column": name},
+            )
+        return name, self.positions[name]
+
+    def many(self, step: dict[str, object], key: str) -> list[tuple[str, int]]:
+        names = step.get(key)
+        if not isinstance(names, list) or not names:
+            raise TransformError(
+                f"Bulk action rejected: '{key}' must list columns.",
+                {"step": self.step_number},
+            )
+        return [self({key: name}, key) for name in names]
+
+    def invalid(self, message: str) -> TransformError:
+        return TransformError(f"Bulk action rejected: {message}", {"step": self.step_number})
+
+
+def _build_trim(step: dict, lookup: _ColumnLookup) -> tuple[RowTransform, list[str]]:
+    name, position = lookup(step, "column")
+
+    def transform(record: list[str]) -> None:
+        record[position] = record[position].strip()
+
+    return transform, [name]
+
+
+def _build_case(step: dict, lookup: _ColumnLookup) -> tuple[RowTransform, list[str]]:
+    name, position = lookup(step, "column")
+    mode = step.get("mode")
+    if mode not in CASE_MODES:
+        raise lookup.invalid("invalid case mode.")
+    convert = {"upper": str.upper, "lower": str.lower, "title": str.title}[mode]
+
+    def transform(record: list[str]) -> None:
+        record[position] = convert(record[position])
+
+    return transform, [name]
+
+
+def _build_regex_replace(
+    step: dict, lookup: _ColumnLookup
+) -> tuple[RowTransform, list[str]]:
+    name, position = lookup(step, "column")
+    replacement = step.get("replacement", "")
+    if not isinstance(replacement, str):
+        raise lookup.invalid("invalid replacement.")
+    pattern = _compile_pattern(step.get("pattern"), lookup)
+    try:
+        pattern.sub(replacement, "")
+    except (re.error, IndexError) as exc:
+        raise lookup.invalid(f"invalid replacement: {exc}.") from exc
+
+    def transform(record: list[str]) -> None:
+        record[position] = pattern.sub(replacement, record[position])
+
+    return transform, [name]
+
+
+def _build_split(step: dict, lookup: _ColumnLookup) -> tuple[RowTransform, list[str]]:
+    _, source = lookup(step, "column")
+    targets = lookup.many(step, "into")
+    separator = step.get("separator", " ")
+    if not isinstance(separator, str) or separator == "":
+        raise lookup.invalid("invalid separator.")
+    target_positions = [position for _, position in targets]
+    max_split = len(target_positions) - 1
+
+    def transform(record: list[str]) -> None:
+        parts = record[source].split(separator, max_split)
+        parts.extend([""] * (len(target_positions) - len(parts)))
+        for position, part in zip(target_positions, parts):
+            record[position] = part.strip()
+
+    return transform, [name for name, _ in targets]
+
+
+def _build_concat(step: dict, lookup: _ColumnLookup) -> tuple[RowTransform, list[str]]:
+    sources = [position for _, position in lookup.many(step, "columns")]
+    name, target = lookup(step, "into")
+    separator = step.get("separator", " ")
+    if not isinstance(separator, str):
+        raise lookup.invalid("invalid separator.")
+
+    def transform(record: list[str]) -> None:
+        record[target] = separator.join(
+            value for value in (record[position] for position in sources) if value
+        )
+
+    return transform, [name]
+
+
+def _build_date_reformat(
+    step: dict, lookup: _ColumnLookup
+) -> tuple[RowTransform, list[str]]:
+    name, position = lookup(step, "column")
+    source_format = step.get("from")
+    target_format = step.get("to")
+    if not isinstance(source_format, str) or not isinstance(target_format, str):
+        raise lookup.invalid("date_reformat needs 'from' and 'to' formats.")
+    parse = datetime.strptime
+    cache: dict[str, str] = {}
+
+    def transform(record: list[str]) -> None:
+        value = record[position]
+        if value in cache:
+            record[position] = cache[value]
+            return
+        try:
+            formatted = parse(value.strip(), source_format).strftime(target_format)
+        except ValueError:
+            formatted = value
+        cache[value] = formatted
+        record[position] = formatted
+
+    return transform, [name]
+
+
+def _build_set(step: dict, lookup: _ColumnLookup) -> tuple[RowTransform, list[str]]:
+    name, position = lookup(step, "column")
+    raw_value = step.get("value")
+    value = "" if raw_value is None else str(raw_value)
+    condition = step.get("when")
+    if condition is None:
+        matches: Callable[[list[str]], bool] = lambda record: True
+    else:
+        matches = _compile_condition(condition, lookup)
+
+    def transform(record: list[str]) -> None:
+        if matches(record):
+            record[position] = value
+
+    return transform, [name]
+
+
+def _compile_condition(
+    condition: object, lookup: _ColumnLookup
+) -> Callable[[list[str]], bool]:
+    if not isinstance(condition, dict) or condition.get("op") not in CONDITION_OPS:
+        raise lookup.invalid("invalid condition.")
+    _, position = lookup(condition, "column")
+    op = condition["op"]
+    if op == "empty":
+        return lambda record: record[position].strip() == ""
+    if op == "not_empty":
+        return lambda record: record[position].strip() != ""
+    if op == "matches":
+        pattern = _compile_pattern(condition.get("value"), lookup)
+        return lambda record: pattern.search(record[position]) is not None
+    expected = "" if condition.get("value") is None else str(condition.get("value"))
+    if op == "equals":
+        return lambda record: record[position] == expected
+    return lambda record: record[position] != expected
+
+
+def _compile_pattern(pattern: object, lookup: _ColumnLookup) -> re.Pattern[str]:
+    if not isinstance(pattern, str) or pattern == "":
+        raise lookup.invalid("invalid pattern.")
+    try:
+        return re.compile(pattern)
+    except re.error:
+        raise lookup.invalid("invalid pattern.") from None
+
+
+_STEP_BUILDERS: dict[
+    str, Callable[[dict, _ColumnLookup], tuple[RowTransform, list[str]]]
+] = {
+    "trim": _build_trim,
+    "case": _build_case,
+    "regex_replace": _build_regex_replace,
+    "split": _build_split,
+    "concat": _build_concat,
+    "date_reformat": _build_date_reformat,
+    "set": _build_set,
+}
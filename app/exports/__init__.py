@@ -0,0 +1 @@
+"""Export utilities for working datasets."""
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import gzip
+import os
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Iterator
+from uuid import uuid4
+
+
+CHUNK_SIZE = 64 * 1024
+
+
+@dataclass
+class ByteRange:
+    start: int
+    end: int
+
+    @property
+    def length(self) -> int:
+        return self.end - self.start + 1
+
+
+class RangeNotSatisfiable(Exception):
+    pass
+
+
+def file_etag(handle: BinaryIO, suffix: str = "") -> str:
+    stat = os.fstat(handle.fileno())
+    tag = f"{stat.st_mtime_ns:x}-{stat.st_size:x}"
+    if suffix:
+        tag = f"{tag}-{suffix}"
+    return f'"{tag}"'
+
+
+def accepts_encoding(header: str | None, encoding: str) -> bool:
+    if not header:
+        return False
+    for item in header.split(","):
+        name, _, params = item.strip().partition(";")
+        if name.strip().lower() not in {encoding, "*"}:
+            continue
+        quality = params.strip()
+        if quality.startswith("q="):
+            try:
+                return float(quality[2:]) > 0
+            except ValueError:
+                return False
+        return True
+    return False
+
+
+def parse_range(header: str | None, size: int) -> ByteRange | None:
+    if not header or not header.startswith("bytes="):
+        return None
+    spec = header[len("bytes="):].strip()
+    if "," in spec:
+        return None
+    first, sep, last = spec.partition("-")
+    if not sep:
+        return None
+    try:
+        if first == "":
+            suffix_length = int(last)
+            if suffix_length <= 0:
+                raise RangeNotSatisfiable()
+            start = max(size - suffix_length, 0)
+            end = size - 1
+        else:
+            start = int(first)
+            end = int(last) if last else size - 1
+    except ValueError:
+        return None
+    if start < 0 or start >= size or end < start:
+        raise RangeNotSatisfiable()
+    return ByteRange(start=start, end=min(end, size - 1))
+
+
+def open_gzip_export(source: BinaryIO, exports_dir: Path, source_etag: str) -> BinaryIO:
+    token = source_etag.strip('"').removeprefix("W/").strip('"')
+    gzip_path = exports_dir / f"output-{token}.csv.gz"
+    try:
+        return gzip_path.open("rb")
+    except FileNotFoundError:
+        pass
+
+    exports_dir.mkdir(parents=True, exist_ok=True)
+    temp_path = exports_dir / f"output-{token}.{uuid4().hex}.tmp"
+    try:
+        source.seek(0)
+        with temp_path.open("wb") as raw_out:
+            with gzip.GzipFile(filename="", mode="wb", fileobj=raw_out, mtime=0) as out_file:
+                shutil.copyfileobj(source, out_file, CHUNK_SIZE)
+        handle = temp_path.open("rb")
+        os.replace(temp_path, gzip_path)
+    finally:
+        temp_path.unlink(missing_ok=True)
+    for stale in exports_dir.glob("output-*.csv.gz"):
+        if stale != gzip_path:
+            stale.unlink(missing_ok=True)
+    return handle
+
+
+def iter_file_range(handle: BinaryIO, start: int, length: int) -> Iterator[bytes]:
+    try:
+        handle.seek(start)
+        remaining = length
+        while remaining > 0:
+            chunk = handle.read(min(CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+    finally:
+        handle.close()
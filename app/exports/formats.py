@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+from pathlib import Path
+from typing import Iterator
+from uuid import uuid4
+
+from openpyxl import Workbook
+
+from app.rows.reader import RowFilter, iter_rows
+
+
+EXPORT_FORMATS = {
+    "csv": ("text/csv", "databuddy_export.csv"),
+    "canonical_csv": ("text/csv", "databuddy_export.csv"),
+    "ndjson": ("application/x-ndjson", "databuddy_export.ndjson"),
+    "xlsx": (
+        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        "databuddy_export.xlsx",
+    ),
+}
+ISSUE_SCOPES = {"all", "with", "without"}
+FLUSH_ROWS = 1000
+
+
+def iter_export_rows(
+    working_path: Path,
+    filters: list[RowFilter] | None,
+    issue_scope: str = "all",
+    issue_rows: set[str] | None = None,
+) -> Iterator[dict[str, str | None]]:
+    for row in iter_rows(working_path, filters):
+        if issue_scope != "all":
+            has_issue = row.get("row_id") in (issue_rows or set())
+            if has_issue != (issue_scope == "with"):
+                continue
+        yield row
+
+
+def iter_csv_export(
+    rows: Iterator[dict[str, str | None]],
+    columns: list[str],
+) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    pending = 0
+    for row in rows:
+        writer.writerow([row.get(column) or "" for column in columns])
+        pending += 1
+        if pending >= FLUSH_ROWS:
+            yield _drain(buffer)
+            pending = 0
+    yield _drain(buffer)
+
+
+def iter_ndjson_export(
+    rows: Iterator[dict[str, str | None]],
+    columns: list[str],
+) -> Iterator[bytes]:
+    lines: list[str] = []
+    for row in rows:
+        payload = {column: row.get(column) or None for column in columns}
+        lines.append(json.dumps(payload, ensure_ascii=False))
+        if len(lines) >= FLUSH_ROWS:
+            yield ("\n".join(lines) + "\n").encode("utf-8")
+            lines = []
+    if lines:
+        yield ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def write_xlsx_export(
+    rows: Iterator[dict[str, str | None]],
+    columns: list[str],
+    exports_dir: Path,
+) -> Path:
+    exports_dir.mkdir(parents=True, exist_ok=True)
+    dest_path = exports_dir / f"export-{uuid4().hex}.xlsx.tmp"
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("export")
+    sheet.append(columns)
+    for row in rows:
+        sheet.append([row.get(column) or None for column in columns])
+    workbook.save(dest_path)
+    return dest_path
+
+
+def iter_temp_file(path: Path, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    try:
+        with path.open("rb") as in_file:
+            while chunk := in_file.read(chunk_size):
+                yield chunk
+    finally:
+        path.unlink(missing_ok=True)
+
+
+def _drain(buffer: io.StringIO) -> bytes:
+    data = buffer.getvalue().encode("utf-8")
+    buffer.seek(0)
+    buffer.truncate(0)
+    return data
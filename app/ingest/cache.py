@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+from uuid import uuid4
+
+from app.core.locks import file_lock
+from app.core.responses import decode_json, encode_json
+from app.core.timing import timed
+
+
+CACHED_FILES = ("working.csv", "row_index.json", "profile.json")
+
+
+@dataclass
+class CachedIngest:
+    dataset: dict[str, object]
+    validation: dict[str, object]
+    issues: list[dict[str, object]]
+
+
+def ingest_cache_root(root: Path) -> Path:
+    return root / "ingest_cache"
+
+
+def ingest_cache_key(
+    content_hash: str, suffix: str, schema_version: str, sheet: str | None = None
+) -> str:
+    kind = suffix.lstrip(".").lower().replace(".", "_")
+    if sheet is not None:
+        kind += "_" + hashlib.sha256(sheet.encode("utf-8")).hexdigest()[:12]
+    return f"{schema_version}-{kind}-{content_hash}"
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for block in iter(lambda: handle.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def load_cached_ingest(
+    root: Path, key: str, working_dir: Path, max_rows: int
+) -> CachedIngest | None:
+    entry = ingest_cache_root(root) / key
+    with timed("ingest_cache_load"):
+        try:
+            manifest = decode_json((entry / "manifest.json").read_bytes())
+            if manifest["dataset"]["total_rows"] > max_rows:
+                return None
+            issues = decode_json((entry / "issues.json").read_bytes())
+            for name in CACHED_FILES:
+                _clone(entry / name, working_dir / name)
+            os.utime(entry)
+        except (FileNotFoundError, KeyError, ValueError):
+            return None
+    return CachedIngest(
+        dataset=manifest["dataset"], validation=manifest["validation"], issues=issues
+    )
+
+
+def store_cached_ingest(
+    root: Path,
+    key: str,
+    working_dir: Path,
+    cached: CachedIngest,
+    max_bytes: int,
+) -> None:
+    cache_root = ingest_cache_root(root)
+    entry = cache_root / key
+    if entry.exists():
+        return
+    temp_dir = cache_root / f".{uuid4().hex}.tmp"
+    try:
+        temp_dir.mkdir(parents=True)
+        for name in CACHED_FILES:
+            _clone(working_dir / name, temp_dir / name)
+        (temp_dir / "issues.json").write_bytes(encode_json(cached.issues))
+        (temp_dir / "manifest.json").write_bytes(
+            encode_json({"dataset": cached.dataset, "validation": cached.validation})
+        )
+        if _entry_size(temp_dir) > max_bytes:
+            return
+        with file_lock(cache_root / ".lock"):
+            try:
+                os.rename(temp_dir, entry)
+            except OSError:
+                return
+            _enforce_bound(cache_root, max_bytes)
+    except FileNotFoundError:
+        return
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def _enforce_bound(cache_root: Path, max_bytes: int) -> None:
+    entries = []
+    for entry in cache_root.iterdir():
+        if entry.is_dir() and not entry.name.startswith("."):
+            entries.append((entry.stat().st_mtime, _entry_size(entry), entry))
+    total = sum(size for _, size, _ in entries)
+    for _, size, entry in sorted(entries):
+        if total <= max_bytes:
+            break
+        shutil.rmtree(entry, ignore_errors=True)
+        total -= size
+
+
+def _entry_size(entry: Path) -> int:
+    return sum(path.stat().st_size for path in entry.iterdir() if path.is_file())
+
+
+def _clone(source: Path, dest: Path) -> None:
+    dest.unlink(missing_ok=True)
+    try:
+        os.link(source, dest)
+    except OSError:
+        if not source.exists():
+            raise FileNotFoundError(source)
+        shutil.copy2(source, dest)
@@ -1,15 +1,28 @@
 from __future__ import annotations
 
 import csv
-from dataclasses import dataclass
+import gzip
+import io
+import os
+import shutil
+import tempfile
+import zipfile
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack, contextmanager
+from dataclasses import asdict, dataclass, field
 from datetime import date, datetime
+from multiprocessing import get_context
 from pathlib import Path
-from typing import Iterable
+from typing import BinaryIO, Iterable, Iterator, Sequence, TextIO
 from uuid import uuid4
 
 from openpyxl import load_workbook
 
+from app.core.timing import timed
 from app.ingest.schema import CANONICAL_COLUMNS, normalize_header
+from app.rows.index import RowIndexBuilder, get_row_index, write_row_index
+from app.rows.profile import ProfileBuilder, get_profile, write_profile
 
 
 @dataclass
@@ -20,27 +33,283 @@ class IngestError(Exception):
     details: dict
 
 
+SUPPORTED_SUFFIXES = (".csv", ".xlsx", ".csv.gz", ".zip")
+ALL_SHEETS = "*"
+PARALLEL_SHEETS_MIN_BYTES = 1_000_000
+
+
+def upload_suffix(filename: str) -> str | None:
+    lowered = filename.lower()
+    for suffix in sorted(SUPPORTED_SUFFIXES, key=len, reverse=True):
+        if lowered.endswith(suffix):
+            return suffix
+    return None
+
+
+@dataclass
+class SheetSlice:
+    sheet: str
+    first_row_number: int
+    row_count: int
+
+
+@dataclass
+class AppendResult:
+    rows_appended: int
+    unknown_columns: list[str]
+    missing_columns: list[str]
+    start_offset: int
+    sheets: list[SheetSlice] = field(default_factory=list)
+
+
+@dataclass
+class _RowSource:
+    rows: Iterator[Sequence[object]]
+    sheets: list[SheetSlice] = field(default_factory=list)
+    skipped_sheets: list[str] = field(default_factory=list)
+
+    def finish_sheets(self, row_count: int) -> None:
+        if len(self.sheets) == 1:
+            self.sheets[0].row_count = row_count
+
+
 def ingest_file(
-    original_path: Path, working_path: Path, max_rows: int
+    original_path: Path,
+    working_path: Path,
+    max_rows: int,
+    max_decompressed_bytes: int | None = None,
+    sheet: str | None = None,
 ) -> dict[str, object]:
-    suffix = original_path.suffix.lower()
+    with timed("ingest") as span:
+        span.bytes = original_path.stat().st_size
+        with _open_rows(original_path, max_decompressed_bytes, sheet, max_rows) as source:
+            header = _read_header(source.rows)
+            column_map, unknown_columns, canonical_columns = _build_column_map(header)
+            row_count = _write_rows(
+                source.rows, working_path, column_map, canonical_columns, max_rows
+            )
+            source.finish_sheets(row_count)
+        span.rows = row_count
+    dataset = _dataset_meta(row_count, canonical_columns, unknown_columns)
+    if source.sheets:
+        dataset["sheets"] = [asdict(item) for item in source.sheets]
+    if source.skipped_sheets:
+        dataset["skipped_sheets"] = source.skipped_sheets
+    return dataset
+
+
+def append_file(
+    original_path: Path,
+    working_path: Path,
+    canonical_columns: list[str],
+    max_rows: int,
+    max_decompressed_bytes: int | None = None,
+    sheet: str | None = None,
+) -> AppendResult:
+    index = RowIndexBuilder.from_index(get_row_index(working_path))
+    profile = ProfileBuilder.from_profile(get_profile(working_path))
+    existing_rows = index.rows
+    temp_path = working_path.with_suffix(f".{uuid4().hex}.tmp")
+    with timed("append") as span:
+        span.bytes = original_path.stat().st_size
+        try:
+            with _open_rows(original_path, max_decompressed_bytes, sheet, max_rows) as source:
+                header = _read_header(source.rows)
+                column_map, unknown_columns, file_columns = _build_column_map(header)
+                unknown_columns += [name for name in file_columns if name not in canonical_columns]
+                if not any(name in column_map for name in canonical_columns):
+                    raise IngestError(
+                        status_code=422,
+                        error="upload_rejected",
+                        message="Upload rejected: no columns match the job's columns.",
+                        details={"reason": "no_matching_columns", "columns": canonical_columns},
+                    )
+                shutil.copyfile(working_path, temp_path)
+                with temp_path.open("a", newline="", encoding="utf-8") as out_file:
+                    start_offset = out_file.tell()
+                    writer = csv.writer(out_file)
+                    for row in source.rows:
+                        _check_row_limit(index.rows + 1, max_rows)
+                        values = _row_values(row, column_map, canonical_columns)
+                        index.before_row(out_file)
+                        profile.add_row(values)
+                        writer.writerow([str(uuid4()), *values])
+                    row_index = index.finish(out_file)
+                    dataset_profile = profile.finish(out_file)
+                source.finish_sheets(index.rows - existing_rows)
+            os.replace(temp_path, working_path)
+        finally:
+            temp_path.unlink(missing_ok=True)
+        span.rows = index.rows - existing_rows
+    write_row_index(working_path, row_index)
+    write_profile(working_path, dataset_profile)
+    return AppendResult(
+        rows_appended=index.rows - existing_rows,
+        unknown_columns=unknown_columns,
+        missing_columns=[name for name in canonical_columns if name not in column_map],
+        start_offset=start_offset,
+        sheets=source.sheets,
+    )
+
+
+@contextmanager
+def _open_rows(
+    original_path: Path,
+    max_decompressed_bytes: int | None,
+    sheet: str | None = None,
+    max_rows: int | None = None,
+) -> Iterator[_RowSource]:
+    suffix = upload_suffix(original_path.name)
     if suffix == ".csv":
-        return _ingest_csv(original_path, working_path, max_rows)
-    if suffix == ".xlsx":
-        return _ingest_xlsx(original_path, working_path, max_rows)
-    raise IngestError(
-        status_code=400,
-        error="unsupported_file",
-        message="Upload rejected: unsupported file type.",
-        details={},
+        with original_path.open("r", newline="", encoding="utf-8") as in_file:
+            yield _RowSource(csv.reader(in_file))
+    elif suffix in (".csv.gz", ".zip"):
+        with _open_compressed_csv(original_path, suffix, max_decompressed_bytes) as in_file:
+            yield _RowSource(csv.reader(in_file))
+    elif suffix == ".xlsx" and sheet == ALL_SHEETS:
+        with _open_merged_sheets(original_path, max_rows) as source:
+            yield source
+    elif suffix == ".xlsx":
+        with _open_xlsx_rows(original_path, sheet) as source:
+            yield source
+    else:
+        raise IngestError(
+            status_code=400,
+            error="unsupported_file",
+            message="Upload rejected: unsupported file type.",
+            details={},
+        )
+
+
+def _read_header(rows: Iterator[Sequence[object]]) -> list[str]:
+    header_row = next(rows, None)
+    if not header_row:
+        raise IngestError(
+            status_code=422,
+            error="upload_rejected",
+            message="Upload rejected: empty file.",
+            details={"reason": "empty_file"},
+        )
+    return ["" if value is None else str(value) for value in header_row]
+
+
+@contextmanager
+def _open_compressed_csv(
+    original_path: Path, suffix: str, max_bytes: int | None
+) -> Iterator[TextIO]:
+    try:
+        with ExitStack() as stack:
+            if suffix == ".zip":
+                archive = stack.enter_context(zipfile.ZipFile(original_path))
+                members = [info for info in archive.infolist() if not info.is_dir()]
+                if len(members) != 1 or not members[0].filename.lower().endswith(".csv"):
+                    raise IngestError(
+                        status_code=422,
+                        error="upload_rejected",
+                        message="Upload rejected: ZIP uploads must contain exactly one CSV file.",
+                        details={"reason": "invalid_archive"},
+                    )
+                if members[0].flag_bits & 0x1:
+                    raise IngestError(
+                        status_code=422,
+                        error="upload_rejected",
+                        message="Upload rejected: encrypted ZIP files are not supported.",
+                        details={"reason": "invalid_archive"},
+                    )
+                if max_bytes is not None and members[0].file_size > max_bytes:
+                    raise _decompressed_too_large(max_bytes)
+                raw = stack.enter_context(archive.open(members[0]))
+            else:
+                raw = stack.enter_context(gzip.open(original_path, "rb"))
+            limited = io.BufferedReader(_LimitedReader(raw, max_bytes))
+            yield io.TextIOWrapper(limited, encoding="utf-8", newline="")
+    except (
+        OSError, EOFError, zlib.error, zipfile.BadZipFile, RuntimeError, NotImplementedError
+    ) as exc:
+        raise IngestError(
+            status_code=422,
+            error="upload_rejected",
+            message="Upload rejected: failed to decompress file.",
+            details={"reason": "parse_error"},
+        ) from exc
+
+
+class _LimitedReader(io.RawIOBase):
+    def __init__(self, raw: BinaryIO, max_bytes: int | None) -> None:
+        self._raw = raw
+        self._max_bytes = max_bytes
+        self._read = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self._raw.read(len(buffer))
+        self._read += len(data)
+        if self._max_bytes is not None and self._read > self._max_bytes:
+            raise _decompressed_too_large(self._max_bytes)
+        buffer[: len(data)] = data
+        return len(data)
+
+
+def _decompressed_too_large(max_bytes: int) -> IngestError:
+    return IngestError(
+        status_code=413,
+        error="upload_rejected",
+        message=(
+            f"Upload rejected: decompressed file exceeds the {max_bytes / 1_000_000:g} MB limit."
+        ),
+        details={"reason": "decompressed_too_large", "max_decompressed_bytes": max_bytes},
     )
 
 
-def _ingest_csv(original_path: Path, working_path: Path, max_rows: int) -> dict[str, object]:
-    with original_path.open("r", newline="", encoding="utf-8") as in_file:
-        reader = csv.reader(in_file)
-        header = next(reader, None)
-        if not header:
+@contextmanager
+def _open_xlsx_rows(original_path: Path, sheet: str | None) -> Iterator[_RowSource]:
+    workbook = _load_workbook(original_path)
+    try:
+        names = workbook.sheetnames
+        name = names[0] if sheet is None else sheet
+        if name not in names:
+            raise IngestError(
+                status_code=422,
+                error="upload_rejected",
+                message=f"Upload rejected: sheet '{sheet}' not found.",
+                details={"reason": "sheet_not_found", "sheet": sheet, "available_sheets": names},
+            )
+        rows = workbook[name].iter_rows(values_only=True)
+        yield _RowSource(rows, sheets=[SheetSlice(sheet=name, first_row_number=1, row_count=0)])
+    finally:
+        workbook.close()
+
+
+@contextmanager
+def _open_merged_sheets(original_path: Path, max_rows: int | None) -> Iterator[_RowSource]:
+    workbook = _load_workbook(original_path)
+    names = workbook.sheetnames
+    workbook.close()
+    limit = max_rows if max_rows is not None else -1
+    with tempfile.TemporaryDirectory(prefix="databuddy-sheets-") as scratch:
+        outputs = [str(Path(scratch) / f"{position}.csv") for position in range(len(names))]
+        paths = [str(original_path)] * len(names)
+        limits = [limit] * len(names)
+        with timed("xlsx_sheets") as span:
+            if len(names) > 1 and original_path.stat().st_size >= PARALLEL_SHEETS_MIN_BYTES:
+                workers = min(len(names), os.cpu_count() or 1)
+                with ProcessPoolExecutor(workers, mp_context=get_context("spawn")) as pool:
+                    counts = list(pool.map(_parse_sheet, paths, names, outputs, limits))
+            else:
+                counts = list(map(_parse_sheet, paths, names, outputs, limits))
+            span.rows = sum(counts)
+        if max_rows is not None:
+            _check_row_limit(sum(counts), max_rows)
+
+        headers: dict[str, list[str]] = {}
+        for name, output in zip(names, outputs):
+            with open(output, newline="", encoding="utf-8") as sheet_file:
+                header = next(csv.reader(sheet_file), [])
+            if _build_column_map(header)[2]:
+                headers[name] = header
+        if not headers:
             raise IngestError(
                 status_code=422,
                 error="upload_rejected",
@@ -48,15 +317,79 @@ def _ingest_csv(original_path: Path, working_path: Path, max_rows: int) -> dict[
                 details={"reason": "empty_file"},
             )
 
-        column_map, unknown_columns, canonical_columns = _build_column_map(header)
-        row_count = _write_rows(reader, working_path, column_map, canonical_columns, max_rows)
+        merged_header = _merge_headers(list(headers.values()))
+        sheets: list[SheetSlice] = []
+        first_row_number = 1
+        for name, count in zip(names, counts):
+            if name in headers:
+                sheets.append(SheetSlice(name, first_row_number, count))
+                first_row_number += count
+
+        def merged_rows() -> Iterator[Sequence[object]]:
+            yield merged_header
+            for name, output in zip(names, outputs):
+                if name not in headers:
+                    continue
+                positions = _header_positions(headers[name], merged_header)
+                with open(output, newline="", encoding="utf-8") as sheet_file:
+                    reader = csv.reader(sheet_file)
+                    next(reader, None)
+                    for row in reader:
+                        yield [
+                            row[position] if position is not None and position < len(row) else ""
+                            for position in positions
+                        ]
+
+        yield _RowSource(
+            merged_rows(),
+            sheets=sheets,
+            skipped_sheets=[name for name in names if name not in headers],
+        )
+
+
+def _parse_sheet(original_path: str, sheet: str, output: str, max_rows: int) -> int:
+    workbook = load_workbook(filename=original_path, read_only=True, data_only=True)
+    row_count = 0
+    try:
+        with open(output, "w", newline="", encoding="utf-8") as out_file:
+            writer = csv.writer(out_file)
+            rows = workbook[sheet].iter_rows(values_only=True)
+            header = next(rows, None)
+            if not header:
+                return 0
+            writer.writerow(["" if value is None else str(value) for value in header])
+            for row in rows:
+                row_count += 1
+                if 0 <= max_rows < row_count:
+                    break
+                writer.writerow([_format_cell(value) for value in row])
+    finally:
+        workbook.close()
+    return row_count
+
 
-    return _dataset_meta(row_count, canonical_columns, unknown_columns)
+def _merge_headers(headers: list[list[str]]) -> list[str]:
+    canonical: set[str] = set()
+    unknown: dict[str, None] = {}
+    for header in headers:
+        column_map, unknown_columns, _ = _build_column_map(header)
+        canonical.update(column_map)
+        unknown.update(dict.fromkeys(unknown_columns))
+    return [name for name in CANONICAL_COLUMNS if name in canonical] + list(unknown)
 
 
-def _ingest_xlsx(original_path: Path, working_path: Path, max_rows: int) -> dict[str, object]:
+def _header_positions(header: list[str], merged_header: list[str]) -> list[int | None]:
+    column_map, unknown_columns, _ = _build_column_map(header)
+    positions: dict[str, int] = dict(column_map)
+    for position, name in enumerate(header):
+        if name in unknown_columns and name not in positions:
+            positions[name] = position
+    return [positions.get(name) for name in merged_header]
+
+
+def _load_workbook(original_path: Path):
     try:
-        workbook = load_workbook(filename=original_path, read_only=True, data_only=True)
+        return load_workbook(filename=original_path, read_only=True, data_only=True)
     except Exception as exc:  # pragma: no cover - defensive parse guard
         raise IngestError(
             status_code=422,
@@ -65,23 +398,6 @@ def _ingest_xlsx(original_path: Path, working_path: Path, max_rows: int) -> dict
             details={"reason": "parse_error"},
         ) from exc
 
-    sheet = workbook.worksheets[0]
-    rows = sheet.iter_rows(values_only=True)
-    header_row = next(rows, None)
-    if not header_row:
-        raise IngestError(
-            status_code=422,
-            error="upload_rejected",
-            message="Upload rejected: empty file.",
-            details={"reason": "empty_file"},
-        )
-
-    header = ["" if value is None else str(value) for value in header_row]
-    column_map, unknown_columns, canonical_columns = _build_column_map(header)
-    row_count = _write_rows(rows, working_path, column_map, canonical_columns, max_rows)
-    workbook.close()
-    return _dataset_meta(row_count, canonical_columns, unknown_columns)
-
 
 def _build_column_map(
     header: list[str],
@@ -112,28 +428,40 @@ def _write_rows(
     max_rows: int,
 ) -> int:
     row_count = 0
+    index = RowIndexBuilder()
+    profile = ProfileBuilder(canonical_columns)
     working_path.parent.mkdir(parents=True, exist_ok=True)
     with working_path.open("w", newline="", encoding="utf-8") as out_file:
         writer = csv.writer(out_file)
         writer.writerow(["row_id", *canonical_columns])
         for row in rows:
             row_count += 1
-            if row_count > max_rows:
-                raise IngestError(
-                    status_code=422,
-                    error="upload_rejected",
-                    message="Upload rejected: dataset exceeds the 50,000 row limit.",
-                    details={
-                        "reason": "too_many_rows",
-                        "max_rows": max_rows,
-                        "received_rows": row_count,
-                    },
-                )
+            _check_row_limit(row_count, max_rows)
             values = _row_values(row, column_map, canonical_columns)
+            index.before_row(out_file)
+            profile.add_row(values)
             writer.writerow([str(uuid4()), *values])
+        row_index = index.finish(out_file)
+        dataset_profile = profile.finish(out_file)
+    write_row_index(working_path, row_index)
+    write_profile(working_path, dataset_profile)
     return row_count
 
 
+def _check_row_limit(row_count: int, max_rows: int) -> None:
+    if row_count > max_rows:
+        raise IngestError(
+            status_code=422,
+            error="upload_rejected",
+            message=f"Upload rejected: dataset exceeds the {max_rows:,} row limit.",
+            details={
+                "reason": "too_many_rows",
+                "max_rows": max_rows,
+                "received_rows": row_count,
+            },
+        )
+
+
 def _row_values(
     row: Iterable[object],
     column_map: dict[str, int],
@@ -142,8 +470,8 @@ def _row_values(
     row_list = list(row)
     values: list[str] = []
     for column in canonical_columns:
-        index = column_map[column]
-        value = row_list[index] if index < len(row_list) else None
+        index = column_map.get(column)
+        value = row_list[index] if index is not None and index < len(row_list) else None
         values.append(_format_cell(value))
     return values
 
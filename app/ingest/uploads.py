@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import shutil
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import AsyncIterator
+from uuid import uuid4
+
+from app.core.locks import file_lock
+
+
+DEFAULT_CHUNK_BYTES = 8 * 1024 * 1024
+MIN_CHUNK_BYTES = 1024
+MAX_CHUNK_BYTES = 64 * 1024 * 1024
+MAX_CHUNKS = 10_000
+
+_UPLOAD_ID = re.compile(r"^upl_[0-9a-f]{32}$")
+_SHA256 = re.compile(r"^[0-9a-f]{64}$")
+
+
+@dataclass
+class UploadError(Exception):
+    status_code: int
+    error: str
+    message: str
+    details: dict
+
+
+@dataclass
+class UploadSession:
+    upload_id: str
+    filename: str
+    total_bytes: int
+    chunk_size: int
+    created_at: str
+    received: dict[str, str] = field(default_factory=dict)
+    sheet: str | None = None
+
+    @property
+    def chunk_count(self) -> int:
+        return max(1, -(-self.total_bytes // self.chunk_size))
+
+    def chunk_length(self, index: int) -> int:
+        if index < self.chunk_count - 1:
+            return self.chunk_size
+        return self.total_bytes - self.chunk_size * (self.chunk_count - 1)
+
+    def missing_chunks(self) -> list[int]:
+        return [index for index in range(self.chunk_count) if str(index) not in self.received]
+
+    def summary(self) -> dict[str, object]:
+        return {
+            "upload_id": self.upload_id,
+            "filename": self.filename,
+            "total_bytes": self.total_bytes,
+            "chunk_size": self.chunk_size,
+            "chunk_count": self.chunk_count,
+            "received_chunks": sorted(int(index) for index in self.received),
+            "complete": not self.missing_chunks(),
+            "sheet": self.sheet,
+            "created_at": self.created_at,
+        }
+
+
+def uploads_root(root: Path) -> Path:
+    return root / "uploads"
+
+
+def create_upload_session(
+    root: Path,
+    filename: str,
+    total_bytes: int,
+    chunk_size: int,
+    created_at: str,
+    sheet: str | None = None,
+) -> UploadSession:
+    if chunk_size < MIN_CHUNK_BYTES or chunk_size > MAX_CHUNK_BYTES:
+        raise UploadError(
+            status_code=422,
+            error="invalid_upload",
+            message="chunk_size is out of range.",
+            details={"min_chunk_size": MIN_CHUNK_BYTES, "max_chunk_size": MAX_CHUNK_BYTES},
+        )
+    session = UploadSession(
+        upload_id=f"upl_{uuid4().hex}",
+        filename=filename,
+        total_bytes=total_bytes,
+        chunk_size=chunk_size,
+        created_at=created_at,
+        sheet=sheet,
+    )
+    if session.chunk_count > MAX_CHUNKS:
+        raise UploadError(
+            status_code=422,
+            error="invalid_upload",
+            message="Too many chunks; use a larger chunk_size.",
+            details={"max_chunks": MAX_CHUNKS},
+        )
+    directory = _session_dir(root, session.upload_id)
+    directory.mkdir(parents=True)
+    with (directory / "data.part").open("wb") as data_file:
+        data_file.truncate(total_bytes)
+    _write_session(directory, session)
+    return session
+
+
+def load_upload_session(root: Path, upload_id: str) -> UploadSession:
+    if not _UPLOAD_ID.match(upload_id):
+        raise _not_found()
+    try:
+        raw = json.loads((_session_dir(root, upload_id) / "session.json").read_text("utf-8"))
+    except (FileNotFoundError, ValueError) as exc:
+        raise _not_found() from exc
+    return UploadSession(**raw)
+
+
+async def write_upload_chunk(
+    root: Path,
+    upload_id: str,
+    index: int,
+    checksum: str | None,
+    body: AsyncIterator[bytes],
+) -> UploadSession:
+    session = load_upload_session(root, upload_id)
+    if index < 0 or index >= session.chunk_count:
+        raise UploadError(
+            status_code=422,
+            error="invalid_chunk",
+            message="Chunk index is out of range.",
+            details={"index": index, "chunk_count": session.chunk_count},
+        )
+    checksum = (checksum or "").strip().lower()
+    if not _SHA256.match(checksum):
+        raise UploadError(
+            status_code=422,
+            error="invalid_chunk",
+            message="Chunk requires a hex SHA-256 checksum header.",
+            details={"index": index},
+        )
+
+    expected = session.chunk_length(index)
+    directory = _session_dir(root, upload_id)
+    temp_path = directory / f"chunk-{index}.{uuid4().hex}.tmp"
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with temp_path.open("wb") as temp_file:
+            async for part in body:
+                size += len(part)
+                if size > expected:
+                    break
+                digest.update(part)
+                temp_file.write(part)
+        if size != expected:
+            raise UploadError(
+                status_code=422,
+                error="invalid_chunk",
+                message="Chunk size does not match the upload session.",
+                details={"index": index, "expected_bytes": expected, "received_bytes": size},
+            )
+        if digest.hexdigest() != checksum:
+            raise UploadError(
+                status_code=422,
+                error="checksum_mismatch",
+                message="Chunk checksum does not match its contents.",
+                details={"index": index, "expected": checksum, "actual": digest.hexdigest()},
+            )
+        with file_lock(directory / ".lock"):
+            session = load_upload_session(root, upload_id)
+            with temp_path.open("rb") as chunk, (directory / "data.part").open("r+b") as data:
+                data.seek(index * session.chunk_size)
+                shutil.copyfileobj(chunk, data)
+            session.received[str(index)] = checksum
+            _write_session(directory, session)
+    finally:
+        temp_path.unlink(missing_ok=True)
+    return session
+
+
+def finish_upload(root: Path, upload_id: str, dest_path: Path) -> UploadSession:
+    directory = _session_dir(root, upload_id)
+    with file_lock(directory / ".lock"):
+        session = load_upload_session(root, upload_id)
+        missing = session.missing_chunks()
+        if missing:
+            raise UploadError(
+                status_code=409,
+                error="upload_incomplete",
+                message="Upload is missing chunks.",
+                details={"missing_chunks": missing[:100], "missing_count": len(missing)},
+            )
+        os.replace(directory / "data.part", dest_path)
+    discard_upload(root, upload_id)
+    return session
+
+
+def discard_upload(root: Path, upload_id: str) -> None:
+    if _UPLOAD_ID.match(upload_id):
+        shutil.rmtree(_session_dir(root, upload_id), ignore_errors=True)
+
+
+def _session_dir(root: Path, upload_id: str) -> Path:
+    return uploads_root(root) / upload_id
+
+
+def _write_session(directory: Path, session: UploadSession) -> None:
+    path = directory / "session.json"
+    temp_path = path.with_suffix(f".{uuid4().hex}.tmp")
+    temp_path.write_text(json.dumps(asdict(session)), encoding="utf-8")
+    os.replace(temp_path, path)
+
+
+def _not_found() -> UploadError:
+    return UploadError(
+        status_code=404,
+        error="upload_not_found",
+        message="Upload session not found.",
+        details={},
+    )
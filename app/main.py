@@ -1,39 +1,199 @@
+from dataclasses import asdict
 from datetime import datetime, timezone
+from pathlib import Path
+from typing import Awaitable, Callable
 from uuid import uuid4
 
+import asyncio
+import hashlib
 import json
-import shutil
+import os
 
-from fastapi import Body, FastAPI, File, Response, UploadFile, status
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi import (
+    Body,
+    FastAPI,
+    File,
+    Form,
+    Header,
+    Query,
+    Request,
+    Response,
+    UploadFile,
+    status,
+)
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from starlette.background import BackgroundTask
 
+from app.core.compression import JSONCompressionMiddleware
 from app.core.config import SETTINGS
-from app.core.job_store import JobState, clear_active_job, get_active_job, set_active_job
+from app.core.metrics import (
+    INGEST_CACHE_LOOKUPS,
+    ROWS_INGESTED,
+    MetricsMiddleware,
+    monitor_event_loop_lag,
+    record_validation,
+    render_metrics,
+)
+from app.core.job_store import (
+    JobState,
+    claim_active_job,
+    clear_active_job,
+    configure_job_store,
+    get_active_job,
+    set_active_job,
+)
+from app.core.locks import job_lock, locked_by_job
+from app.core.profiling import (
+    ProfilingConfig,
+    ProfilingMiddleware,
+    configure_profiling,
+    profiled,
+)
+from app.core.recovery import recover_jobs
+from app.core.responses import FastJSONResponse, RawJSONResponse
+from app.core.timing import (
+    ServerTimingMiddleware,
+    configure_timing,
+    stage_stats,
+    timed,
+)
 from app.core.storage import (
     create_job_dirs,
     ensure_storage_layout,
-    export_csv_path,
+    exports_dir,
+    history_dir,
     read_validation_issues,
+    read_validation_issues_bytes,
     read_job_metadata,
     remove_job_dirs,
     write_validation_issues,
     working_csv_path,
     write_job_metadata,
 )
-from app.edits.apply import apply_bulk_map, apply_single_edit
-from app.ingest.ingest import IngestError, ingest_file
+from app.core.sweeper import run_storage_sweeper
+from app.core.versioning import (
+    bump_dataset_version,
+    dataset_etag,
+    dataset_version,
+    etag_matches,
+)
+from app.edits.apply import (
+    CellChange,
+    apply_bulk_map,
+    apply_cell_values,
+    apply_single_edit,
+)
+from app.edits.history import (
+    cells_changed_since,
+    log_version_cells,
+    move_cursor,
+    record_operation,
+    redo_entry,
+    undo_entry,
+)
+from app.edits.preview import preview_bulk_map
+from app.edits.transforms import TransformError, apply_pipeline, compile_pipeline
+from app.exports.export import (
+    RangeNotSatisfiable,
+    accepts_encoding,
+    file_etag,
+    iter_file_range,
+    open_gzip_export,
+    parse_range,
+)
+from app.exports.formats import (
+    EXPORT_FORMATS,
+    ISSUE_SCOPES,
+    iter_csv_export,
+    iter_export_rows,
+    iter_ndjson_export,
+    iter_temp_file,
+    write_xlsx_export,
+)
+from app.ingest.cache import (
+    CachedIngest,
+    file_sha256,
+    ingest_cache_key,
+    load_cached_ingest,
+    store_cached_ingest,
+)
+from app.ingest.ingest import IngestError, append_file, ingest_file, upload_suffix
+from app.ingest.uploads import (
+    DEFAULT_CHUNK_BYTES,
+    UploadError,
+    create_upload_session,
+    discard_upload,
+    finish_upload,
+    load_upload_session,
+    write_upload_chunk,
+)
+from app.rows.profile import (
+    DatasetProfile,
+    get_profile,
+    load_profile,
+    write_profile,
+)
 from app.rows.reader import RowFilter, read_rows_page
-from app.validation.validate import validate_working_csv
+from app.validation.validate import (
+    ValidationResult,
+    extend_validation,
+    revalidate_cells,
+    validate_working_csv,
+)
 
 
 app = FastAPI(title="Databuddy HR API", version="0.1.0")
-MAX_BYTES = 10_000_000
-MAX_ROWS = 50_000
+app.add_middleware(JSONCompressionMiddleware, minimum_size=SETTINGS.compress_min_bytes)
+app.add_middleware(ServerTimingMiddleware)
+app.add_middleware(MetricsMiddleware)
+app.add_middleware(ProfilingMiddleware)
+configure_profiling(
+    ProfilingConfig(
+        enabled=SETTINGS.profiling_enabled,
+        slow_ms=SETTINGS.profile_slow_ms,
+        sample_rate=SETTINGS.profile_sample_rate,
+        max_per_minute=SETTINGS.profile_max_per_minute,
+        storage_root=SETTINGS.storage_root,
+    )
+)
+configure_timing(SETTINGS.timing_enabled)
+configure_job_store(SETTINGS.storage_root)
+MAX_BYTES = SETTINGS.max_bytes
+MAX_ROWS = SETTINGS.max_rows
+MAX_DECOMPRESSED_BYTES = SETTINGS.max_decompressed_bytes
+MAX_CONFLICTS_REPORTED = 100
+
+
+_background_tasks: set[asyncio.Task] = set()
 
 
 @app.on_event("startup")
 def startup() -> None:
     ensure_storage_layout(SETTINGS.storage_root)
+    recover_jobs(SETTINGS.storage_root)
+
+
+@app.on_event("startup")
+async def start_background_tasks() -> None:
+    _background_tasks.add(asyncio.create_task(monitor_event_loop_lag()))
+    if SETTINGS.sweep_interval_seconds > 0:
+        _background_tasks.add(
+            asyncio.create_task(
+                run_storage_sweeper(
+                    SETTINGS.storage_root,
+                    SETTINGS.sweep_interval_seconds,
+                    SETTINGS.job_ttl_seconds,
+                    SETTINGS.storage_quota_bytes,
+                )
+            )
+        )
+
+
+@app.on_event("shutdown")
+async def stop_background_tasks() -> None:
+    for task in _background_tasks:
+        task.cancel()
+    _background_tasks.clear()
 
 
 @app.get("/api/health")
@@ -41,105 +201,460 @@ def health() -> dict[str, str]:
     return {"status": "ok"}
 
 
+@app.get("/metrics", response_class=PlainTextResponse)
+def metrics() -> PlainTextResponse:
+    return PlainTextResponse(
+        render_metrics(SETTINGS.storage_root),
+        media_type="text/plain; version=0.0.4",
+    )
+
+
+@app.get("/api/timings")
+def timings() -> dict[str, object]:
+    return {"enabled": SETTINGS.timing_enabled, "stages": stage_stats()}
+
+
 def _utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
 
-async def _save_upload(file: UploadFile, dest_path, max_bytes: int) -> int:
+def _format_megabytes(max_bytes: int) -> str:
+    return f"{max_bytes / 1_000_000:g} MB"
+
+
+async def _save_upload(file: UploadFile, dest_path, max_bytes: int) -> tuple[int, str]:
     size = 0
     chunk_size = 1024 * 1024
-    with dest_path.open("wb") as out_file:
+    digest = hashlib.sha256()
+    with timed("upload_save") as span, dest_path.open("wb") as out_file:
         while True:
             chunk = await file.read(chunk_size)
             if not chunk:
                 break
             size += len(chunk)
+            span.bytes = size
             if size > max_bytes:
-                return size
+                return size, ""
+            digest.update(chunk)
             out_file.write(chunk)
-    return size
+    return size, digest.hexdigest()
 
 
 @app.post("/api/jobs", status_code=status.HTTP_201_CREATED)
-async def create_job(file: UploadFile = File(...)) -> JSONResponse:
+async def create_job(
+    file: UploadFile = File(...), sheet: str | None = Form(default=None)
+) -> FastJSONResponse:
     if get_active_job() is not None:
-        return JSONResponse(
-            status_code=status.HTTP_409_CONFLICT,
-            content={
-                "error": "job_active",
-                "message": "An import job is already active. Delete the current job before uploading a new file.",
-                "details": {},
-            },
-        )
+        return _job_active()
 
     filename = file.filename or ""
-    if not filename.lower().endswith((".csv", ".xlsx")):
-        return JSONResponse(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            content={
-                "error": "unsupported_file",
-                "message": "Upload rejected: unsupported file type.",
-                "details": {},
-            },
-        )
+    if not _supported_upload(filename):
+        return _unsupported_file()
+
+    async def save(original_path: Path) -> tuple[int, str]:
+        return await _save_upload(file, original_path, MAX_BYTES)
+
+    return await _start_job(filename, save, sheet or None)
 
+
+async def _start_job(
+    filename: str,
+    save: Callable[[Path], Awaitable[tuple[int, str]]],
+    sheet: str | None = None,
+) -> FastJSONResponse:
     job_id = f"job_{uuid4().hex}"
+    pending = JobState(
+        job_id=job_id,
+        status="ingesting",
+        created_at=_utc_now_iso(),
+        schema_version="v1",
+        limits={
+            "max_rows": MAX_ROWS,
+            "max_bytes": MAX_BYTES,
+            "max_decompressed_bytes": MAX_DECOMPRESSED_BYTES,
+        },
+        dataset=None,
+        validation=None,
+        issues=[],
+    )
+    if not claim_active_job(pending):
+        return _job_active()
+    try:
+        with job_lock(SETTINGS.storage_root, job_id, create=True):
+            return await _create_job(save, filename, pending, sheet)
+    except BaseException:
+        remove_job_dirs(SETTINGS.storage_root, job_id)
+        clear_active_job(job_id)
+        raise
+
+
+async def _create_job(
+    save: Callable[[Path], Awaitable[tuple[int, str]]],
+    filename: str,
+    pending: JobState,
+    sheet: str | None,
+) -> FastJSONResponse:
+    job_id = pending.job_id
     paths = create_job_dirs(SETTINGS.storage_root, job_id)
     original_path = paths["original"] / filename
 
-    received_bytes = await _save_upload(file, original_path, MAX_BYTES)
+    try:
+        received_bytes, content_hash = await save(original_path)
+    except UploadError as exc:
+        remove_job_dirs(SETTINGS.storage_root, job_id)
+        clear_active_job(job_id)
+        return _upload_error(exc)
     if received_bytes > MAX_BYTES:
         original_path.unlink(missing_ok=True)
         remove_job_dirs(SETTINGS.storage_root, job_id)
-        return JSONResponse(
-            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-            content={
-                "error": "upload_rejected",
-                "message": "Upload rejected: file exceeds the 10 MB limit.",
-                "details": {
-                    "reason": "file_too_large",
-                    "max_bytes": MAX_BYTES,
-                    "received_bytes": received_bytes,
+        clear_active_job(job_id)
+        return _file_too_large(received_bytes)
+
+    working_path = paths["working"] / "working.csv"
+    cache_key = ingest_cache_key(
+        content_hash, upload_suffix(filename) or "", pending.schema_version, sheet
+    )
+    ingested = None
+    if SETTINGS.ingest_cache_bytes > 0:
+        ingested = await asyncio.to_thread(
+            load_cached_ingest, SETTINGS.storage_root, cache_key, working_path.parent, MAX_ROWS
+        )
+        INGEST_CACHE_LOOKUPS.inc(1, "miss" if ingested is None else "hit")
+    if ingested is None:
+        try:
+            dataset = await asyncio.to_thread(
+                ingest_file,
+                original_path,
+                working_path,
+                MAX_ROWS,
+                MAX_DECOMPRESSED_BYTES,
+                sheet,
+            )
+        except IngestError as exc:
+            remove_job_dirs(SETTINGS.storage_root, job_id)
+            clear_active_job(job_id)
+            return FastJSONResponse(
+                status_code=exc.status_code,
+                content={
+                    "error": exc.error,
+                    "message": exc.message,
+                    "details": exc.details,
                 },
+            )
+
+        ROWS_INGESTED.inc(dataset["total_rows"])
+        validation_result = await asyncio.to_thread(validate_working_csv, working_path)
+        record_validation(validation_result.row_count, validation_result.issues)
+        ingested = CachedIngest(
+            dataset=dataset,
+            validation=validation_result.summary,
+            issues=validation_result.issues,
+        )
+        if SETTINGS.ingest_cache_bytes > 0:
+            await asyncio.to_thread(
+                store_cached_ingest,
+                SETTINGS.storage_root,
+                cache_key,
+                working_path.parent,
+                ingested,
+                SETTINGS.ingest_cache_bytes,
+            )
+
+    state = JobState(
+        job_id=job_id,
+        status="ready",
+        created_at=pending.created_at,
+        schema_version=pending.schema_version,
+        limits=pending.limits,
+        dataset=ingested.dataset,
+        validation=ingested.validation,
+        issues=ingested.issues,
+    )
+    write_validation_issues(SETTINGS.storage_root, job_id, ingested.issues)
+    write_job_metadata(SETTINGS.storage_root, job_id, _job_metadata(state))
+    set_active_job(state)
+    return FastJSONResponse(
+        status_code=status.HTTP_201_CREATED,
+        content=state.__dict__,
+        headers={"ETag": dataset_etag(job_id, state.dataset_version)},
+    )
+
+
+def _supported_upload(filename: str) -> bool:
+    return upload_suffix(filename) is not None
+
+
+def _unsupported_file() -> FastJSONResponse:
+    return FastJSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        content={
+            "error": "unsupported_file",
+            "message": "Upload rejected: unsupported file type.",
+            "details": {},
+        },
+    )
+
+
+def _file_too_large(received_bytes: int) -> FastJSONResponse:
+    return FastJSONResponse(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        content={
+            "error": "upload_rejected",
+            "message": f"Upload rejected: file exceeds the {_format_megabytes(MAX_BYTES)} limit.",
+            "details": {
+                "reason": "file_too_large",
+                "max_bytes": MAX_BYTES,
+                "received_bytes": received_bytes,
             },
+        },
+    )
+
+
+@app.post("/api/uploads", status_code=status.HTTP_201_CREATED)
+def create_upload(payload: dict = Body(...)) -> FastJSONResponse:
+    filename = payload.get("filename")
+    total_bytes = payload.get("total_bytes")
+    chunk_size = payload.get("chunk_size", DEFAULT_CHUNK_BYTES)
+    sheet = payload.get("sheet")
+    if not isinstance(filename, str) or not _supported_upload(filename):
+        return _unsupported_file()
+    if sheet is not None and not isinstance(sheet, str):
+        return _upload_error(UploadError(422, "invalid_upload", "sheet must be a string.", {}))
+    if Path(filename).name != filename:
+        return _upload_error(
+            UploadError(422, "invalid_upload", "filename must not contain a path.", {})
+        )
+    for field, value in (("total_bytes", total_bytes), ("chunk_size", chunk_size)):
+        if isinstance(value, bool) or not isinstance(value, int) or value <= 0:
+            return _upload_error(
+                UploadError(
+                    422, "invalid_upload", f"{field} must be a positive integer.", {"field": field}
+                )
+            )
+    if total_bytes > MAX_BYTES:
+        return _file_too_large(total_bytes)
+    try:
+        session = create_upload_session(
+            SETTINGS.storage_root, filename, total_bytes, chunk_size, _utc_now_iso(), sheet or None
+        )
+    except UploadError as exc:
+        return _upload_error(exc)
+    return FastJSONResponse(status_code=status.HTTP_201_CREATED, content=session.summary())
+
+
+@app.get("/api/uploads/{upload_id}")
+def get_upload(upload_id: str) -> FastJSONResponse:
+    try:
+        session = load_upload_session(SETTINGS.storage_root, upload_id)
+    except UploadError as exc:
+        return _upload_error(exc)
+    return FastJSONResponse(status_code=status.HTTP_200_OK, content=session.summary())
+
+
+@app.put("/api/uploads/{upload_id}/chunks/{index}")
+async def put_upload_chunk(
+    upload_id: str,
+    index: int,
+    request: Request,
+    x_chunk_sha256: str | None = Header(default=None),
+) -> FastJSONResponse:
+    try:
+        with timed("upload_chunk") as span:
+            session = await write_upload_chunk(
+                SETTINGS.storage_root, upload_id, index, x_chunk_sha256, request.stream()
+            )
+            span.bytes = session.chunk_length(index)
+    except UploadError as exc:
+        return _upload_error(exc)
+    return FastJSONResponse(status_code=status.HTTP_200_OK, content=session.summary())
+
+
+@app.post("/api/uploads/{upload_id}/complete", status_code=status.HTTP_201_CREATED)
+async def complete_upload(upload_id: str) -> FastJSONResponse:
+    try:
+        session = load_upload_session(SETTINGS.storage_root, upload_id)
+    except UploadError as exc:
+        return _upload_error(exc)
+    missing = session.missing_chunks()
+    if missing:
+        return _upload_error(
+            UploadError(
+                409,
+                "upload_incomplete",
+                "Upload is missing chunks.",
+                {"missing_chunks": missing[:100], "missing_count": len(missing)},
+            )
+        )
+    if get_active_job() is not None:
+        return _job_active()
+
+    async def save(original_path: Path) -> tuple[int, str]:
+        session = await asyncio.to_thread(
+            finish_upload, SETTINGS.storage_root, upload_id, original_path
+        )
+        return session.total_bytes, await asyncio.to_thread(file_sha256, original_path)
+
+    return await _start_job(session.filename, save, session.sheet)
+
+
+@app.delete("/api/uploads/{upload_id}")
+def delete_upload(upload_id: str) -> Response:
+    try:
+        load_upload_session(SETTINGS.storage_root, upload_id)
+    except UploadError as exc:
+        return _upload_error(exc)
+    discard_upload(SETTINGS.storage_root, upload_id)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+def _upload_error(exc: UploadError) -> FastJSONResponse:
+    return FastJSONResponse(
+        status_code=exc.status_code,
+        content={"error": exc.error, "message": exc.message, "details": exc.details},
+    )
+
+
+@app.post("/api/jobs/{job_id}/append")
+async def append_to_job(
+    job_id: str,
+    file: UploadFile = File(...),
+    sheet: str | None = Form(default=None),
+    if_match: str | None = Header(default=None),
+) -> FastJSONResponse:
+    if read_job_metadata(SETTINGS.storage_root, job_id) is None:
+        return _job_not_found()
+    filename = Path(file.filename or "").name
+    if not _supported_upload(filename):
+        return _unsupported_file()
+
+    original_dir = SETTINGS.storage_root / "jobs" / job_id / "original"
+    staged_path = original_dir / f".{uuid4().hex}.tmp"
+    try:
+        received_bytes, _ = await _save_upload(file, staged_path, MAX_BYTES)
+        if received_bytes > MAX_BYTES:
+            return _file_too_large(received_bytes)
+        return await asyncio.to_thread(
+            _append_to_job,
+            job_id=job_id,
+            staged_path=staged_path,
+            filename=filename,
+            sheet=sheet or None,
+            if_match=if_match,
         )
+    finally:
+        staged_path.unlink(missing_ok=True)
+
 
+@locked_by_job(SETTINGS.storage_root)
+def _append_to_job(
+    job_id: str, staged_path: Path, filename: str, sheet: str | None, if_match: str | None
+) -> FastJSONResponse:
+    metadata = read_job_metadata(SETTINGS.storage_root, job_id)
+    if metadata is None:
+        return _job_not_found()
+    etag = dataset_etag(job_id, dataset_version(metadata))
+    if if_match is not None and not etag_matches(if_match, etag):
+        return _precondition_failed(job_id, metadata)
+    original_path = staged_path.with_name(f"{dataset_version(metadata) + 1:04d}-{filename}")
+    os.replace(staged_path, original_path)
+
+    dataset = metadata["dataset"]
+    working_path = working_csv_path(SETTINGS.storage_root, job_id)
     try:
-        dataset = ingest_file(original_path, paths["working"] / "working.csv", MAX_ROWS)
+        appended = append_file(
+            original_path,
+            working_path,
+            dataset["canonical_columns"],
+            MAX_ROWS,
+            MAX_DECOMPRESSED_BYTES,
+            sheet,
+        )
     except IngestError as exc:
-        remove_job_dirs(SETTINGS.storage_root, job_id)
-        return JSONResponse(
+        original_path.unlink(missing_ok=True)
+        return FastJSONResponse(
             status_code=exc.status_code,
-            content={
-                "error": exc.error,
-                "message": exc.message,
-                "details": exc.details,
-            },
+            content={"error": exc.error, "message": exc.message, "details": exc.details},
         )
 
-    validation_result = validate_working_csv(paths["working"] / "working.csv")
-
-    state = JobState(
-        job_id=job_id,
-        status="ready",
-        created_at=_utc_now_iso(),
-        schema_version="v1",
-        limits={"max_rows": MAX_ROWS, "max_bytes": MAX_BYTES},
-        dataset=dataset,
-        validation=validation_result.summary,
-        issues=validation_result.issues,
+    ROWS_INGESTED.inc(appended.rows_appended)
+    existing_rows = dataset["total_rows"]
+    new_rows = validate_working_csv(working_path, appended.start_offset, existing_rows + 1)
+    record_validation(new_rows.row_count, new_rows.issues)
+    validation_result = extend_validation(
+        read_validation_issues(SETTINGS.storage_root, job_id) or [], new_rows
     )
-    set_active_job(state)
+    dataset["total_rows"] = existing_rows + appended.rows_appended
+    dataset["unknown_columns"] = list(
+        dict.fromkeys([*dataset["unknown_columns"], *appended.unknown_columns])
+    )
+    if appended.sheets:
+        dataset["sheets"] = [
+            *dataset.get("sheets", []),
+            *(
+                {**asdict(item), "first_row_number": item.first_row_number + existing_rows}
+                for item in appended.sheets
+            ),
+        ]
+    metadata["validation"] = validation_result.summary
+    version = bump_dataset_version(metadata)
+    log_version_cells(history_dir(SETTINGS.storage_root, job_id), version, [])
     write_validation_issues(SETTINGS.storage_root, job_id, validation_result.issues)
-    write_job_metadata(SETTINGS.storage_root, job_id, state.__dict__)
-    return JSONResponse(status_code=status.HTTP_201_CREATED, content=state.__dict__)
+    write_job_metadata(SETTINGS.storage_root, job_id, metadata)
+    return FastJSONResponse(
+        status_code=status.HTTP_200_OK,
+        content={
+            "dataset": dataset,
+            "validation": validation_result.summary,
+            "issues": validation_result.issues,
+            "appended": {
+                "file": filename,
+                "rows": appended.rows_appended,
+                "first_row_number": existing_rows + 1,
+                "unknown_columns": appended.unknown_columns,
+                "missing_columns": appended.missing_columns,
+                "sheets": [asdict(item) for item in appended.sheets],
+            },
+            "dataset_version": version,
+        },
+        headers={"ETag": dataset_etag(job_id, version)},
+    )
+
+
+def _job_not_found() -> FastJSONResponse:
+    return FastJSONResponse(
+        status_code=status.HTTP_404_NOT_FOUND,
+        content={
+            "error": "job_not_found",
+            "message": "Job not found.",
+            "details": {},
+        },
+    )
+
+
+def _job_active() -> FastJSONResponse:
+    return FastJSONResponse(
+        status_code=status.HTTP_409_CONFLICT,
+        content={
+            "error": "job_active",
+            "message": "An import job is already active. Delete the current job before uploading a new file.",
+            "details": {},
+        },
+    )
 
 
-@app.get("/api/jobs/{job_id}")
-def get_job(job_id: str) -> JSONResponse:
+def _job_metadata(state: JobState) -> dict[str, object]:
+    metadata = dict(state.__dict__)
+    metadata.pop("issues", None)
+    return metadata
+
+
+@app.get("/api/jobs/{job_id}", response_model=None)
+def get_job(
+    job_id: str, if_none_match: str | None = Header(default=None)
+) -> Response:
     metadata = read_job_metadata(SETTINGS.storage_root, job_id)
     if metadata is None:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_404_NOT_FOUND,
             content={
                 "error": "job_not_found",
@@ -147,17 +662,24 @@ def get_job(job_id: str) -> JSONResponse:
                 "details": {},
             },
         )
+    etag = dataset_etag(job_id, dataset_version(metadata))
+    if etag_matches(if_none_match, etag):
+        return _not_modified(etag)
     issues = read_validation_issues(SETTINGS.storage_root, job_id)
     if issues is not None:
         metadata["issues"] = issues
-    return JSONResponse(status_code=status.HTTP_200_OK, content=metadata)
+    return FastJSONResponse(
+        status_code=status.HTTP_200_OK, content=metadata, headers={"ETag": etag}
+    )
 
 
-@app.get("/api/jobs/{job_id}/issues")
-def get_job_issues(job_id: str) -> JSONResponse:
+@app.get("/api/jobs/{job_id}/issues", response_model=None)
+def get_job_issues(
+    job_id: str, if_none_match: str | None = Header(default=None)
+) -> Response:
     metadata = read_job_metadata(SETTINGS.storage_root, job_id)
     if metadata is None:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_404_NOT_FOUND,
             content={
                 "error": "job_not_found",
@@ -165,19 +687,26 @@ def get_job_issues(job_id: str) -> JSONResponse:
                 "details": {},
             },
         )
-    issues = read_validation_issues(SETTINGS.storage_root, job_id) or []
-    return JSONResponse(status_code=status.HTTP_200_OK, content=issues)
+    etag = dataset_etag(job_id, dataset_version(metadata))
+    if etag_matches(if_none_match, etag):
+        return _not_modified(etag)
+    issues_body = read_validation_issues_bytes(SETTINGS.storage_root, job_id) or b"[]"
+    return RawJSONResponse(
+        status_code=status.HTTP_200_OK, content=issues_body, headers={"ETag": etag}
+    )
 
 
-@app.get("/api/jobs/{job_id}/rows")
+@app.get("/api/jobs/{job_id}/rows", response_model=None)
+@profiled
 def get_job_rows(
     job_id: str,
     offset: int,
     limit: int,
     filters: str | None = None,
-) -> JSONResponse:
+    if_none_match: str | None = Header(default=None),
+) -> Response:
     if offset < 0 or limit <= 0:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             content={
                 "error": "invalid_pagination",
@@ -187,7 +716,7 @@ def get_job_rows(
         )
     metadata = read_job_metadata(SETTINGS.storage_root, job_id)
     if metadata is None:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_404_NOT_FOUND,
             content={
                 "error": "job_not_found",
@@ -197,7 +726,7 @@ def get_job_rows(
         )
     working_path = working_csv_path(SETTINGS.storage_root, job_id)
     if not working_path.exists():
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_404_NOT_FOUND,
             content={
                 "error": "job_not_found",
@@ -209,7 +738,7 @@ def get_job_rows(
     canonical_columns = list(dataset.get("canonical_columns") or [])
     filter_items = _parse_filters(filters, canonical_columns)
     if filter_items is None:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             content={
                 "error": "invalid_filters",
@@ -217,10 +746,23 @@ def get_job_rows(
                 "details": {},
             },
         )
-    rows, total_filtered = read_rows_page(
-        working_path, canonical_columns, offset, limit, filter_items
-    )
-    return JSONResponse(
+    etag = dataset_etag(job_id, dataset_version(metadata))
+    if etag_matches(if_none_match, etag):
+        return _not_modified(etag)
+    try:
+        rows, total_filtered = read_rows_page(
+            working_path, canonical_columns, offset, limit, filter_items
+        )
+    except FileNotFoundError:
+        return FastJSONResponse(
+            status_code=status.HTTP_404_NOT_FOUND,
+            content={
+                "error": "job_not_found",
+                "message": "Job not found.",
+                "details": {},
+            },
+        )
+    return FastJSONResponse(
         status_code=status.HTTP_200_OK,
         content={
             "offset": offset,
@@ -229,14 +771,72 @@ def get_job_rows(
             "total_filtered": total_filtered,
             "rows": rows,
         },
+        headers={"ETag": etag},
+    )
+
+
+@app.get("/api/jobs/{job_id}/facets", response_model=None)
+def get_job_facets(
+    job_id: str,
+    columns: str | None = None,
+    top: int = Query(default=10, ge=1, le=100),
+    if_none_match: str | None = Header(default=None),
+) -> Response:
+    metadata = read_job_metadata(SETTINGS.storage_root, job_id)
+    working_path = working_csv_path(SETTINGS.storage_root, job_id)
+    if metadata is None or not working_path.exists():
+        return FastJSONResponse(
+            status_code=status.HTTP_404_NOT_FOUND,
+            content={
+                "error": "job_not_found",
+                "message": "Job not found.",
+                "details": {},
+            },
+        )
+    dataset = metadata.get("dataset") or {}
+    canonical_columns = list(dataset.get("canonical_columns") or [])
+    requested = canonical_columns
+    if columns:
+        requested = [name.strip() for name in columns.split(",") if name.strip()]
+        unknown = [name for name in requested if name not in canonical_columns]
+        if unknown:
+            return FastJSONResponse(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                content={
+                    "error": "invalid_columns",
+                    "message": "Unknown facet columns.",
+                    "details": {"columns": unknown},
+                },
+            )
+    version = dataset_version(metadata)
+    etag = dataset_etag(job_id, version)
+    if etag_matches(if_none_match, etag):
+        return _not_modified(etag)
+    with timed("facets"):
+        profile = get_profile(working_path)
+        facets = profile.summary(requested, top)
+    return FastJSONResponse(
+        status_code=status.HTTP_200_OK,
+        content={
+            "total_rows": profile.total_rows,
+            "dataset_version": version,
+            "columns": facets,
+        },
+        headers={"ETag": etag},
     )
 
 
 @app.post("/api/jobs/{job_id}/edits")
-def apply_edit(job_id: str, payload: dict = Body(...)) -> JSONResponse:
+@profiled
+@locked_by_job(SETTINGS.storage_root)
+def apply_edit(
+    job_id: str,
+    payload: dict = Body(...),
+    if_match: str | None = Header(default=None),
+) -> FastJSONResponse:
     metadata = read_job_metadata(SETTINGS.storage_root, job_id)
     if metadata is None:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_404_NOT_FOUND,
             content={
                 "error": "job_not_found",
@@ -244,6 +844,10 @@ def apply_edit(job_id: str, payload: dict = Body(...)) -> JSONResponse:
                 "details": {},
             },
         )
+    if if_match is not None and not etag_matches(
+        if_match, dataset_etag(job_id, dataset_version(metadata))
+    ):
+        return _precondition_failed(job_id, metadata)
     edits = payload.get("edits") if isinstance(payload, dict) else None
     if not isinstance(edits, list) or len(edits) != 1:
         return _invalid_edit("Edit rejected: invalid payload.", {})
@@ -253,8 +857,13 @@ def apply_edit(job_id: str, payload: dict = Body(...)) -> JSONResponse:
     row_id = edit.get("row_id")
     column = edit.get("column")
     value = edit.get("value")
-    if not row_id or not column:
+    if not row_id or not column or not isinstance(column, str):
         return _invalid_edit("Edit rejected: invalid payload.", {})
+    if not isinstance(row_id, str):
+        return _invalid_edit("Edit rejected: unknown row_id.", {"row_id": row_id})
+    base_version = payload.get("base_version")
+    if base_version is not None and not _valid_version(base_version):
+        return _invalid_edit("Edit rejected: invalid base_version.", {})
 
     dataset = metadata.get("dataset") or {}
     canonical_columns = list(dataset.get("canonical_columns") or [])
@@ -265,7 +874,7 @@ def apply_edit(job_id: str, payload: dict = Body(...)) -> JSONResponse:
 
     working_path = working_csv_path(SETTINGS.storage_root, job_id)
     if not working_path.exists():
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_404_NOT_FOUND,
             content={
                 "error": "job_not_found",
@@ -274,29 +883,151 @@ def apply_edit(job_id: str, payload: dict = Body(...)) -> JSONResponse:
             },
         )
 
-    updated = apply_single_edit(working_path, row_id, column, value)
-    if not updated:
+    if base_version is not None:
+        changed = _cells_changed_since(job_id, metadata, base_version)
+        if changed is None:
+            return _precondition_failed(job_id, metadata)
+        if (row_id, column) in changed:
+            return _edit_conflict(job_id, metadata, base_version, [(row_id, column)])
+
+    profile = load_profile(working_path)
+    change = apply_single_edit(working_path, row_id, column, value)
+    if change is None:
         return _invalid_edit(
             "Edit rejected: unknown row_id.",
             {"row_id": row_id},
         )
+    record_operation(history_dir(SETTINGS.storage_root, job_id), "edit", [change])
+    return _commit_changes(job_id, metadata, working_path, profile, [change])
+
 
-    validation_result = validate_working_csv(working_path)
+def _commit_changes(
+    job_id: str,
+    metadata: dict[str, object],
+    working_path,
+    profile: DatasetProfile | None,
+    changes: list[CellChange],
+    extra: dict[str, object] | None = None,
+) -> FastJSONResponse:
+    _update_profile(working_path, profile, changes)
+    validation_result = _revalidate_changes(job_id, working_path, changes)
     metadata["validation"] = validation_result.summary
-    metadata["issues"] = validation_result.issues
+    version = bump_dataset_version(metadata)
+    log_version_cells(history_dir(SETTINGS.storage_root, job_id), version, changes)
     write_validation_issues(SETTINGS.storage_root, job_id, validation_result.issues)
     write_job_metadata(SETTINGS.storage_root, job_id, metadata)
-    return JSONResponse(
+    return FastJSONResponse(
         status_code=status.HTTP_200_OK,
         content={
             "validation": validation_result.summary,
             "issues": validation_result.issues,
+            **(extra or {}),
+            "dataset_version": version,
+        },
+        headers={"ETag": dataset_etag(job_id, version)},
+    )
+
+
+def _valid_version(value: object) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool) and value >= 1
+
+
+def _cells_changed_since(
+    job_id: str, metadata: dict[str, object], base_version: int
+) -> set[tuple[str, str]] | None:
+    return cells_changed_since(
+        history_dir(SETTINGS.storage_root, job_id), base_version, dataset_version(metadata)
+    )
+
+
+def _merge_conflict(
+    job_id: str,
+    metadata: dict[str, object],
+    base_version: int | None,
+    planned_changes: Callable[[], list[CellChange]],
+) -> FastJSONResponse | None:
+    if base_version is None or base_version >= dataset_version(metadata):
+        return None
+    changed = _cells_changed_since(job_id, metadata, base_version)
+    if not changed:
+        return None
+    conflicts = [
+        (change.row_id, change.column)
+        for change in planned_changes()
+        if (change.row_id, change.column) in changed
+    ]
+    if not conflicts:
+        return None
+    return _edit_conflict(job_id, metadata, base_version, conflicts)
+
+
+def _edit_conflict(
+    job_id: str,
+    metadata: dict[str, object],
+    base_version: int,
+    cells: list[tuple[str, str]],
+) -> FastJSONResponse:
+    version = dataset_version(metadata)
+    return FastJSONResponse(
+        status_code=status.HTTP_409_CONFLICT,
+        content={
+            "error": "edit_conflict",
+            "message": "Another change modified the same cells. Refresh and retry.",
+            "details": {
+                "base_version": base_version,
+                "dataset_version": version,
+                "conflicts": [
+                    {"row_id": row_id, "column": column}
+                    for row_id, column in cells[:MAX_CONFLICTS_REPORTED]
+                ],
+                "conflict_count": len(cells),
+            },
+        },
+        headers={"ETag": dataset_etag(job_id, version)},
+    )
+
+
+def _revalidate_changes(
+    job_id: str, working_path, changes: list[CellChange]
+) -> ValidationResult:
+    issues = read_validation_issues(SETTINGS.storage_root, job_id)
+    if issues is None:
+        return validate_working_csv(working_path)
+    return revalidate_cells(
+        issues,
+        ((change.row_id, change.row_number, change.column, change.new) for change in changes),
+    )
+
+
+def _update_profile(
+    working_path, profile: DatasetProfile | None, changes: list[CellChange]
+) -> None:
+    if profile is None:
+        return
+    profile.apply_changes(changes)
+    profile.stamp(working_path.stat())
+    write_profile(working_path, profile)
+
+
+def _not_modified(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+
+def _precondition_failed(job_id: str, metadata: dict[str, object]) -> FastJSONResponse:
+    version = dataset_version(metadata)
+    return FastJSONResponse(
+        status_code=status.HTTP_412_PRECONDITION_FAILED,
+        content={
+            "error": "version_mismatch",
+            "message": "The dataset changed since it was loaded. Refresh and retry.",
+            "details": {"dataset_version": version},
         },
+        headers={"ETag": dataset_etag(job_id, version)},
     )
 
 
-def _invalid_edit(message: str, details: dict) -> JSONResponse:
-    return JSONResponse(
+def _invalid_edit(message: str, details: dict) -> FastJSONResponse:
+    return FastJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "error": "invalid_edit",
@@ -307,10 +1038,16 @@ def _invalid_edit(message: str, details: dict) -> JSONResponse:
 
 
 @app.post("/api/jobs/{job_id}/bulk")
-def apply_bulk(job_id: str, payload: dict = Body(...)) -> JSONResponse:
+@profiled
+@locked_by_job(SETTINGS.storage_root)
+def apply_bulk(
+    job_id: str,
+    payload: dict = Body(...),
+    if_match: str | None = Header(default=None),
+) -> FastJSONResponse:
     metadata = read_job_metadata(SETTINGS.storage_root, job_id)
     if metadata is None:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_404_NOT_FOUND,
             content={
                 "error": "job_not_found",
@@ -318,11 +1055,24 @@ def apply_bulk(job_id: str, payload: dict = Body(...)) -> JSONResponse:
                 "details": {},
             },
         )
+    if if_match is not None and not etag_matches(
+        if_match, dataset_etag(job_id, dataset_version(metadata))
+    ):
+        return _precondition_failed(job_id, metadata)
+
+    base_version = payload.get("base_version") if isinstance(payload, dict) else None
+    if base_version is not None:
+        if not _valid_version(base_version):
+            return _invalid_bulk("Bulk action rejected: invalid base_version.", {})
+        if _cells_changed_since(job_id, metadata, base_version) is None:
+            return _precondition_failed(job_id, metadata)
 
     action_type = payload.get("action_type") if isinstance(payload, dict) else None
+    if action_type == "pipeline":
+        return _apply_pipeline(job_id, metadata, payload, base_version)
     column = payload.get("column") if isinstance(payload, dict) else None
     params = payload.get("params") if isinstance(payload, dict) else None
-    apply_to = payload.get("apply_to") if isinstance(payload, dict) else "all"
+    apply_to = payload.get("apply_to", "all") if isinstance(payload, dict) else "all"
     case_insensitive = (
         payload.get("case_insensitive") if isinstance(payload, dict) else False
     )
@@ -355,7 +1105,85 @@ def apply_bulk(job_id: str, payload: dict = Body(...)) -> JSONResponse:
 
     working_path = working_csv_path(SETTINGS.storage_root, job_id)
     if not working_path.exists():
-        return JSONResponse(
+        return FastJSONResponse(
+            status_code=status.HTTP_404_NOT_FOUND,
+            content={
+                "error": "job_not_found",
+                "message": "Job not found.",
+                "details": {},
+            },
+        )
+
+    if payload.get("preview"):
+        preview = preview_bulk_map(
+            working_path,
+            column,
+            mapping,
+            default,
+            apply_to=apply_to,
+            error_rows=lambda: _error_rows(job_id, {column}),
+            case_insensitive=bool(case_insensitive),
+        )
+        return FastJSONResponse(
+            status_code=status.HTTP_200_OK,
+            content={
+                "preview": True,
+                "affected_rows": preview.affected_rows,
+                "keys": preview.key_rows,
+                "default_rows": preview.default_rows,
+                "samples": preview.samples,
+                "issues_resolved": preview.issues_resolved,
+                "issues_introduced": preview.issues_introduced,
+                "dataset_version": dataset_version(metadata),
+            },
+        )
+
+    error_rows = _error_rows(job_id, {column}) if apply_to == "errors" else None
+
+    def bulk_changes(dry_run: bool = False) -> list[CellChange]:
+        return apply_bulk_map(
+            working_path,
+            column,
+            mapping,
+            default,
+            apply_to=apply_to or "all",
+            error_rows=error_rows,
+            case_insensitive=bool(case_insensitive),
+            dry_run=dry_run,
+        )
+
+    conflict = _merge_conflict(
+        job_id, metadata, base_version, lambda: bulk_changes(dry_run=True)
+    )
+    if conflict is not None:
+        return conflict
+    profile = load_profile(working_path)
+    changes = bulk_changes()
+    record_operation(history_dir(SETTINGS.storage_root, job_id), "bulk", changes)
+    return _commit_changes(job_id, metadata, working_path, profile, changes)
+
+
+def _apply_pipeline(
+    job_id: str, metadata: dict[str, object], payload: dict, base_version: int | None
+) -> FastJSONResponse:
+    params = payload.get("params")
+    apply_to = payload.get("apply_to", "all")
+    dry_run = bool(payload.get("dry_run", False))
+    if not isinstance(params, dict):
+        return _invalid_bulk("Bulk action rejected: invalid payload.", {})
+    if apply_to not in {"all", "errors"}:
+        return _invalid_bulk("Bulk action rejected: invalid apply_to.", {})
+
+    dataset = metadata.get("dataset") or {}
+    canonical_columns = list(dataset.get("canonical_columns") or [])
+    try:
+        pipeline = compile_pipeline(params.get("steps"), canonical_columns)
+    except TransformError as exc:
+        return _invalid_bulk(str(exc), exc.details)
+
+    working_path = working_csv_path(SETTINGS.storage_root, job_id)
+    if not working_path.exists():
+        return FastJSONResponse(
             status_code=status.HTTP_404_NOT_FOUND,
             content={
                 "error": "job_not_found",
@@ -364,43 +1192,56 @@ def apply_bulk(job_id: str, payload: dict = Body(...)) -> JSONResponse:
             },
         )
 
-    error_rows: set[str] | None = None
+    error_rows = None
     if apply_to == "errors":
-        issues = read_validation_issues(SETTINGS.storage_root, job_id) or []
-        error_rows = {
-            issue_row
-            for issue in issues
-            if issue.get("severity") == "error"
-            and issue.get("column") == column
-            and (issue_row := issue.get("row_id"))
-        }
+        error_rows = _error_rows(job_id, {name for name, _ in pipeline.targets})
 
-    apply_bulk_map(
+    if dry_run:
+        result = apply_pipeline(working_path, pipeline, error_rows=error_rows, dry_run=True)
+        return FastJSONResponse(
+            status_code=status.HTTP_200_OK,
+            content={
+                "dry_run": True,
+                "affected_rows": result.affected_rows,
+                "changed_cells": len(result.changes),
+                "dataset_version": dataset_version(metadata),
+            },
+        )
+
+    conflict = _merge_conflict(
+        job_id,
+        metadata,
+        base_version,
+        lambda: apply_pipeline(working_path, pipeline, error_rows, dry_run=True).changes,
+    )
+    if conflict is not None:
+        return conflict
+    profile = load_profile(working_path)
+    result = apply_pipeline(working_path, pipeline, error_rows=error_rows)
+    record_operation(history_dir(SETTINGS.storage_root, job_id), "pipeline", result.changes)
+    return _commit_changes(
+        job_id,
+        metadata,
         working_path,
-        column,
-        mapping,
-        default,
-        apply_to=apply_to or "all",
-        error_rows=error_rows,
-        case_insensitive=bool(case_insensitive),
+        profile,
+        result.changes,
+        {"affected_rows": result.affected_rows},
     )
 
-    validation_result = validate_working_csv(working_path)
-    metadata["validation"] = validation_result.summary
-    metadata["issues"] = validation_result.issues
-    write_validation_issues(SETTINGS.storage_root, job_id, validation_result.issues)
-    write_job_metadata(SETTINGS.storage_root, job_id, metadata)
-    return JSONResponse(
-        status_code=status.HTTP_200_OK,
-        content={
-            "validation": validation_result.summary,
-            "issues": validation_result.issues,
-        },
-    )
+
+def _error_rows(job_id: str, columns: set[str]) -> set[str]:
+    issues = read_validation_issues(SETTINGS.storage_root, job_id) or []
+    return {
+        issue_row
+        for issue in issues
+        if issue.get("severity") == "error"
+        and issue.get("column") in columns
+        and (issue_row := issue.get("row_id"))
+    }
 
 
-def _invalid_bulk(message: str, details: dict) -> JSONResponse:
-    return JSONResponse(
+def _invalid_bulk(message: str, details: dict) -> FastJSONResponse:
+    return FastJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "error": "invalid_bulk",
@@ -438,11 +1279,89 @@ def _parse_filters(
     return filters
 
 
+@app.post("/api/jobs/{job_id}/undo")
+@profiled
+@locked_by_job(SETTINGS.storage_root)
+def undo(job_id: str, if_match: str | None = Header(default=None)) -> FastJSONResponse:
+    return _replay_history(job_id, if_match, redo=False)
+
+
+@app.post("/api/jobs/{job_id}/redo")
+@profiled
+@locked_by_job(SETTINGS.storage_root)
+def redo(job_id: str, if_match: str | None = Header(default=None)) -> FastJSONResponse:
+    return _replay_history(job_id, if_match, redo=True)
+
+
+def _replay_history(job_id: str, if_match: str | None, redo: bool) -> FastJSONResponse:
+    metadata = read_job_metadata(SETTINGS.storage_root, job_id)
+    working_path = working_csv_path(SETTINGS.storage_root, job_id)
+    if metadata is None or not working_path.exists():
+        return FastJSONResponse(
+            status_code=status.HTTP_404_NOT_FOUND,
+            content={
+                "error": "job_not_found",
+                "message": "Job not found.",
+                "details": {},
+            },
+        )
+    if if_match is not None and not etag_matches(
+        if_match, dataset_etag(job_id, dataset_version(metadata))
+    ):
+        return _precondition_failed(job_id, metadata)
+
+    job_history = history_dir(SETTINGS.storage_root, job_id)
+    entry = redo_entry(job_history) if redo else undo_entry(job_history)
+    if entry is None:
+        action = "redo" if redo else "undo"
+        return FastJSONResponse(
+            status_code=status.HTTP_409_CONFLICT,
+            content={
+                "error": f"nothing_to_{action}",
+                "message": f"There is nothing to {action}.",
+                "details": {},
+            },
+        )
+
+    cells = [
+        (change.row_id, change.row_number, change.column, change.new if redo else change.old)
+        for change in entry.changes
+    ]
+    profile = load_profile(working_path)
+    changes = apply_cell_values(working_path, cells)
+    state = move_cursor(job_history, entry.seq if redo else entry.seq - 1)
+    return _commit_changes(
+        job_id,
+        metadata,
+        working_path,
+        profile,
+        changes,
+        {
+            "history": {
+                "action": entry.action,
+                "cells": len(changes),
+                "can_undo": state.can_undo,
+                "can_redo": state.can_redo,
+            }
+        },
+    )
+
+
 @app.get("/api/jobs/{job_id}/export", response_model=None)
-def export_job(job_id: str) -> Response:
+@profiled
+def export_job(
+    job_id: str,
+    export_format: str = Query(default="csv", alias="format"),
+    filters: str | None = None,
+    issues: str = "all",
+    range_header: str | None = Header(default=None, alias="range"),
+    if_range: str | None = Header(default=None),
+    if_none_match: str | None = Header(default=None),
+    accept_encoding: str | None = Header(default=None),
+) -> Response:
     metadata = read_job_metadata(SETTINGS.storage_root, job_id)
     if metadata is None:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_404_NOT_FOUND,
             content={
                 "error": "job_not_found",
@@ -450,9 +1369,28 @@ def export_job(job_id: str) -> Response:
                 "details": {},
             },
         )
+    if export_format not in EXPORT_FORMATS:
+        return _invalid_export(
+            f"Export rejected: unsupported format '{export_format}'.",
+            {"format": export_format},
+        )
+    if issues not in ISSUE_SCOPES:
+        return _invalid_export("Export rejected: invalid issues scope.", {"issues": issues})
+    dataset = metadata.get("dataset") or {}
+    canonical_columns = list(dataset.get("canonical_columns") or [])
+    filter_items = _parse_filters(filters, canonical_columns)
+    if filter_items is None:
+        return FastJSONResponse(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            content={
+                "error": "invalid_filters",
+                "message": "Invalid filters.",
+                "details": {},
+            },
+        )
     working_path = working_csv_path(SETTINGS.storage_root, job_id)
     if not working_path.exists():
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_404_NOT_FOUND,
             content={
                 "error": "job_not_found",
@@ -460,21 +1398,129 @@ def export_job(job_id: str) -> Response:
                 "details": {},
             },
         )
-    export_path = export_csv_path(SETTINGS.storage_root, job_id)
-    export_path.parent.mkdir(parents=True, exist_ok=True)
-    shutil.copyfile(working_path, export_path)
-    return FileResponse(
-        export_path,
+
+    if export_format == "csv" and not filter_items and issues == "all":
+        return _export_working_file(
+            job_id, range_header, if_range, if_none_match, accept_encoding
+        )
+
+    issue_rows: set[str] | None = None
+    if issues != "all":
+        issue_rows = {
+            str(issue["row_id"])
+            for issue in read_validation_issues(SETTINGS.storage_root, job_id) or []
+            if issue.get("row_id")
+        }
+    rows = iter_export_rows(working_path, filter_items, issues, issue_rows)
+    columns = canonical_columns if export_format != "csv" else ["row_id", *canonical_columns]
+    media_type, filename = EXPORT_FORMATS[export_format]
+    headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
+    if export_format == "xlsx":
+        xlsx_path = write_xlsx_export(
+            rows, columns, exports_dir(SETTINGS.storage_root, job_id)
+        )
+        headers["Content-Length"] = str(xlsx_path.stat().st_size)
+        return StreamingResponse(
+            iter_temp_file(xlsx_path), media_type=media_type, headers=headers
+        )
+    if export_format == "ndjson":
+        return StreamingResponse(
+            iter_ndjson_export(rows, columns), media_type=media_type, headers=headers
+        )
+    return StreamingResponse(
+        iter_csv_export(rows, columns), media_type=media_type, headers=headers
+    )
+
+
+def _invalid_export(message: str, details: dict) -> FastJSONResponse:
+    return FastJSONResponse(
+        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        content={
+            "error": "invalid_export",
+            "message": message,
+            "details": details,
+        },
+    )
+
+
+def _export_working_file(
+    job_id: str,
+    range_header: str | None,
+    if_range: str | None,
+    if_none_match: str | None,
+    accept_encoding: str | None,
+) -> Response:
+    working_path = working_csv_path(SETTINGS.storage_root, job_id)
+    try:
+        handle = working_path.open("rb")
+    except FileNotFoundError:
+        return FastJSONResponse(
+            status_code=status.HTTP_404_NOT_FOUND,
+            content={
+                "error": "job_not_found",
+                "message": "Job not found.",
+                "details": {},
+            },
+        )
+
+    etag = file_etag(handle)
+    headers = {
+        "Accept-Ranges": "bytes",
+        "Vary": "Accept-Encoding",
+        "Content-Disposition": 'attachment; filename="databuddy_export.csv"',
+    }
+    if accepts_encoding(accept_encoding, "gzip"):
+        source = handle
+        with source:
+            handle = open_gzip_export(
+                source, exports_dir(SETTINGS.storage_root, job_id), etag
+            )
+        etag = file_etag(handle, "gzip")
+        headers["Content-Encoding"] = "gzip"
+    headers["ETag"] = etag
+
+    if etag_matches(if_none_match, etag):
+        handle.close()
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    size = os.fstat(handle.fileno()).st_size
+    byte_range = None
+    if if_range is None or etag_matches(if_range, etag):
+        try:
+            byte_range = parse_range(range_header, size)
+        except RangeNotSatisfiable:
+            handle.close()
+            headers["Content-Range"] = f"bytes */{size}"
+            return Response(
+                status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                headers=headers,
+            )
+
+    if byte_range is None:
+        headers["Content-Length"] = str(size)
+        return StreamingResponse(
+            iter_file_range(handle, 0, size),
+            media_type="text/csv",
+            headers=headers,
+            background=BackgroundTask(handle.close),
+        )
+    headers["Content-Length"] = str(byte_range.length)
+    headers["Content-Range"] = f"bytes {byte_range.start}-{byte_range.end}/{size}"
+    return StreamingResponse(
+        iter_file_range(handle, byte_range.start, byte_range.length),
+        status_code=status.HTTP_206_PARTIAL_CONTENT,
         media_type="text/csv",
-        filename="databuddy_export.csv",
+        headers=headers,
+        background=BackgroundTask(handle.close),
     )
 
 
 @app.delete("/api/jobs/{job_id}")
+@locked_by_job(SETTINGS.storage_root)
 def delete_job(job_id: str) -> Response:
     metadata = read_job_metadata(SETTINGS.storage_root, job_id)
     if metadata is None:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_404_NOT_FOUND,
             content={
                 "error": "job_not_found",
@@ -483,7 +1529,5 @@ def delete_job(job_id: str) -> Response:
             },
         )
     remove_job_dirs(SETTINGS.storage_root, job_id)
-    active = get_active_job()
-    if active and active.job_id == job_id:
-        clear_active_job()
+    clear_active_job(job_id)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
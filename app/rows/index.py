@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import csv
+import json
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import IO, BinaryIO, Iterator, TextIO
+from uuid import uuid4
+
+
+INDEX_STRIDE = 1000
+
+
+@dataclass
+class RowIndex:
+    stride: int
+    offsets: list[int]
+    total_rows: int
+    size: int
+    mtime_ns: int
+
+    def checkpoint(self, row_offset: int) -> tuple[int, int]:
+        slot = min(row_offset // self.stride, len(self.offsets) - 1)
+        return self.offsets[slot], row_offset - slot * self.stride
+
+
+class RowIndexBuilder:
+    def __init__(self, stride: int = INDEX_STRIDE) -> None:
+        self.stride = stride
+        self.offsets: list[int] = []
+        self.rows = 0
+
+    @classmethod
+    def from_index(cls, index: RowIndex) -> RowIndexBuilder:
+        builder = cls(index.stride)
+        builder.offsets = list(index.offsets)
+        builder.rows = index.total_rows
+        return builder
+
+    def before_row(self, out_file: TextIO) -> None:
+        if self.rows % self.stride == 0:
+            self.offsets.append(out_file.tell())
+        self.rows += 1
+
+    def finish(self, out_file: IO) -> RowIndex:
+        out_file.flush()
+        stat = os.fstat(out_file.fileno())
+        return RowIndex(
+            stride=self.stride,
+            offsets=self.offsets,
+            total_rows=self.rows,
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+        )
+
+
+def row_index_path(working_path: Path) -> Path:
+    return working_path.with_name("row_index.json")
+
+
+def write_row_index(working_path: Path, index: RowIndex) -> None:
+    path = row_index_path(working_path)
+    temp_path = path.with_suffix(f".{uuid4().hex}.tmp")
+    temp_path.write_text(json.dumps(asdict(index)), encoding="utf-8")
+    os.replace(temp_path, path)
+
+
+def load_row_index(working_path: Path, stat: os.stat_result) -> RowIndex | None:
+    path = row_index_path(working_path)
+    try:
+        index = RowIndex(**json.loads(path.read_text(encoding="utf-8")))
+    except (FileNotFoundError, ValueError, TypeError):
+        return None
+    if index.size != stat.st_size or index.mtime_ns != stat.st_mtime_ns:
+        return None
+    return index
+
+
+def get_row_index(working_path: Path, handle: BinaryIO | None = None) -> RowIndex:
+    if handle is None:
+        with working_path.open("rb") as handle:
+            return get_row_index(working_path, handle)
+    index = load_row_index(working_path, os.fstat(handle.fileno()))
+    if index is None:
+        index = scan_row_index(handle)
+        write_row_index(working_path, index)
+    return index
+
+
+def build_row_index(working_path: Path, stride: int = INDEX_STRIDE) -> RowIndex:
+    with working_path.open("rb") as handle:
+        return scan_row_index(handle, stride)
+
+
+def scan_row_index(handle: BinaryIO, stride: int = INDEX_STRIDE) -> RowIndex:
+    builder = RowIndexBuilder(stride)
+    handle.seek(0)
+    lines = TrackedLines(handle)
+    reader = csv.reader(lines)
+    next(reader, None)
+    while True:
+        start = lines.position
+        if next(reader, None) is None:
+            break
+        if builder.rows % stride == 0:
+            builder.offsets.append(start)
+        builder.rows += 1
+    return builder.finish(handle)
+
+
+class TrackedLines:
+    def __init__(self, handle: BinaryIO, position: int = 0) -> None:
+        self.handle = handle
+        self.position = position
+
+    def __iter__(self) -> Iterator[str]:
+        for raw in self.handle:
+            self.position += len(raw)
+            yield raw.decode("utf-8")
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import csv
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Iterable
+from uuid import uuid4
+
+if TYPE_CHECKING:
+    from app.edits.apply import CellChange
+
+
+DATE_COLUMNS = {"date_of_birth", "hire_date"}
+DATE_FORMATS = ("%Y-%m-%d", "%m/%d/%Y", "%m/%d/%y", "%d.%m.%Y")
+MAX_TRACKED_VALUES = 10_000
+TOP_K = 10
+
+
+@dataclass
+class ColumnProfile:
+    null_count: int = 0
+    counts: dict[str, int] = field(default_factory=dict)
+    truncated: bool = False
+    date_min: str | None = None
+    date_max: str | None = None
+
+    def add(self, value: str, is_date: bool = False) -> None:
+        if value.strip() == "":
+            self.null_count += 1
+            return
+        if is_date:
+            self._widen_dates(value)
+        if self.truncated:
+            return
+        self.counts[value] = self.counts.get(value, 0) + 1
+        if len(self.counts) > MAX_TRACKED_VALUES:
+            self.truncated = True
+            self.counts = {}
+
+    def remove(self, value: str) -> None:
+        if value.strip() == "":
+            self.null_count = max(self.null_count - 1, 0)
+            return
+        if self.truncated:
+            return
+        remaining = self.counts.get(value, 0) - 1
+        if remaining > 0:
+            self.counts[value] = remaining
+        else:
+            self.counts.pop(value, None)
+
+    def summary(self, top_k: int, is_date: bool = False) -> dict[str, object]:
+        top_values = sorted(self.counts.items(), key=lambda item: (-item[1], item[0]))
+        result: dict[str, object] = {
+            "null_count": self.null_count,
+            "distinct_count": None if self.truncated else len(self.counts),
+            "top_values": [
+                {"value": value, "count": count} for value, count in top_values[:top_k]
+            ],
+            "truncated": self.truncated,
+        }
+        if is_date:
+            result["min"], result["max"] = self._date_range()
+        return result
+
+    def _widen_dates(self, value: str) -> None:
+        parsed = parse_date(value)
+        if parsed is None:
+            return
+        if self.date_min is None or parsed < self.date_min:
+            self.date_min = parsed
+        if self.date_max is None or parsed > self.date_max:
+            self.date_max = parsed
+
+    def _date_range(self) -> tuple[str | None, str | None]:
+        if self.truncated:
+            return self.date_min, self.date_max
+        parsed = [day for day in map(parse_date, self.counts) if day is not None]
+        if not parsed:
+            return None, None
+        return min(parsed), max(parsed)
+
+
+@dataclass
+class DatasetProfile:
+    columns: dict[str, ColumnProfile]
+    total_rows: int
+    size: int = 0
+    mtime_ns: int = 0
+
+    def summary(
+        self, columns: Iterable[str] | None = None, top_k: int = TOP_K
+    ) -> dict[str, dict[str, object]]:
+        names = list(self.columns) if columns is None else list(columns)
+        return {
+            name: self.columns[name].summary(top_k, name in DATE_COLUMNS)
+            for name in names
+            if name in self.columns
+        }
+
+    def stamp(self, stat: os.stat_result) -> None:
+        self.size = stat.st_size
+        self.mtime_ns = stat.st_mtime_ns
+
+    def apply_changes(self, changes: Iterable[CellChange]) -> None:
+        for change in changes:
+            column = self.columns.get(change.column)
+            if column is None:
+                continue
+            column.remove(change.old)
+            column.add(change.new, change.column in DATE_COLUMNS)
+
+
+class ProfileBuilder:
+    def __init__(self, columns: list[str]) -> None:
+        self.names = list(columns)
+        self.columns = [ColumnProfile() for _ in self.names]
+        self.date_flags = [name in DATE_COLUMNS for name in self.names]
+        self.rows = 0
+
+    @classmethod
+    def from_profile(cls, profile: DatasetProfile) -> ProfileBuilder:
+        builder = cls(list(profile.columns))
+        builder.columns = list(profile.columns.values())
+        builder.rows = profile.total_rows
+        return builder
+
+    def add_row(self, values: list[str]) -> None:
+        self.rows += 1
+        for column, is_date, value in zip(self.columns, self.date_flags, values):
+            column.add(value, is_date)
+
+    def finish(self, handle: IO) -> DatasetProfile:
+        handle.flush()
+        profile = DatasetProfile(
+            columns=dict(zip(self.names, self.columns)), total_rows=self.rows
+        )
+        profile.stamp(os.fstat(handle.fileno()))
+        return profile
+
+
+def parse_date(value: str) -> str | None:
+    text = value.strip()
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.strptime(text, date_format).date().isoformat()
+        except ValueError:
+            continue
+    try:
+        return date.fromisoformat(text[:10]).isoformat()
+    except ValueError:
+        return None
+
+
+def profile_path(working_path: Path) -> Path:
+    return working_path.with_name("profile.json")
+
+
+def write_profile(working_path: Path, profile: DatasetProfile) -> None:
+    path = profile_path(working_path)
+    temp_path = path.with_suffix(f".{uuid4().hex}.tmp")
+    temp_path.write_text(json.dumps(asdict(profile)), encoding="utf-8")
+    os.replace(temp_path, path)
+
+
+def load_profile(
+    working_path: Path, stat: os.stat_result | None = None
+) -> DatasetProfile | None:
+    path = profile_path(working_path)
+    try:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+        columns = {
+            name: ColumnProfile(**column) for name, column in raw.pop("columns").items()
+        }
+        profile = DatasetProfile(columns=columns, **raw)
+        if stat is None:
+            stat = working_path.stat()
+    except (FileNotFoundError, KeyError, ValueError, TypeError, AttributeError):
+        return None
+    if profile.size != stat.st_size or profile.mtime_ns != stat.st_mtime_ns:
+        return None
+    return profile
+
+
+def get_profile(working_path: Path) -> DatasetProfile:
+    with working_path.open("r", newline="", encoding="utf-8") as in_file:
+        profile = load_profile(working_path, os.fstat(in_file.fileno()))
+        if profile is None:
+            profile = scan_profile(in_file)
+            write_profile(working_path, profile)
+    return profile
+
+
+def scan_profile(in_file: IO[str]) -> DatasetProfile:
+    in_file.seek(0)
+    reader = csv.reader(in_file)
+    header = next(reader, [])
+    builder = ProfileBuilder(header[1:])
+    for record in reader:
+        builder.add_row(record[1:])
+    return builder.finish(in_file)
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
 import csv
+import io
 from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
+from typing import BinaryIO, Iterator
+
+from app.rows.index import RowIndex, get_row_index
 
 
 @dataclass
@@ -19,6 +24,10 @@ def read_rows_page(
     limit: int,
     filters: list[RowFilter] | None = None,
 ) -> tuple[list[dict[str, object]], int]:
+    if not filters:
+        with working_path.open("rb") as handle:
+            row_index = get_row_index(working_path, handle)
+            return _read_indexed_page(handle, canonical_columns, offset, limit, row_index)
     rows: list[dict[str, object]] = []
     filtered_count = 0
     with working_path.open("r", newline="", encoding="utf-8") as in_file:
@@ -32,6 +41,42 @@ def read_rows_page(
     return rows, filtered_count
 
 
+def _read_indexed_page(
+    handle: BinaryIO,
+    canonical_columns: list[str],
+    offset: int,
+    limit: int,
+    row_index: RowIndex,
+) -> tuple[list[dict[str, object]], int]:
+    if offset >= row_index.total_rows:
+        return [], row_index.total_rows
+    byte_offset, skip = row_index.checkpoint(offset)
+    limit = min(limit, row_index.total_rows - offset)
+    handle.seek(0)
+    fieldnames = next(csv.reader([handle.readline().decode("utf-8")]))
+    handle.seek(byte_offset)
+    text = io.TextIOWrapper(handle, encoding="utf-8", newline="")
+    try:
+        reader = csv.DictReader(text, fieldnames=fieldnames)
+        page = islice(reader, skip, skip + limit)
+        rows = [_row_payload(row, canonical_columns) for row in page]
+    finally:
+        text.detach()
+    return rows, row_index.total_rows
+
+
+def iter_rows(
+    working_path: Path,
+    filters: list[RowFilter] | None = None,
+) -> Iterator[dict[str, str | None]]:
+    with working_path.open("r", newline="", encoding="utf-8") as in_file:
+        reader = csv.DictReader(in_file)
+        for row in reader:
+            if filters and not _matches_filters(row, filters):
+                continue
+            yield row
+
+
 def _row_payload(
     row: dict[str, str | None], canonical_columns: list[str]
 ) -> dict[str, object]:
@@ -1,98 +1,162 @@
 from __future__ import annotations
 
 import csv
+import heapq
+import io
 import re
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Iterable
+
+from app.core.timing import timed
 
 
 _EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
 _EMPLOYMENT_ALLOWED = {"active", "terminated"}
+_REQUIRED_FIELDS = {
+    "employee_id": ("Employee ID is required.", "Enter a unique employee ID."),
+    "first_name": ("First name is required.", "Enter a first name."),
+    "last_name": ("Last name is required.", "Enter a last name."),
+}
+_RULE_COLUMNS = [*_REQUIRED_FIELDS, "work_email", "employment_status"]
+_RULE_ORDER = {column: position for position, column in enumerate(_RULE_COLUMNS)}
 
 
 @dataclass
 class ValidationResult:
     summary: dict[str, object]
     issues: list[dict[str, object]]
+    row_count: int = 0
 
 
-def validate_working_csv(working_path: Path) -> ValidationResult:
+def validate_working_csv(
+    working_path: Path, start_offset: int | None = None, first_row_number: int = 1
+) -> ValidationResult:
     issues: list[dict[str, object]] = []
 
-    with working_path.open("r", newline="", encoding="utf-8") as in_file:
-        reader = csv.DictReader(in_file)
+    with timed("validate") as span, working_path.open("rb") as handle:
+        fieldnames = next(csv.reader([handle.readline().decode("utf-8")]), [])
+        if start_offset is not None:
+            handle.seek(start_offset)
+        in_file = io.TextIOWrapper(handle, encoding="utf-8", newline="")
+        reader = csv.DictReader(in_file, fieldnames=fieldnames)
+        row_count = 0
         for row in reader:
+            row_number = first_row_number + row_count
+            row_count += 1
             row_id = row.get("row_id")
-            _check_required(row, row_id, issues)
-            _check_email(row, row_id, issues)
-            _check_employment_status(row, row_id, issues)
-
-    summary = {
-        "error_count": len(issues),
-        "warning_count": 0,
-        "last_validated_at": _utc_now_iso(),
+            for column in _RULE_COLUMNS:
+                issues.extend(validate_cell(row_id, row_number, column, row.get(column)))
+        span.rows = row_count
+
+    return ValidationResult(
+        summary=_summary(issues), issues=issues, row_count=row_count
+    )
+
+
+def extend_validation(
+    issues: list[dict[str, object]], appended: ValidationResult
+) -> ValidationResult:
+    merged = [*issues, *appended.issues]
+    return ValidationResult(
+        summary=_summary(merged), issues=merged, row_count=appended.row_count
+    )
+
+
+def validate_cell(
+    row_id: str | None, row_number: int, column: str, raw_value: str | None
+) -> list[dict[str, object]]:
+    value = _normalize_value(raw_value)
+    if column in _REQUIRED_FIELDS:
+        if value != "":
+            return []
+        message, suggestion = _REQUIRED_FIELDS[column]
+        return [_issue("missing_required", row_id, row_number, column, message, suggestion)]
+    if column == "work_email":
+        if not value or _EMAIL_RE.match(value):
+            return []
+        return [
+            _issue(
+                "invalid_email",
+                row_id,
+                row_number,
+                column,
+                "Work email is not a valid email address.",
+                "Fix the email format (e.g., name@company.com).",
+            )
+        ]
+    if column == "employment_status":
+        if not value or value.lower() in _EMPLOYMENT_ALLOWED:
+            return []
+        return [
+            _issue(
+                "invalid_enum",
+                row_id,
+                row_number,
+                column,
+                "Employment status must be 'active' or 'terminated'.",
+                "Use bulk map to normalize values.",
+            )
+        ]
+    return []
+
+
+def revalidate_cells(
+    issues: list[dict[str, object]],
+    cells: Iterable[tuple[str, int, str, str | None]],
+) -> ValidationResult:
+    touched: set[tuple[str, str]] = set()
+    fresh: list[dict[str, object]] = []
+    with timed("revalidate") as span:
+        for row_id, row_number, column, value in cells:
+            touched.add((row_id, column))
+            fresh.extend(validate_cell(row_id, row_number, column, value))
+        span.rows = len(touched)
+        kept = [
+            issue
+            for issue in issues
+            if (issue.get("row_id"), issue.get("column")) not in touched
+        ]
+        fresh.sort(key=_issue_order)
+        merged = list(heapq.merge(kept, fresh, key=_issue_order))
+    return ValidationResult(summary=_summary(merged), issues=merged, row_count=len(touched))
+
+
+def _issue(
+    issue_type: str,
+    row_id: str | None,
+    row_number: int,
+    column: str,
+    message: str,
+    suggestion: str,
+) -> dict[str, object]:
+    return {
+        "severity": "error",
+        "type": issue_type,
+        "row_id": row_id,
+        "row_number": row_number,
+        "column": column,
+        "message": message,
+        "suggestion": suggestion,
     }
-    return ValidationResult(summary=summary, issues=issues)
 
 
-def _check_required(
-    row: dict[str, str | None], row_id: str | None, issues: list[dict[str, object]]
-) -> None:
-    required_fields = {
-        "employee_id": ("Employee ID is required.", "Enter a unique employee ID."),
-        "first_name": ("First name is required.", "Enter a first name."),
-        "last_name": ("Last name is required.", "Enter a last name."),
-    }
-    for field, (message, suggestion) in required_fields.items():
-        value = _normalize_value(row.get(field))
-        if value == "":
-            issues.append(
-                {
-                    "severity": "error",
-                    "type": "missing_required",
-                    "row_id": row_id,
-                    "column": field,
-                    "message": message,
-                    "suggestion": suggestion,
-                }
-            )
+def _issue_order(issue: dict[str, object]) -> tuple[int, int]:
+    row_number = issue.get("row_number")
+    return (
+        row_number if isinstance(row_number, int) else 0,
+        _RULE_ORDER.get(str(issue.get("column")), len(_RULE_ORDER)),
+    )
 
 
-def _check_email(
-    row: dict[str, str | None], row_id: str | None, issues: list[dict[str, object]]
-) -> None:
-    value = _normalize_value(row.get("work_email"))
-    if value and not _EMAIL_RE.match(value):
-        issues.append(
-            {
-                "severity": "error",
-                "type": "invalid_email",
-                "row_id": row_id,
-                "column": "work_email",
-                "message": "Work email is not a valid email address.",
-                "suggestion": "Fix the email format (e.g., name@company.com).",
-            }
-        )
-
-
-def _check_employment_status(
-    row: dict[str, str | None], row_id: str | None, issues: list[dict[str, object]]
-) -> None:
-    value = _normalize_value(row.get("employment_status"))
-    if not value:
-        return
-    if value.lower() not in _EMPLOYMENT_ALLOWED:
-        issues.append(
-            {
-                "severity": "error",
-                "type": "invalid_enum",
-                "row_id": row_id,
-                "column": "employment_status",
-                "message": "Employment status must be 'active' or 'terminated'.",
-                "suggestion": "Use bulk map to normalize values.",
-            }
-        )
+def _summary(issues: list[dict[str, object]]) -> dict[str, object]:
+    warning_count = sum(1 for issue in issues if issue.get("severity") == "warning")
+    return {
+        "error_count": len(issues) - warning_count,
+        "warning_count": warning_count,
+        "last_validated_at": _utc_now_iso(),
+    }
 
 
 def _normalize_value(value: str | None) -> str:
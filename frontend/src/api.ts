@@ -73,7 +73,7 @@ export async function applyEdit(
   rowId: string,
   column: string,
   value: string
-): Promise<{ validation: JobState["validation"]; issues: Issue[] }> {
+): Promise<{ validation: JobState["validation"]; issues: Issue[]; dataset_version: number }> {
   return request(`/api/jobs/${jobId}/edits`, {
     method: "POST",
     headers: { "Content-Type": "application/json" },
@@ -91,7 +91,7 @@ export async function applyBulkMap(
     replaceFrom?: string;
     replaceTo?: string;
   }
-): Promise<{ validation: JobState["validation"]; issues: Issue[] }> {
+): Promise<{ validation: JobState["validation"]; issues: Issue[]; dataset_version: number }> {
   const { column, apply_to, mapping, defaultValue, replaceFrom, replaceTo } = payload;
   const useReplace = replaceFrom !== undefined && replaceFrom !== "";
   const body = useReplace
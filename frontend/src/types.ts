@@ -30,6 +30,7 @@ export type JobState = {
   dataset: DatasetMeta | null;
   validation: ValidationSummary | null;
   issues: Issue[];
+  dataset_version: number;
 };
 
 export type RowsResponse = {
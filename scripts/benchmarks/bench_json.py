@@ -0,0 +1,107 @@
+import argparse
+import gzip
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from fastapi.responses import JSONResponse  # noqa: E402
+
+from app.core.compression import compress_body  # noqa: E402
+from app.core.responses import FastJSONResponse, orjson  # noqa: E402
+
+
+def build_issues(rows: int) -> list[dict[str, object]]:
+    issues: list[dict[str, object]] = []
+    for index in range(rows):
+        row_id = f"00000000-0000-4000-8000-{index:012d}"
+        issues.append(
+            {
+                "severity": "error",
+                "type": "invalid_email",
+                "row_id": row_id,
+                "column": "work_email",
+                "message": "Work email is not a valid email address.",
+                "suggestion": "Fix the email format (e.g., name@company.com).",
+            }
+        )
+        if index % 3 == 0:
+            issues.append(
+                {
+                    "severity": "error",
+                    "type": "invalid_enum",
+                    "row_id": row_id,
+                    "column": "employment_status",
+                    "message": "Employment status must be 'active' or 'terminated'.",
+                    "suggestion": "Use bulk map to normalize values.",
+                }
+            )
+    return issues
+
+
+def build_rows_page(limit: int) -> dict[str, object]:
+    rows = [
+        {
+            "row_id": f"00000000-0000-4000-8000-{index:012d}",
+            "employee_id": f"E{10000 + index}",
+            "first_name": "Ava",
+            "last_name": "Nguyen",
+            "date_of_birth": "1991-02-14",
+            "hire_date": "2023-08-01",
+            "employment_status": "active",
+            "job_title": "Analyst",
+            "work_email": "ava.nguyen@company.com",
+            "department": None,
+        }
+        for index in range(limit)
+    ]
+    return {"offset": 0, "limit": limit, "total_rows": limit, "total_filtered": limit, "rows": rows}
+
+
+def time_render(response_class: type[JSONResponse], content: object, repeat: int) -> tuple[float, bytes]:
+    body = b""
+    started = time.perf_counter()
+    for _ in range(repeat):
+        body = response_class(content=content).body
+    elapsed_ms = (time.perf_counter() - started) * 1000 / repeat
+    return elapsed_ms, body
+
+
+def bench_payload(name: str, content: object, repeat: int) -> dict[str, object]:
+    before_ms, before_body = time_render(JSONResponse, content, repeat)
+    after_ms, after_body = time_render(FastJSONResponse, content, repeat)
+    assert json.loads(before_body) == json.loads(after_body)
+    started = time.perf_counter()
+    gzipped = compress_body(after_body, "gzip", 6)
+    gzip_ms = (time.perf_counter() - started) * 1000
+    return {
+        "payload": name,
+        "serialize_ms_before": round(before_ms, 3),
+        "serialize_ms_after": round(after_ms, 3),
+        "bytes_before": len(before_body),
+        "bytes_after_gzip": len(gzipped),
+        "gzip_ms": round(gzip_ms, 3),
+        "gzip_roundtrip_ok": gzip.decompress(gzipped) == after_body,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare JSON encoding and compression for rows/issues payloads."
+    )
+    parser.add_argument("--issue-rows", type=int, default=50_000, help="Rows with issues")
+    parser.add_argument("--page-size", type=int, default=1000, help="Rows per page")
+    parser.add_argument("--repeat", type=int, default=5, help="Renders per measurement")
+    args = parser.parse_args()
+
+    results = [
+        bench_payload("issues", build_issues(args.issue_rows), args.repeat),
+        bench_payload("rows_page", build_rows_page(args.page_size), args.repeat),
+    ]
+    print(json.dumps({"orjson": orjson is not None, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+import argparse
+import asyncio
+import importlib
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "scripts" / "sample_data"))
+
+import httpx  # noqa: E402
+
+import generate_samples  # noqa: E402
+
+DEFAULT_MIX = "page=50,filter=20,edit=25,export=5"
+PAGE_LIMIT = 100
+EDIT_COLUMN = "job_title"
+
+
+@dataclass
+class LoadStats:
+    latencies: dict[str, list[float]] = field(default_factory=dict)
+    errors: dict[str, int] = field(default_factory=dict)
+    acknowledged_edits: dict[tuple[str, str], str] = field(default_factory=dict)
+
+    def record(self, operation: str, elapsed_ms: float, ok: bool) -> None:
+        self.latencies.setdefault(operation, []).append(elapsed_ms)
+        if not ok:
+            self.errors[operation] = self.errors.get(operation, 0) + 1
+
+
+def load_app(storage_root: Path):
+    os.environ["DATABUDDY_STORAGE_ROOT"] = str(storage_root)
+    import app.core.config as config
+
+    importlib.reload(config)
+    import app.main as main
+
+    importlib.reload(main)
+    main.startup()
+    return main
+
+
+def parse_mix(raw: str) -> tuple[list[str], list[int]]:
+    operations: list[str] = []
+    weights: list[int] = []
+    for item in raw.split(","):
+        name, _, weight = item.partition("=")
+        operations.append(name.strip())
+        weights.append(int(weight))
+    return operations, weights
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(int(round(pct / 100 * (len(ordered) - 1))), len(ordered) - 1)
+    return round(ordered[index], 3)
+
+
+async def fetch_all_rows(client: httpx.AsyncClient, job_id: str) -> list[dict]:
+    rows: list[dict] = []
+    offset = 0
+    while True:
+        response = await client.get(
+            f"/api/jobs/{job_id}/rows", params={"offset": offset, "limit": 1000}
+        )
+        response.raise_for_status()
+        page = response.json()["rows"]
+        rows.extend(page)
+        if len(page) < 1000:
+            return rows
+        offset += len(page)
+
+
+async def simulated_user(
+    user_index: int,
+    client: httpx.AsyncClient,
+    job_id: str,
+    total_rows: int,
+    owned_rows: list[str],
+    operations: list[str],
+    weights: list[int],
+    deadline: float,
+    stats: LoadStats,
+    seed: int,
+) -> None:
+    rng = random.Random(seed + user_index)
+    filters = json.dumps([{"column": "employment_status", "op": "eq", "value": "active"}])
+    sequence = 0
+    while time.perf_counter() < deadline:
+        operation = rng.choices(operations, weights)[0]
+        if operation == "edit" and not owned_rows:
+            operation = "page"
+        started = time.perf_counter()
+        if operation == "page":
+            offset = rng.randrange(max(total_rows - PAGE_LIMIT, 1))
+            response = await client.get(
+                f"/api/jobs/{job_id}/rows", params={"offset": offset, "limit": PAGE_LIMIT}
+            )
+        elif operation == "filter":
+            response = await client.get(
+                f"/api/jobs/{job_id}/rows",
+                params={"offset": 0, "limit": PAGE_LIMIT, "filters": filters},
+            )
+        elif operation == "edit":
+            sequence += 1
+            row_id = rng.choice(owned_rows)
+            value = f"user{user_index}-edit{sequence}"
+            response = await client.post(
+                f"/api/jobs/{job_id}/edits",
+                json={"edits": [{"row_id": row_id, "column": EDIT_COLUMN, "value": value}]},
+            )
+            if response.status_code == 200:
+                stats.acknowledged_edits[(row_id, EDIT_COLUMN)] = value
+        elif operation == "export":
+            response = await client.get(f"/api/jobs/{job_id}/export")
+        else:
+            raise ValueError(f"unknown operation: {operation}")
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        stats.record(operation, elapsed_ms, response.status_code < 400)
+
+
+async def run_load(args: argparse.Namespace, storage_root: Path, csv_path: Path) -> dict:
+    main = load_app(storage_root)
+    operations, weights = parse_mix(args.mix)
+    transport = httpx.ASGITransport(app=main.app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://loadtest", timeout=None
+    ) as client:
+        with csv_path.open("rb") as in_file:
+            response = await client.post(
+                "/api/jobs", files={"file": (csv_path.name, in_file, "text/csv")}
+            )
+        response.raise_for_status()
+        job_id = response.json()["job_id"]
+        rows = await fetch_all_rows(client, job_id)
+        row_ids = [row["row_id"] for row in rows]
+
+        stats = LoadStats()
+        started = time.perf_counter()
+        deadline = started + args.duration
+        await asyncio.gather(
+            *(
+                simulated_user(
+                    index,
+                    client,
+                    job_id,
+                    len(row_ids),
+                    row_ids[index :: args.users][: args.rows_per_user],
+                    operations,
+                    weights,
+                    deadline,
+                    stats,
+                    args.seed,
+                )
+                for index in range(args.users)
+            )
+        )
+        elapsed = time.perf_counter() - started
+
+        final_rows = {row["row_id"]: row for row in await fetch_all_rows(client, job_id)}
+        lost_updates = [
+            {
+                "row_id": row_id,
+                "column": column,
+                "expected": expected,
+                "actual": final_rows.get(row_id, {}).get(column),
+            }
+            for (row_id, column), expected in stats.acknowledged_edits.items()
+            if final_rows.get(row_id, {}).get(column) != expected
+        ]
+        await client.delete(f"/api/jobs/{job_id}")
+
+    total_requests = sum(len(samples) for samples in stats.latencies.values())
+    total_errors = sum(stats.errors.values())
+    return {
+        "config": {
+            "users": args.users,
+            "duration_s": args.duration,
+            "rows": args.rows,
+            "mix": args.mix,
+            "seed": args.seed,
+        },
+        "elapsed_s": round(elapsed, 3),
+        "requests": total_requests,
+        "throughput_rps": round(total_requests / elapsed, 3) if elapsed else 0.0,
+        "error_rate": round(total_errors / total_requests, 4) if total_requests else 0.0,
+        "operations": {
+            operation: {
+                "count": len(samples),
+                "errors": stats.errors.get(operation, 0),
+                "p50_ms": percentile(samples, 50),
+                "p95_ms": percentile(samples, 95),
+                "p99_ms": percentile(samples, 99),
+            }
+            for operation, samples in sorted(stats.latencies.items())
+        },
+        "acknowledged_cells": len(stats.acknowledged_edits),
+        "lost_updates": len(lost_updates),
+        "lost_update_samples": lost_updates[:10],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Drive the API in-process with concurrent simulated users."
+    )
+    parser.add_argument("--users", type=int, default=16, help="Concurrent simulated users")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds to run")
+    parser.add_argument("--rows", type=int, default=5000, help="Rows in the test dataset")
+    parser.add_argument("--rows-per-user", type=int, default=20, help="Rows each user edits")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="Operation weights, e.g. page=50,edit=25")
+    parser.add_argument("--error-rate", type=float, default=0.08, help="Per-field error rate")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--out", help="Write JSON results to this path (default: stdout)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="databuddy_load_") as temp_dir:
+        temp_path = Path(temp_dir)
+        random.seed(args.seed)
+        csv_path = temp_path / "load.csv"
+        generate_samples.generate_csv(csv_path, args.rows, args.error_rate)
+        report = asyncio.run(run_load(args, temp_path / "storage", csv_path))
+
+    output = json.dumps(report, indent=2)
+    if args.out:
+        Path(args.out).write_text(output + "\n", encoding="utf-8")
+    else:
+        print(output)
+    if report["lost_updates"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+import argparse
+import csv
+import importlib
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "scripts" / "sample_data"))
+
+from fastapi.testclient import TestClient  # noqa: E402
+from openpyxl import Workbook  # noqa: E402
+
+import generate_samples  # noqa: E402
+
+DEFAULT_SIZES = "1000,10000,50000,500000"
+PAGE_LIMIT = 100
+
+
+def build_client(storage_root: Path, max_rows: int, max_bytes: int, ingest_cache_bytes: int = 0):
+    os.environ["DATABUDDY_STORAGE_ROOT"] = str(storage_root)
+    os.environ["DATABUDDY_MAX_ROWS"] = str(max_rows)
+    os.environ["DATABUDDY_MAX_BYTES"] = str(max_bytes)
+    os.environ["DATABUDDY_INGEST_CACHE_BYTES"] = str(ingest_cache_bytes)
+    import app.core.config as config
+
+    importlib.reload(config)
+    import app.main as main
+
+    importlib.reload(main)
+    main.startup()
+    return main, TestClient(main.app)
+
+
+def write_dataset(out_dir: Path, rows: int, error_rate: float, seed: int) -> Path:
+    random.seed(seed)
+    path = out_dir / f"bench_{rows}.csv"
+    generate_samples.generate_csv(path, rows, error_rate)
+    return path
+
+
+def write_xlsx_copy(csv_path: Path) -> Path:
+    xlsx_path = csv_path.with_suffix(".xlsx")
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("census")
+    with csv_path.open("r", newline="", encoding="utf-8") as in_file:
+        for row in csv.reader(in_file):
+            sheet.append(row)
+    workbook.save(xlsx_path)
+    return xlsx_path
+
+
+def measure(repeat: int, action: Callable[[], object]) -> dict[str, object]:
+    samples: list[float] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        action()
+        samples.append((time.perf_counter() - started) * 1000)
+    return {
+        "samples_ms": [round(sample, 3) for sample in samples],
+        "min_ms": round(min(samples), 3),
+        "median_ms": round(statistics.median(samples), 3),
+    }
+
+
+def expect(response, status_code: int):
+    if response.status_code != status_code:
+        raise RuntimeError(
+            f"{response.request.method} {response.request.url} returned "
+            f"{response.status_code}: {response.text[:200]}"
+        )
+    return response
+
+
+def upload(client: TestClient, path: Path, content_type: str) -> str:
+    with path.open("rb") as in_file:
+        response = client.post("/api/jobs", files={"file": (path.name, in_file, content_type)})
+    return expect(response, 201).json()["job_id"]
+
+
+def bench_size(
+    rows: int,
+    work_dir: Path,
+    args: argparse.Namespace,
+) -> list[dict[str, object]]:
+    csv_path = write_dataset(work_dir, rows, args.error_rate, args.seed)
+    main, client = build_client(work_dir / f"storage_{rows}", rows + 1, 1 << 40)
+    results: list[dict[str, object]] = []
+
+    def record(operation: str, repeat: int, action: Callable[[], object]) -> None:
+        result = {"rows": rows, "operation": operation, **measure(repeat, action)}
+        results.append(result)
+        print(f"{rows:>8} {operation:<28} {result['median_ms']:>10.1f} ms", file=sys.stderr)
+
+    def ingest_csv() -> None:
+        job_id = upload(client, csv_path, "text/csv")
+        expect(client.delete(f"/api/jobs/{job_id}"), 204)
+
+    record("ingest_csv", args.repeat, ingest_csv)
+
+    if rows <= args.xlsx_max_rows:
+        xlsx_path = write_xlsx_copy(csv_path)
+        content_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+        def ingest_xlsx() -> None:
+            job_id = upload(client, xlsx_path, content_type)
+            expect(client.delete(f"/api/jobs/{job_id}"), 204)
+
+        record("ingest_xlsx", args.repeat, ingest_xlsx)
+
+    job_id = upload(client, csv_path, "text/csv")
+    working_path = main.working_csv_path(main.SETTINGS.storage_root, job_id)
+    record("validate", args.repeat, lambda: main.validate_working_csv(working_path))
+
+    for label, offset in (("start", 0), ("middle", rows // 2), ("end", max(rows - PAGE_LIMIT, 0))):
+        record(
+            f"page_read_{label}",
+            args.repeat,
+            lambda offset=offset: expect(
+                client.get(
+                    f"/api/jobs/{job_id}/rows",
+                    params={"offset": offset, "limit": PAGE_LIMIT},
+                ),
+                200,
+            ),
+        )
+
+    filters = json.dumps([{"column": "employment_status", "op": "eq", "value": "active"}])
+    for label, offset in (("start", 0), ("middle", rows // 4)):
+        record(
+            f"filtered_read_{label}",
+            args.repeat,
+            lambda offset=offset: expect(
+                client.get(
+                    f"/api/jobs/{job_id}/rows",
+                    params={"offset": offset, "limit": PAGE_LIMIT, "filters": filters},
+                ),
+                200,
+            ),
+        )
+
+    last_page = expect(
+        client.get(f"/api/jobs/{job_id}/rows", params={"offset": rows - 1, "limit": 1}),
+        200,
+    ).json()["rows"]
+    row_id = last_page[0]["row_id"]
+    record(
+        "single_edit",
+        args.repeat,
+        lambda: expect(
+            client.post(
+                f"/api/jobs/{job_id}/edits",
+                json={"edits": [{"row_id": row_id, "column": "first_name", "value": "Ava"}]},
+            ),
+            200,
+        ),
+    )
+    record(
+        "bulk_map",
+        args.repeat,
+        lambda: expect(
+            client.post(
+                f"/api/jobs/{job_id}/bulk",
+                json={
+                    "action_type": "map",
+                    "column": "employment_status",
+                    "params": {"mapping": {"paused": "active", "leave": "active"}},
+                },
+            ),
+            200,
+        ),
+    )
+    record(
+        "export_csv",
+        args.repeat,
+        lambda: expect(
+            client.get(f"/api/jobs/{job_id}/export", headers={"Accept-Encoding": "identity"}),
+            200,
+        ),
+    )
+    record(
+        "export_canonical_csv",
+        args.repeat,
+        lambda: expect(
+            client.get(f"/api/jobs/{job_id}/export", params={"format": "canonical_csv"}),
+            200,
+        ),
+    )
+    expect(client.delete(f"/api/jobs/{job_id}"), 204)
+
+    _, cached_client = build_client(
+        work_dir / f"storage_{rows}_cached", rows + 1, 1 << 40, ingest_cache_bytes=1 << 40
+    )
+
+    def ingest_csv_cached() -> None:
+        job_id = upload(cached_client, csv_path, "text/csv")
+        expect(cached_client.delete(f"/api/jobs/{job_id}"), 204)
+
+    ingest_csv_cached()
+    record("ingest_csv_cache_hit", args.repeat, ingest_csv_cached)
+    return results
+
+
+def compare(results: list[dict[str, object]], baseline_path: Path) -> list[dict[str, object]]:
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    previous = {
+        (item["rows"], item["operation"]): item["median_ms"] for item in baseline["results"]
+    }
+    comparison = []
+    for item in results:
+        before = previous.get((item["rows"], item["operation"]))
+        if not before:
+            continue
+        comparison.append(
+            {
+                "rows": item["rows"],
+                "operation": item["operation"],
+                "baseline_median_ms": before,
+                "median_ms": item["median_ms"],
+                "ratio": round(item["median_ms"] / before, 3),
+            }
+        )
+    return comparison
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Time ingest, validation, paging, edits, bulk maps, and export in-process."
+    )
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="Comma-separated row counts")
+    parser.add_argument("--error-rate", type=float, default=0.08, help="Per-field error rate")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--repeat", type=int, default=3, help="Samples per operation")
+    parser.add_argument(
+        "--xlsx-max-rows",
+        type=int,
+        default=50_000,
+        help="Skip XLSX ingest above this size",
+    )
+    parser.add_argument("--out", help="Write JSON results to this path (default: stdout)")
+    parser.add_argument("--baseline", help="Previous results JSON to compare against")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    results: list[dict[str, object]] = []
+    with tempfile.TemporaryDirectory(prefix="databuddy_bench_") as temp_dir:
+        for rows in sizes:
+            results.extend(bench_size(rows, Path(temp_dir), args))
+
+    report: dict[str, object] = {
+        "generated_at": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {
+            "sizes": sizes,
+            "error_rate": args.error_rate,
+            "seed": args.seed,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    if args.baseline:
+        report["comparison"] = compare(results, Path(args.baseline))
+    output = json.dumps(report, indent=2)
+    if args.out:
+        Path(args.out).write_text(output + "\n", encoding="utf-8")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
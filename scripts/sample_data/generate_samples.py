@@ -1,6 +1,10 @@
 import argparse
 import csv
 import random
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 
 CANONICAL_COLUMNS = [
@@ -46,6 +50,36 @@ JOB_TITLES = ["Analyst", "Manager", "Coordinator", "Specialist", "Engineer", "Le
 EMPLOYMENT_STATUSES = ["active", "terminated"]
 INVALID_STATUSES = ["paused", "leave", "inactive"]
 
+UNICODE_FIRST_NAMES = ["José", "Zoë", "Björn", "Aoife", "Øyvind", "Siân", "Łucja", "Thảo"]
+UNICODE_LAST_NAMES = [
+    "Müller",
+    "Đặng",
+    "Ó Briain",
+    "García-Núñez",
+    "Søren",
+    "Çelik",
+    "王",
+]
+FIELD_ERRORS = {
+    "employee_id": "blank",
+    "first_name": "blank",
+    "last_name": "blank",
+    "work_email": "bad_email",
+    "employment_status": "bad_status",
+}
+CHUNK_ROWS = 100_000
+
+
+@dataclass(frozen=True)
+class LargeSpec:
+    rows: int
+    seed: int = 42
+    field_error_rates: dict[str, float] = field(default_factory=dict)
+    duplicate_id_rate: float = 0.0
+    unicode_rate: float = 0.0
+    extra_columns: int = 0
+    messy_headers: bool = False
+
 
 def random_date(start_year: int, end_year: int) -> str:
     year = random.randint(start_year, end_year)
@@ -93,6 +127,135 @@ def generate_csv(path: Path, rows: int, error_rate: float) -> None:
             writer.writerow(build_row(i, error_rate))
 
 
+def build_large_header(spec: LargeSpec) -> list[str]:
+    header = list(CANONICAL_COLUMNS)
+    if spec.messy_headers:
+        rng = random.Random(spec.seed)
+        header = [_messy_header(name, rng) for name in header]
+    header.extend(f"extra_{index}" for index in range(1, spec.extra_columns + 1))
+    return header
+
+
+def _messy_header(name: str, rng: random.Random) -> str:
+    variant = rng.choice([name.upper(), name.title(), name, name.capitalize()])
+    return f"{' ' * rng.randint(0, 2)}{variant}{' ' * rng.randint(0, 2)}"
+
+
+def generate_chunk_rows(spec: LargeSpec, start: int, stop: int) -> list[list[str]]:
+    rng = random.Random(spec.seed * 1_000_003 + start // CHUNK_ROWS)
+    rates = spec.field_error_rates
+    blank_id_rate = rates.get("employee_id", 0.0)
+    first_rate = rates.get("first_name", 0.0)
+    last_rate = rates.get("last_name", 0.0)
+    email_rate = rates.get("work_email", 0.0)
+    status_rate = rates.get("employment_status", 0.0)
+    rows: list[list[str]] = []
+    for index in range(start, stop):
+        if spec.unicode_rate and rng.random() < spec.unicode_rate:
+            first_name = rng.choice(UNICODE_FIRST_NAMES)
+            last_name = rng.choice(UNICODE_LAST_NAMES)
+        else:
+            first_name = rng.choice(FIRST_NAMES)
+            last_name = rng.choice(LAST_NAMES)
+        employee_id = f"E{10000 + index}"
+        if index > start and spec.duplicate_id_rate and rng.random() < spec.duplicate_id_rate:
+            employee_id = f"E{10000 + rng.randrange(start, index)}"
+        email_local = f"{first_name.lower()}.{last_name.lower()}{index}"
+        work_email = f"{email_local}@company.com"
+        employment_status = rng.choice(EMPLOYMENT_STATUSES)
+
+        if blank_id_rate and rng.random() < blank_id_rate:
+            employee_id = ""
+        if first_rate and rng.random() < first_rate:
+            first_name = ""
+        if last_rate and rng.random() < last_rate:
+            last_name = ""
+        if email_rate and rng.random() < email_rate:
+            work_email = f"{email_local}-at-company"
+        if status_rate and rng.random() < status_rate:
+            employment_status = rng.choice(INVALID_STATUSES)
+
+        row = [
+            employee_id,
+            first_name,
+            last_name,
+            f"{rng.randint(1965, 2004):04d}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            f"{rng.randint(2010, 2024):04d}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            employment_status,
+            rng.choice(JOB_TITLES),
+            work_email,
+            rng.choice(DEPARTMENTS),
+        ]
+        row.extend(f"x{rng.randrange(1_000_000)}" for _ in range(spec.extra_columns))
+        rows.append(row)
+    return rows
+
+
+def _write_chunk(spec: LargeSpec, start: int, stop: int, part_path: Path) -> Path:
+    with part_path.open("w", newline="", encoding="utf-8") as out_file:
+        csv.writer(out_file).writerows(generate_chunk_rows(spec, start, stop))
+    return part_path
+
+
+def generate_large(path: Path, spec: LargeSpec, output_format: str, workers: int) -> None:
+    bounds = [
+        (start, min(start + CHUNK_ROWS, spec.rows)) for start in range(0, spec.rows, CHUNK_ROWS)
+    ]
+    with tempfile.TemporaryDirectory(prefix="databuddy_gen_") as temp_dir:
+        part_paths = [Path(temp_dir) / f"part_{index:05d}.csv" for index in range(len(bounds))]
+        if workers > 1 and len(bounds) > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                list(
+                    pool.map(
+                        _write_chunk,
+                        [spec] * len(bounds),
+                        [start for start, _ in bounds],
+                        [stop for _, stop in bounds],
+                        part_paths,
+                    )
+                )
+        else:
+            for (start, stop), part_path in zip(bounds, part_paths):
+                _write_chunk(spec, start, stop, part_path)
+
+        header = build_large_header(spec)
+        if output_format == "xlsx":
+            _concat_parts_xlsx(path, header, part_paths)
+        else:
+            _concat_parts_csv(path, header, part_paths)
+
+
+def _concat_parts_csv(path: Path, header: list[str], part_paths: list[Path]) -> None:
+    with path.open("w", newline="", encoding="utf-8") as out_file:
+        csv.writer(out_file).writerow(header)
+        for part_path in part_paths:
+            with part_path.open("r", newline="", encoding="utf-8") as in_file:
+                shutil.copyfileobj(in_file, out_file)
+
+
+def _concat_parts_xlsx(path: Path, header: list[str], part_paths: list[Path]) -> None:
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("census")
+    sheet.append(header)
+    for part_path in part_paths:
+        with part_path.open("r", newline="", encoding="utf-8") as in_file:
+            for row in csv.reader(in_file):
+                sheet.append(row)
+    workbook.save(path)
+
+
+def _parse_field_errors(items: list[str], default_rate: float) -> dict[str, float]:
+    rates = {name: default_rate for name in FIELD_ERRORS}
+    for item in items:
+        name, _, rate = item.partition("=")
+        if name not in FIELD_ERRORS:
+            raise SystemExit(f"Unknown field for --field-error: {name}")
+        rates[name] = float(rate)
+    return rates
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="Generate sample Databuddy HR CSVs with sprinkled errors."
@@ -107,12 +270,49 @@ def main() -> None:
         help="Probability of each error type per row",
     )
     parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument(
+        "--large",
+        action="store_true",
+        help="Stream one large deterministic file instead of small samples",
+    )
+    parser.add_argument(
+        "--format", choices=["csv", "xlsx"], default="csv", help="Large-mode output format"
+    )
+    parser.add_argument(
+        "--field-error",
+        action="append",
+        default=[],
+        metavar="FIELD=RATE",
+        help="Per-field error rate in large mode (overrides --error-rate)",
+    )
+    parser.add_argument("--duplicate-id-rate", type=float, default=0.0, help="Duplicate IDs")
+    parser.add_argument("--unicode-rate", type=float, default=0.0, help="Unicode names")
+    parser.add_argument("--extra-columns", type=int, default=0, help="Unknown columns to add")
+    parser.add_argument(
+        "--messy-headers", action="store_true", help="Vary header case and whitespace"
+    )
+    parser.add_argument("--workers", type=int, default=1, help="Processes for large mode")
     args = parser.parse_args()
 
-    random.seed(args.seed)
     out_dir = Path(args.out)
     out_dir.mkdir(parents=True, exist_ok=True)
 
+    if args.large:
+        spec = LargeSpec(
+            rows=args.rows,
+            seed=args.seed,
+            field_error_rates=_parse_field_errors(args.field_error, args.error_rate),
+            duplicate_id_rate=args.duplicate_id_rate,
+            unicode_rate=args.unicode_rate,
+            extra_columns=args.extra_columns,
+            messy_headers=args.messy_headers,
+        )
+        path = out_dir / f"large_{args.rows}.{args.format}"
+        generate_large(path, spec, args.format, args.workers)
+        return
+
+    random.seed(args.seed)
+
     for index in range(1, args.count + 1):
         path = out_dir / f"sample_{index:02d}.csv"
         generate_csv(path, args.rows, args.error_rate)
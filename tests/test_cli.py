@@ -0,0 +1,73 @@
+import json
+
+import pytest
+
+from app.cli import main
+
+
+def test_batch_cli_writes_reports_exports_and_summary(tmp_path, capsys) -> None:
+    inputs = tmp_path / "inputs"
+    inputs.mkdir()
+    (inputs / "north.csv").write_text(
+        "employee_id,first_name,last_name,work_email,employment_status\n"
+        "E1,Ava,Nguyen,ava@company.com, Active \n"
+        "E2,Ben,,bad-email,terminated\n",
+        encoding="utf-8",
+    )
+    (inputs / "empty.csv").write_text("", encoding="utf-8")
+    (inputs / "legacy.csv").write_bytes(
+        "employee_id,first_name\nE3,Zo\u00e9\n".encode("latin-1")
+    )
+    (inputs / "notes.txt").write_text("skip me", encoding="utf-8")
+    steps = tmp_path / "steps.json"
+    steps.write_text(
+        json.dumps(
+            {
+                "steps": [
+                    {"op": "trim", "column": "employment_status"},
+                    {"op": "case", "column": "employment_status", "mode": "lower"},
+                ]
+            }
+        ),
+        encoding="utf-8",
+    )
+    out = tmp_path / "out"
+
+    exit_code = main(
+        [str(inputs), "--out", str(out), "--workers", "2", "--pipeline", str(steps)]
+    )
+
+    assert exit_code == 1
+    summary = json.loads((out / "summary.json").read_text(encoding="utf-8"))
+    assert summary["files"] == 3
+    assert summary["failed"] == 2
+    assert summary["total_rows"] == 2
+    reports = {report["file"].rsplit("/", 1)[-1]: report for report in summary["reports"]}
+    assert reports["empty.csv"]["error"]["details"] == {"reason": "empty_file"}
+    assert reports["legacy.csv"]["status"] == "rejected"
+    assert reports["legacy.csv"]["error"]["details"]["reason"] == "invalid_encoding"
+    north = reports["north.csv"]
+    assert north["status"] == "ok"
+    assert north["pipeline_changes"] == 1
+    assert north["error_count"] == 2
+    issues = json.loads((out / "north" / "issues.json").read_text(encoding="utf-8"))
+    assert [(issue["row_number"], issue["type"]) for issue in issues] == [
+        (2, "missing_required"),
+        (2, "invalid_email"),
+    ]
+    exported = (out / "north" / "databuddy_export.csv").read_text(encoding="utf-8")
+    assert exported.splitlines()[1].endswith(",E1,Ava,Nguyen,active,ava@company.com")
+    assert "3 files, 2 failed" in capsys.readouterr().out
+
+
+def test_batch_cli_rejects_unreadable_pipeline(tmp_path, capsys) -> None:
+    source = tmp_path / "north.csv"
+    source.write_text("employee_id\nE1\n", encoding="utf-8")
+    steps = tmp_path / "steps.json"
+    steps.write_text("{not json", encoding="utf-8")
+
+    with pytest.raises(SystemExit) as exc_info:
+        main([str(source), "--out", str(tmp_path / "out"), "--pipeline", str(steps)])
+
+    assert exc_info.value.code == 2
+    assert "cannot read --pipeline file" in capsys.readouterr().err
@@ -0,0 +1,120 @@
+import importlib
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi.testclient import TestClient
+
+import app.core.config as config
+from app.core import job_store
+from app.core.storage import working_csv_path
+from app.rows.index import build_row_index, load_row_index
+
+
+def _make_client(tmp_path, monkeypatch) -> TestClient:
+    monkeypatch.setenv("DATABUDDY_STORAGE_ROOT", str(tmp_path))
+    importlib.reload(config)
+    import app.main as main
+
+    importlib.reload(main)
+    return TestClient(main.app)
+
+
+def test_concurrent_edits_are_serialized(tmp_path, monkeypatch) -> None:
+    client = _make_client(tmp_path, monkeypatch)
+    lines = [
+        f"E{10000 + index},Name{index},Last,e{index}@company.com,active" for index in range(16)
+    ]
+    csv_body = "\n".join(["employee_id,first_name,last_name,work_email,employment_status", *lines])
+    create_response = client.post(
+        "/api/jobs",
+        files={"file": ("test.csv", csv_body, "text/csv")},
+    )
+    assert create_response.status_code == 201
+    job_id = create_response.json()["job_id"]
+    rows = client.get(f"/api/jobs/{job_id}/rows", params={"offset": 0, "limit": 16}).json()
+    row_ids = [row["row_id"] for row in rows["rows"]]
+
+    def edit(index: int) -> int:
+        change = {"row_id": row_ids[index], "column": "first_name", "value": f"New{index}"}
+        response = client.post(f"/api/jobs/{job_id}/edits", json={"edits": [change]})
+        return response.status_code
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        statuses = list(pool.map(edit, range(16)))
+    assert statuses == [200] * 16
+
+    rows = client.get(f"/api/jobs/{job_id}/rows", params={"offset": 0, "limit": 16}).json()
+    assert [row["first_name"] for row in rows["rows"]] == [f"New{index}" for index in range(16)]
+    assert client.get(f"/api/jobs/{job_id}").json()["dataset_version"] == 17
+    job_store.clear_active_job()
+
+
+def test_active_job_registry_is_shared_through_storage(tmp_path, monkeypatch) -> None:
+    client = _make_client(tmp_path, monkeypatch)
+    csv_body = (
+        "employee_id,first_name,last_name,work_email,employment_status\n"
+        "E10001,Ava,Nguyen,ava@company.com,active\n"
+    )
+    create_response = client.post(
+        "/api/jobs",
+        files={"file": ("test.csv", csv_body, "text/csv")},
+    )
+    job_id = create_response.json()["job_id"]
+
+    job_store.configure_job_store(tmp_path)
+    assert job_store.get_active_job().job_id == job_id
+    other_worker = _make_client(tmp_path, monkeypatch)
+    conflict = other_worker.post(
+        "/api/jobs",
+        files={"file": ("test.csv", csv_body, "text/csv")},
+    )
+    assert conflict.status_code == 409
+
+    assert other_worker.delete(f"/api/jobs/{job_id}").status_code == 204
+    assert client.post(
+        "/api/jobs",
+        files={"file": ("test.csv", csv_body, "text/csv")},
+    ).status_code == 201
+    job_store.clear_active_job()
+
+
+def test_paged_reads_stay_consistent_during_edits(tmp_path, monkeypatch) -> None:
+    client = _make_client(tmp_path, monkeypatch)
+    lines = [
+        f"E{10000 + index},Name{index},Last,e{index}@company.com,active" for index in range(2500)
+    ]
+    csv_body = "\n".join(["employee_id,first_name,last_name,work_email,employment_status", *lines])
+    create_response = client.post(
+        "/api/jobs",
+        files={"file": ("test.csv", csv_body, "text/csv")},
+    )
+    assert create_response.status_code == 201
+    job_id = create_response.json()["job_id"]
+    rows = client.get(f"/api/jobs/{job_id}/rows", params={"offset": 0, "limit": 40}).json()
+    row_ids = [row["row_id"] for row in rows["rows"]]
+
+    def edit(index: int) -> int:
+        value = "X" * (index % 7 + 1)
+        change = {"row_id": row_ids[index], "column": "first_name", "value": value}
+        response = client.post(f"/api/jobs/{job_id}/edits", json={"edits": [change]})
+        return response.status_code
+
+    def read(index: int) -> bool:
+        offset = 1000 + (index % 3) * 700
+        response = client.get(
+            f"/api/jobs/{job_id}/rows", params={"offset": offset, "limit": 5}
+        )
+        assert response.status_code == 200
+        expected = [f"E{10000 + offset + step}" for step in range(5)]
+        return [row["employee_id"] for row in response.json()["rows"]] == expected
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        edits = [pool.submit(edit, index) for index in range(40)]
+        reads = [pool.submit(read, index) for index in range(60)]
+        assert [future.result() for future in edits] == [200] * 40
+        assert all(future.result() for future in reads)
+
+    working_path = working_csv_path(tmp_path, job_id)
+    index = load_row_index(working_path, working_path.stat())
+    assert index is not None
+    assert index.offsets == build_row_index(working_path).offsets
+    job_store.clear_active_job()
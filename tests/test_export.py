@@ -1,6 +1,9 @@
 import importlib
+import io
+import json
 
 from fastapi.testclient import TestClient
+from openpyxl import load_workbook
 
 import app.core.config as config
 from app.core import job_store
@@ -33,7 +36,83 @@ def test_export_returns_working_csv(tmp_path, monkeypatch) -> None:
     working_path = (
         tmp_path / "jobs" / job_id / "working" / "working.csv"
     )
-    assert export_response.text == working_path.read_text(encoding="utf-8")
+    assert export_response.content == working_path.read_bytes()
+    job_store.clear_active_job()
+
+
+def test_export_supports_etag_and_range(tmp_path, monkeypatch) -> None:
+    client = _make_client(tmp_path, monkeypatch)
+    csv_body = (
+        "employee_id,first_name,last_name,work_email,employment_status\n"
+        "E10001,Ava,Nguyen,ava@company.com,active\n"
+    )
+    create_response = client.post(
+        "/api/jobs",
+        files={"file": ("test.csv", csv_body, "text/csv")},
+    )
+    assert create_response.status_code == 201
+    job_id = create_response.json()["job_id"]
+    working_bytes = (tmp_path / "jobs" / job_id / "working" / "working.csv").read_bytes()
+
+    export_response = client.get(
+        f"/api/jobs/{job_id}/export", headers={"Accept-Encoding": "identity"}
+    )
+    etag = export_response.headers["etag"]
+    assert export_response.headers["accept-ranges"] == "bytes"
+
+    not_modified = client.get(
+        f"/api/jobs/{job_id}/export",
+        headers={"Accept-Encoding": "identity", "If-None-Match": etag},
+    )
+    assert not_modified.status_code == 304
+
+    partial = client.get(
+        f"/api/jobs/{job_id}/export",
+        headers={"Accept-Encoding": "identity", "Range": "bytes=4-9"},
+    )
+    assert partial.status_code == 206
+    assert partial.content == working_bytes[4:10]
+    assert partial.headers["content-range"] == f"bytes 4-9/{len(working_bytes)}"
+
+    unsatisfiable = client.get(
+        f"/api/jobs/{job_id}/export",
+        headers={"Accept-Encoding": "identity", "Range": f"bytes={len(working_bytes)}-"},
+    )
+    assert unsatisfiable.status_code == 416
+    job_store.clear_active_job()
+
+
+def test_export_gzip_is_cached_between_downloads(tmp_path, monkeypatch) -> None:
+    client = _make_client(tmp_path, monkeypatch)
+    csv_body = (
+        "employee_id,first_name,last_name,work_email,employment_status\n"
+        "E10001,Ava,Nguyen,ava@company.com,active\n"
+    )
+    create_response = client.post(
+        "/api/jobs",
+        files={"file": ("test.csv", csv_body, "text/csv")},
+    )
+    assert create_response.status_code == 201
+    job_id = create_response.json()["job_id"]
+    working_path = tmp_path / "jobs" / job_id / "working" / "working.csv"
+
+    first = client.get(f"/api/jobs/{job_id}/export", headers={"Accept-Encoding": "gzip"})
+    assert first.status_code == 200
+    assert first.headers["content-encoding"] == "gzip"
+    assert first.content == working_path.read_bytes()
+    cached = list((tmp_path / "jobs" / job_id / "exports").glob("output-*.csv.gz"))
+    assert len(cached) == 1
+
+    second = client.get(f"/api/jobs/{job_id}/export", headers={"Accept-Encoding": "gzip"})
+    assert second.headers["etag"] == first.headers["etag"]
+    assert list((tmp_path / "jobs" / job_id / "exports").glob("output-*.csv.gz")) == cached
+
+    cached[0].unlink()
+    third = client.get(f"/api/jobs/{job_id}/export", headers={"Accept-Encoding": "gzip"})
+    assert third.status_code == 200
+    assert third.content == working_path.read_bytes()
+    assert cached[0].exists()
+    assert not list((tmp_path / "jobs" / job_id / "exports").glob("*.tmp"))
     job_store.clear_active_job()
 
 
@@ -55,3 +134,58 @@ def test_delete_job_removes_metadata(tmp_path, monkeypatch) -> None:
 
     get_response = client.get(f"/api/jobs/{job_id}")
     assert get_response.status_code == 404
+
+
+def test_export_formats_drop_row_id_and_apply_filters(tmp_path, monkeypatch) -> None:
+    client = _make_client(tmp_path, monkeypatch)
+    csv_body = (
+        "employee_id,first_name,last_name,work_email,employment_status\n"
+        "E10001,Ava,Nguyen,ava@company.com,active\n"
+        "E10002,Noah,Patel,not-an-email,active\n"
+        "E10003,Mia,Nguyen,mia@company.com,terminated\n"
+    )
+    create_response = client.post(
+        "/api/jobs",
+        files={"file": ("test.csv", csv_body, "text/csv")},
+    )
+    assert create_response.status_code == 201
+    job_id = create_response.json()["job_id"]
+
+    canonical = client.get(f"/api/jobs/{job_id}/export", params={"format": "canonical_csv"})
+    assert canonical.status_code == 200
+    lines = canonical.text.splitlines()
+    assert lines[0] == "employee_id,first_name,last_name,employment_status,work_email"
+    assert len(lines) == 4
+
+    filters = '[{"column":"last_name","op":"eq","value":"Nguyen"}]'
+    ndjson = client.get(
+        f"/api/jobs/{job_id}/export",
+        params={"format": "ndjson", "filters": filters},
+    )
+    assert ndjson.status_code == 200
+    records = [json.loads(line) for line in ndjson.text.splitlines()]
+    assert [record["employee_id"] for record in records] == ["E10001", "E10003"]
+    assert "row_id" not in records[0]
+
+    with_issues = client.get(
+        f"/api/jobs/{job_id}/export",
+        params={"format": "ndjson", "issues": "with"},
+    )
+    records = [json.loads(line) for line in with_issues.text.splitlines()]
+    assert [record["employee_id"] for record in records] == ["E10002"]
+
+    xlsx = client.get(
+        f"/api/jobs/{job_id}/export",
+        params={"format": "xlsx", "issues": "without"},
+    )
+    assert xlsx.status_code == 200
+    workbook = load_workbook(io.BytesIO(xlsx.content), read_only=True)
+    values = list(workbook.worksheets[0].iter_rows(values_only=True))
+    assert values[0][0] == "employee_id"
+    assert [row[0] for row in values[1:]] == ["E10001", "E10003"]
+    assert list((tmp_path / "jobs" / job_id / "exports").glob("*.tmp")) == []
+
+    invalid = client.get(f"/api/jobs/{job_id}/export", params={"format": "pdf"})
+    assert invalid.status_code == 422
+    assert invalid.json()["error"] == "invalid_export"
+    job_store.clear_active_job()
@@ -0,0 +1,87 @@
+import importlib
+
+from fastapi.testclient import TestClient
+
+import app.core.config as config
+from app.core import job_store
+
+
+def _make_client(tmp_path, monkeypatch) -> TestClient:
+    monkeypatch.setenv("DATABUDDY_STORAGE_ROOT", str(tmp_path))
+    importlib.reload(config)
+    import app.main as main
+
+    importlib.reload(main)
+    return TestClient(main.app)
+
+
+def _statuses(client: TestClient, job_id: str) -> list[str]:
+    response = client.get(f"/api/jobs/{job_id}/rows", params={"offset": 0, "limit": 10})
+    return [row["employment_status"] for row in response.json()["rows"]]
+
+
+def test_undo_and_redo_bulk_map(tmp_path, monkeypatch) -> None:
+    client = _make_client(tmp_path, monkeypatch)
+    csv_body = (
+        "employee_id,first_name,last_name,work_email,employment_status\n"
+        "E10001,Ava,Nguyen,ava@company.com,Active\n"
+        "E10002,Noah,Patel,noah@company.com,Former\n"
+        "E10003,Mia,Chen,mia@company.com,terminated\n"
+    )
+    create_response = client.post(
+        "/api/jobs",
+        files={"file": ("test.csv", csv_body, "text/csv")},
+    )
+    assert create_response.status_code == 201
+    job_id = create_response.json()["job_id"]
+    original_issues = create_response.json()["issues"]
+    assert len(original_issues) == 1
+
+    nothing = client.post(f"/api/jobs/{job_id}/undo")
+    assert nothing.status_code == 409
+    assert nothing.json()["error"] == "nothing_to_undo"
+
+    bulk_response = client.post(
+        f"/api/jobs/{job_id}/bulk",
+        json={
+            "action_type": "map",
+            "column": "employment_status",
+            "params": {"mapping": {}, "default": "active"},
+        },
+    )
+    assert bulk_response.status_code == 200
+    assert bulk_response.json()["issues"] == []
+    assert _statuses(client, job_id) == ["active", "active", "active"]
+
+    undo_response = client.post(
+        f"/api/jobs/{job_id}/undo", headers={"If-Match": bulk_response.headers["etag"]}
+    )
+    assert undo_response.status_code == 200
+    payload = undo_response.json()
+    assert payload["history"] == {
+        "action": "bulk",
+        "cells": 3,
+        "can_undo": False,
+        "can_redo": True,
+    }
+    assert payload["dataset_version"] == 3
+    assert payload["issues"] == original_issues
+    assert _statuses(client, job_id) == ["Active", "Former", "terminated"]
+
+    redo_response = client.post(f"/api/jobs/{job_id}/redo")
+    assert redo_response.status_code == 200
+    assert redo_response.json()["history"]["can_redo"] is False
+    assert _statuses(client, job_id) == ["active", "active", "active"]
+
+    client.post(f"/api/jobs/{job_id}/undo")
+    rows = client.get(f"/api/jobs/{job_id}/rows", params={"offset": 0, "limit": 1}).json()
+    edit = {"row_id": rows["rows"][0]["row_id"], "column": "employment_status", "value": "x"}
+    client.post(f"/api/jobs/{job_id}/edits", json={"edits": [edit]})
+    assert client.post(f"/api/jobs/{job_id}/redo").status_code == 409
+    assert client.post(f"/api/jobs/{job_id}/undo").status_code == 200
+    assert _statuses(client, job_id) == ["Active", "Former", "terminated"]
+    facets = client.get(
+        f"/api/jobs/{job_id}/facets", params={"columns": "employment_status"}
+    ).json()
+    assert facets["columns"]["employment_status"]["distinct_count"] == 3
+    job_store.clear_active_job()
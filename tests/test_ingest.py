@@ -4,6 +4,7 @@ from fastapi.testclient import TestClient
 
 import app.core.config as config
 from app.core import job_store
+from app.rows.index import load_row_index
 
 
 def _make_client(tmp_path, monkeypatch) -> TestClient:
@@ -61,3 +62,335 @@ def test_unknown_columns_are_dropped(tmp_path, monkeypatch) -> None:
     assert payload["dataset"]["unknown_columns"] == ["mystery"]
     assert payload["dataset"]["total_columns"] == 2
     job_store.clear_active_job()
+
+
+def test_row_limit_comes_from_settings(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("DATABUDDY_MAX_ROWS", "2")
+    client = _make_client(tmp_path, monkeypatch)
+    csv_body = "employee_id,first_name\nE1,Ava\nE2,Noah\nE3,Mia\n"
+    response = client.post(
+        "/api/jobs",
+        files={"file": ("test.csv", csv_body, "text/csv")},
+    )
+
+    assert response.status_code == 422
+    payload = response.json()
+    assert payload["message"] == "Upload rejected: dataset exceeds the 2 row limit."
+    assert payload["details"]["max_rows"] == 2
+    assert list((tmp_path / "jobs").iterdir()) == []
+
+
+def test_chunked_upload_resumes_and_creates_job(tmp_path, monkeypatch) -> None:
+    import hashlib
+
+    client = _make_client(tmp_path, monkeypatch)
+    lines = ["employee_id,first_name,last_name,work_email,employment_status"]
+    lines += [f"E{index:05d},Ava,Nguyen,ava{index}@company.com,active" for index in range(60)]
+    body = ("\n".join(lines) + "\n").encode("utf-8")
+    chunk_size = 1024
+
+    created = client.post(
+        "/api/uploads",
+        json={"filename": "census.csv", "total_bytes": len(body), "chunk_size": chunk_size},
+    )
+    assert created.status_code == 201
+    upload_id = created.json()["upload_id"]
+    chunks = [body[start : start + chunk_size] for start in range(0, len(body), chunk_size)]
+    assert created.json()["chunk_count"] == len(chunks) > 1
+
+    def put(index: int, data: bytes, checksum: str | None = None):
+        return client.put(
+            f"/api/uploads/{upload_id}/chunks/{index}",
+            content=data,
+            headers={"X-Chunk-SHA256": checksum or hashlib.sha256(data).hexdigest()},
+        )
+
+    assert put(0, chunks[0], checksum="0" * 64).status_code == 422
+    assert put(0, chunks[0]).status_code == 200
+    incomplete = client.post(f"/api/uploads/{upload_id}/complete")
+    assert incomplete.status_code == 409
+    assert incomplete.json()["details"]["missing_chunks"] == list(range(1, len(chunks)))
+
+    for index in reversed(range(1, len(chunks))):
+        assert put(index, chunks[index]).status_code == 200
+    status_response = client.get(f"/api/uploads/{upload_id}")
+    assert status_response.json()["complete"] is True
+
+    completed = client.post(f"/api/uploads/{upload_id}/complete")
+    assert completed.status_code == 201
+    payload = completed.json()
+    assert payload["dataset"]["total_rows"] == 60
+    original = tmp_path / "jobs" / payload["job_id"] / "original" / "census.csv"
+    assert original.read_bytes() == body
+    assert client.get(f"/api/uploads/{upload_id}").status_code == 404
+
+    job_store.clear_active_job()
+
+
+def test_chunked_upload_rejects_oversized_session(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("DATABUDDY_MAX_BYTES", "2048")
+    client = _make_client(tmp_path, monkeypatch)
+
+    response = client.post(
+        "/api/uploads", json={"filename": "census.csv", "total_bytes": 4096}
+    )
+
+    assert response.status_code == 413
+    assert response.json()["details"]["reason"] == "file_too_large"
+
+    job_store.clear_active_job()
+
+
+def test_identical_reupload_is_served_from_ingest_cache(tmp_path, monkeypatch) -> None:
+    client = _make_client(tmp_path, monkeypatch)
+    csv_body = (
+        "employee_id,first_name,last_name,work_email,employment_status\n"
+        "E10001,Ava,Nguyen,ava@company.com,active\n"
+        "E10002,Ben,Lee,not-an-email,active\n"
+    )
+    first = client.post("/api/jobs", files={"file": ("test.csv", csv_body, "text/csv")})
+    assert first.status_code == 201
+    job_id = first.json()["job_id"]
+    rows = client.get(f"/api/jobs/{job_id}/rows", params={"offset": 0, "limit": 2}).json()
+    edit = {"row_id": rows["rows"][1]["row_id"], "column": "work_email", "value": "b@x.com"}
+    assert client.post(f"/api/jobs/{job_id}/edits", json={"edits": [edit]}).status_code == 200
+    assert client.delete(f"/api/jobs/{job_id}").status_code == 204
+
+    second = client.post("/api/jobs", files={"file": ("again.csv", csv_body, "text/csv")})
+
+    assert second.status_code == 201
+    payload = second.json()
+    assert payload["job_id"] != job_id
+    assert payload["dataset"] == first.json()["dataset"]
+    assert payload["issues"] == first.json()["issues"]
+    reloaded = client.get(
+        f"/api/jobs/{payload['job_id']}/rows", params={"offset": 0, "limit": 2}
+    ).json()
+    assert reloaded["rows"][1]["work_email"] == "not-an-email"
+    working_path = tmp_path / "jobs" / payload["job_id"] / "working" / "working.csv"
+    assert working_path.stat().st_nlink == 2
+    metrics = client.get("/metrics").text
+    assert 'databuddy_ingest_cache_lookups_total{result="hit"}' in metrics
+
+    job_store.clear_active_job()
+
+
+def test_compressed_uploads_stream_with_decompressed_limit(tmp_path, monkeypatch) -> None:
+    import gzip
+    import io
+    import zipfile
+
+    monkeypatch.setenv("DATABUDDY_MAX_DECOMPRESSED_BYTES", "4096")
+    client = _make_client(tmp_path, monkeypatch)
+    csv_body = (
+        "employee_id,first_name,last_name,work_email,employment_status\n"
+        "E10001,Ava,Nguyen,ava@company.com,active\n"
+    ).encode("utf-8")
+
+    gz_response = client.post(
+        "/api/jobs",
+        files={"file": ("census.csv.gz", gzip.compress(csv_body), "application/gzip")},
+    )
+    assert gz_response.status_code == 201
+    assert gz_response.json()["dataset"]["total_rows"] == 1
+    assert client.delete(f"/api/jobs/{gz_response.json()['job_id']}").status_code == 204
+
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as zipped:
+        zipped.writestr("census.csv", csv_body)
+        zipped.writestr("notes.txt", "extra")
+    zip_response = client.post(
+        "/api/jobs",
+        files={"file": ("census.zip", archive.getvalue(), "application/zip")},
+    )
+    assert zip_response.status_code == 422
+    assert zip_response.json()["details"]["reason"] == "invalid_archive"
+
+    plain = io.BytesIO()
+    with zipfile.ZipFile(plain, "w") as zipped:
+        zipped.writestr("census.csv", csv_body)
+    encrypted = bytearray(plain.getvalue())
+    central = encrypted.index(b"PK\x01\x02")
+    encrypted[6] |= 0x1
+    encrypted[central + 8] |= 0x1
+    encrypted_response = client.post(
+        "/api/jobs",
+        files={"file": ("census.zip", bytes(encrypted), "application/zip")},
+    )
+    assert encrypted_response.status_code == 422
+    assert encrypted_response.json()["details"]["reason"] == "invalid_archive"
+
+    bomb = gzip.compress(csv_body + b"E10002,Ben,Lee,ben@company.com,active\n" * 200)
+    bomb_response = client.post(
+        "/api/jobs", files={"file": ("bomb.csv.gz", bomb, "application/gzip")}
+    )
+    assert len(bomb) < 4096
+    assert bomb_response.status_code == 413
+    assert bomb_response.json()["details"] == {
+        "reason": "decompressed_too_large",
+        "max_decompressed_bytes": 4096,
+    }
+    assert job_store.get_active_job() is None
+
+    job_store.clear_active_job()
+
+
+def test_append_file_adds_rows_and_validates_only_new_rows(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("DATABUDDY_MAX_ROWS", "4")
+    client = _make_client(tmp_path, monkeypatch)
+    first_body = (
+        "employee_id,first_name,last_name,work_email,employment_status\n"
+        "E10001,Ava,Nguyen,bad-email,active\n"
+        "E10002,Ben,Lee,ben@company.com,active\n"
+    )
+    created = client.post("/api/jobs", files={"file": ("part1.csv", first_body, "text/csv")})
+    assert created.status_code == 201
+    job_id = created.json()["job_id"]
+    working_path = tmp_path / "jobs" / job_id / "working" / "working.csv"
+    assert working_path.stat().st_nlink == 2
+    cached_path = next((tmp_path / "ingest_cache").glob("*/working.csv"))
+    cached_bytes = cached_path.read_bytes()
+
+    unrelated = client.post(
+        f"/api/jobs/{job_id}/append",
+        files={"file": ("other.csv", "badge,locker\n7,12\n", "text/csv")},
+    )
+    assert unrelated.status_code == 422
+    assert unrelated.json()["details"]["reason"] == "no_matching_columns"
+
+    second_body = (
+        "last_name,first_name,Employee_ID,work_email,Badge\n"
+        "Diaz,Cam,E10003,cam@company.com,7\n"
+        "Eze,,E10004,not-an-email,8\n"
+    )
+    stale = client.post(
+        f"/api/jobs/{job_id}/append",
+        files={"file": ("part2.csv", second_body, "text/csv")},
+        headers={"If-Match": f'"{job_id}-v9"'},
+    )
+    assert stale.status_code == 412
+
+    response = client.post(
+        f"/api/jobs/{job_id}/append",
+        files={"file": ("part2.csv", second_body, "text/csv")},
+        headers={"If-Match": created.headers["etag"]},
+    )
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["dataset_version"] == 2
+    assert payload["dataset"]["total_rows"] == 4
+    assert payload["appended"]["rows"] == 2
+    assert payload["appended"]["unknown_columns"] == ["Badge"]
+    assert payload["appended"]["missing_columns"] == ["employment_status"]
+    assert cached_path.read_bytes() == cached_bytes
+    assert working_path.stat().st_nlink == 1
+    assert [(issue["row_number"], issue["type"]) for issue in payload["issues"]] == [
+        (1, "invalid_email"),
+        (4, "missing_required"),
+        (4, "invalid_email"),
+    ]
+    rows = client.get(f"/api/jobs/{job_id}/rows", params={"offset": 2, "limit": 5}).json()
+    assert rows["total_rows"] == 4
+    assert [row["employee_id"] for row in rows["rows"]] == ["E10003", "E10004"]
+    assert rows["rows"][0]["employment_status"] is None
+    facets = client.get(
+        f"/api/jobs/{job_id}/facets", params={"columns": "employment_status"}
+    ).json()
+    assert facets["columns"]["employment_status"]["null_count"] == 2
+
+    before = working_path.read_bytes()
+    over_limit = client.post(
+        f"/api/jobs/{job_id}/append",
+        files={"file": ("part3.csv", "employee_id\nE10005\n", "text/csv")},
+    )
+    assert over_limit.status_code == 422
+    assert over_limit.json()["details"]["reason"] == "too_many_rows"
+    assert working_path.read_bytes() == before
+    assert load_row_index(working_path, working_path.stat()) is not None
+    assert not list(working_path.parent.glob("*.tmp"))
+
+    job_store.clear_active_job()
+
+
+def _workbook_bytes(sheets: dict[str, list[list[object]]]) -> bytes:
+    import io
+
+    from openpyxl import Workbook
+
+    workbook = Workbook()
+    workbook.remove(workbook.active)
+    for name, rows in sheets.items():
+        sheet = workbook.create_sheet(name)
+        for row in rows:
+            sheet.append(row)
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+
+def test_xlsx_sheet_selection_and_parallel_merge(tmp_path, monkeypatch) -> None:
+    import app.ingest.ingest as ingest
+
+    monkeypatch.setattr(ingest, "PARALLEL_SHEETS_MIN_BYTES", 0)
+    client = _make_client(tmp_path, monkeypatch)
+    body = _workbook_bytes(
+        {
+            "North": [
+                ["employee_id", "first_name", "last_name", "work_email"],
+                ["E1", "Ava", "Nguyen", "ava@company.com"],
+                ["E2", "Ben", "Lee", "bad-email"],
+            ],
+            "Notes": [["generated by payroll"]],
+            "South": [
+                ["last_name", "employee_id", "first_name", "hire_date", "Site"],
+                ["Diaz", "E3", "Cam", "2024-03-01", "Austin"],
+            ],
+        }
+    )
+    xlsx_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+    missing = client.post(
+        "/api/jobs", files={"file": ("pay.xlsx", body, xlsx_type)}, data={"sheet": "West"}
+    )
+    assert missing.status_code == 422
+    assert missing.json()["details"]["available_sheets"] == ["North", "Notes", "South"]
+
+    single = client.post(
+        "/api/jobs", files={"file": ("pay.xlsx", body, xlsx_type)}, data={"sheet": "South"}
+    )
+    assert single.status_code == 201
+    assert single.json()["dataset"]["total_rows"] == 1
+    assert single.json()["dataset"]["sheets"] == [
+        {"sheet": "South", "first_row_number": 1, "row_count": 1}
+    ]
+    assert client.delete(f"/api/jobs/{single.json()['job_id']}").status_code == 204
+
+    merged = client.post(
+        "/api/jobs", files={"file": ("pay.xlsx", body, xlsx_type)}, data={"sheet": "*"}
+    )
+
+    assert merged.status_code == 201
+    dataset = merged.json()["dataset"]
+    assert dataset["total_rows"] == 3
+    assert dataset["canonical_columns"] == [
+        "employee_id",
+        "first_name",
+        "last_name",
+        "hire_date",
+        "work_email",
+    ]
+    assert dataset["unknown_columns"] == ["Site"]
+    assert dataset["sheets"] == [
+        {"sheet": "North", "first_row_number": 1, "row_count": 2},
+        {"sheet": "South", "first_row_number": 3, "row_count": 1},
+    ]
+    assert dataset["skipped_sheets"] == ["Notes"]
+    assert [issue["row_number"] for issue in merged.json()["issues"]] == [2]
+    job_id = merged.json()["job_id"]
+    rows = client.get(f"/api/jobs/{job_id}/rows", params={"offset": 0, "limit": 5}).json()
+    assert [row["employee_id"] for row in rows["rows"]] == ["E1", "E2", "E3"]
+    assert rows["rows"][2]["hire_date"] == "2024-03-01"
+    assert rows["rows"][0]["hire_date"] is None
+
+    job_store.clear_active_job()
@@ -0,0 +1,131 @@
+import importlib
+
+from fastapi.testclient import TestClient
+
+import app.core.config as config
+from app.core import job_store
+
+
+def _make_client(tmp_path, monkeypatch) -> TestClient:
+    monkeypatch.setenv("DATABUDDY_STORAGE_ROOT", str(tmp_path))
+    importlib.reload(config)
+    import app.main as main
+
+    importlib.reload(main)
+    return TestClient(main.app)
+
+
+def test_server_timing_reports_pipeline_stages(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("DATABUDDY_TIMING", "1")
+    client = _make_client(tmp_path, monkeypatch)
+    csv_body = (
+        "employee_id,first_name,last_name,work_email,employment_status\n"
+        "E10001,Ava,Nguyen,ava@company.com,active\n"
+        "E10002,Noah,Patel,noah@company.com,active\n"
+    )
+    response = client.post(
+        "/api/jobs",
+        files={"file": ("test.csv", csv_body, "text/csv")},
+    )
+    assert response.status_code == 201
+    server_timing = response.headers["server-timing"]
+    for stage in ("upload_save", "ingest", "validate", "json_encode", "total"):
+        assert f"{stage};dur=" in server_timing
+    assert 'ingest;dur=' in server_timing and "rows=2" in server_timing
+
+    timings = client.get("/api/timings").json()
+    assert timings["enabled"] is True
+    assert timings["stages"]["validate"]["rows"] >= 2
+    job_store.clear_active_job()
+
+
+def test_server_timing_is_off_by_default(tmp_path, monkeypatch) -> None:
+    monkeypatch.delenv("DATABUDDY_TIMING", raising=False)
+    client = _make_client(tmp_path, monkeypatch)
+    response = client.get("/api/health")
+    assert "server-timing" not in response.headers
+
+
+def test_metrics_endpoint_reports_latency_and_counters(tmp_path, monkeypatch) -> None:
+    client = _make_client(tmp_path, monkeypatch)
+    csv_body = (
+        "employee_id,first_name,last_name,work_email,employment_status\n"
+        "E10001,Ava,Nguyen,not-an-email,active\n"
+    )
+    create_response = client.post(
+        "/api/jobs",
+        files={"file": ("test.csv", csv_body, "text/csv")},
+    )
+    assert create_response.status_code == 201
+    job_id = create_response.json()["job_id"]
+    client.get(f"/api/jobs/{job_id}/rows", params={"offset": 0, "limit": 1})
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert (
+        'databuddy_request_duration_seconds_count{method="GET",'
+        'route="/api/jobs/{job_id}/rows",status="200"}'
+    ) in body
+    assert 'route="/api/jobs",status="201"' in body
+    assert "databuddy_rows_ingested_total" in body
+    assert 'databuddy_validation_issues_total{type="invalid_email"}' in body
+    assert "databuddy_active_jobs 1" in body
+    assert "databuddy_storage_bytes" in body
+
+    def issue_total() -> str:
+        metric = 'databuddy_validation_issues_total{type="invalid_email"}'
+        text = client.get("/metrics").text
+        return next(line for line in text.splitlines() if line.startswith(metric))
+
+    before = issue_total()
+    row_id = create_response.json()["issues"][0]["row_id"]
+    edit = {"row_id": row_id, "column": "last_name", "value": "Tran"}
+    assert client.post(f"/api/jobs/{job_id}/edits", json={"edits": [edit]}).status_code == 200
+    assert issue_total() == before
+    job_store.clear_active_job()
+
+
+def test_profile_header_writes_profile_to_job_storage(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("DATABUDDY_PROFILING", "1")
+    client = _make_client(tmp_path, monkeypatch)
+    csv_body = (
+        "employee_id,first_name,last_name,work_email,employment_status\n"
+        "E10001,Ava,Nguyen,ava@company.com,Active\n"
+    )
+    create_response = client.post(
+        "/api/jobs",
+        files={"file": ("test.csv", csv_body, "text/csv")},
+    )
+    assert create_response.status_code == 201
+    job_id = create_response.json()["job_id"]
+
+    unprofiled = client.post(
+        f"/api/jobs/{job_id}/bulk",
+        json={
+            "action_type": "map",
+            "column": "employment_status",
+            "params": {"mapping": {"Active": "active"}},
+        },
+    )
+    assert unprofiled.status_code == 200
+    assert "x-databuddy-profile-id" not in unprofiled.headers
+
+    profiled_response = client.post(
+        f"/api/jobs/{job_id}/bulk",
+        json={
+            "action_type": "map",
+            "column": "employment_status",
+            "params": {"mapping": {"Active": "active"}},
+        },
+        headers={"X-Databuddy-Profile": "1"},
+    )
+    assert profiled_response.status_code == 200
+    profile_id = profiled_response.headers["x-databuddy-profile-id"]
+    profile_dir = tmp_path / "jobs" / job_id / "profiles"
+    assert (profile_dir / f"{profile_id}.prof").exists()
+    report = (profile_dir / f"{profile_id}.txt").read_text(encoding="utf-8")
+    assert "top allocations:" in report
+    assert "apply_bulk_map" in report
+    job_store.clear_active_job()
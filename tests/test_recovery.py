@@ -0,0 +1,98 @@
+import importlib
+import os
+import time
+
+from fastapi.testclient import TestClient
+
+import app.core.config as config
+from app.core import job_store
+from app.core.locks import job_lock
+from app.core.recovery import recover_jobs
+
+
+def _make_client(tmp_path, monkeypatch) -> TestClient:
+    monkeypatch.setenv("DATABUDDY_STORAGE_ROOT", str(tmp_path))
+    importlib.reload(config)
+    import app.main as main
+
+    importlib.reload(main)
+    return TestClient(main.app)
+
+
+def test_startup_recovers_active_job_and_cleans_up(tmp_path, monkeypatch) -> None:
+    client = _make_client(tmp_path, monkeypatch)
+    csv_body = (
+        "employee_id,first_name,last_name,work_email,employment_status\n"
+        "E10001,,Nguyen,ava@company.com,active\n"
+        "E10002,Noah,Patel,noah@company.com,active\n"
+    )
+    create_response = client.post(
+        "/api/jobs",
+        files={"file": ("test.csv", csv_body, "text/csv")},
+    )
+    assert create_response.status_code == 201
+    job_id = create_response.json()["job_id"]
+    job_root = tmp_path / "jobs" / job_id
+    issues_path = job_root / "validation" / "issues.json"
+    issues_path.write_bytes(issues_path.read_bytes()[:-5] + b"]")
+    stale_temp = job_root / "working" / "working.tmp"
+    stale_temp.write_text("half written", encoding="utf-8")
+    old = time.time() - 2 * 3600
+    os.utime(stale_temp, (old, old))
+    fresh_temp = job_root / "working" / "row_index.in-flight.tmp"
+    fresh_temp.write_text("being written", encoding="utf-8")
+    (job_root / "working" / "row_index.json").unlink()
+    (tmp_path / "jobs" / "job_crashed_upload" / "original").mkdir(parents=True)
+    job_store.clear_active_job()
+
+    with _make_client(tmp_path, monkeypatch) as restarted:
+        assert job_store.get_active_job().job_id == job_id
+        assert not stale_temp.exists()
+        assert fresh_temp.exists()
+        assert not (tmp_path / "jobs" / "job_crashed_upload").exists()
+
+        conflict = restarted.post(
+            "/api/jobs",
+            files={"file": ("other.csv", csv_body, "text/csv")},
+        )
+        assert conflict.status_code == 409
+        issues_response = restarted.get(f"/api/jobs/{job_id}/issues")
+        assert issues_response.status_code == 200
+        assert [issue["column"] for issue in issues_response.json()] == ["first_name"]
+        rows_response = restarted.get(
+            f"/api/jobs/{job_id}/rows", params={"offset": 1, "limit": 1}
+        )
+        assert rows_response.json()["rows"][0]["employee_id"] == "E10002"
+    job_store.clear_active_job()
+
+
+def test_startup_skips_job_with_truncated_working_file(tmp_path, monkeypatch) -> None:
+    client = _make_client(tmp_path, monkeypatch)
+    csv_body = (
+        "employee_id,first_name,last_name,work_email,employment_status\n"
+        "E10001,Ava,Nguyen,ava@company.com,active\n"
+        "E10002,Noah,Patel,noah@company.com,active\n"
+    )
+    create_response = client.post(
+        "/api/jobs",
+        files={"file": ("test.csv", csv_body, "text/csv")},
+    )
+    job_id = create_response.json()["job_id"]
+    working_path = tmp_path / "jobs" / job_id / "working" / "working.csv"
+    working_path.write_bytes(working_path.read_bytes()[:-10])
+    job_store.clear_active_job()
+
+    with _make_client(tmp_path, monkeypatch):
+        assert job_store.get_active_job() is None
+        assert working_path.exists()
+    job_store.clear_active_job()
+
+
+def test_recovery_skips_job_directory_held_by_new_upload(tmp_path, monkeypatch) -> None:
+    _make_client(tmp_path, monkeypatch)
+    with job_lock(tmp_path, "job_new", create=True) as acquired:
+        assert acquired
+        report = recover_jobs(tmp_path, warm=False)
+        assert report.skipped == ["job_new"]
+        assert (tmp_path / "jobs" / "job_new").is_dir()
+    job_store.clear_active_job()
@@ -84,3 +84,137 @@ def test_rows_filtering_applies_before_pagination(tmp_path, monkeypatch) -> None
     payload = second_page.json()
     assert len(payload["rows"]) == 10
     assert all(row["last_name"] == "Match" for row in payload["rows"])
+    job_store.clear_active_job()
+
+
+def test_large_rows_page_is_gzip_compressed(tmp_path, monkeypatch) -> None:
+    client = _make_client(tmp_path, monkeypatch)
+    rows = ["employee_id,first_name,last_name,work_email,employment_status"]
+    for i in range(50):
+        rows.append(f"E{10000+i},Ava,Nguyen,ava{i}@company.com,active")
+    csv_body = "\n".join(rows) + "\n"
+    create_response = client.post(
+        "/api/jobs",
+        files={"file": ("test.csv", csv_body, "text/csv")},
+    )
+    assert create_response.status_code == 201
+    job_id = create_response.json()["job_id"]
+
+    compressed = client.get(
+        f"/api/jobs/{job_id}/rows",
+        params={"offset": 0, "limit": 50},
+        headers={"Accept-Encoding": "gzip"},
+    )
+    assert compressed.status_code == 200
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert len(compressed.json()["rows"]) == 50
+
+    small = client.get(
+        f"/api/jobs/{job_id}/rows",
+        params={"offset": 0, "limit": 1},
+        headers={"Accept-Encoding": "gzip"},
+    )
+    assert "content-encoding" not in small.headers
+    job_store.clear_active_job()
+
+
+def test_rows_paging_uses_row_index_across_checkpoints(tmp_path, monkeypatch) -> None:
+    client = _make_client(tmp_path, monkeypatch)
+    rows = ["employee_id,first_name,last_name,work_email,employment_status"]
+    for i in range(2500):
+        rows.append(f'E{i},"Ava\nMulti",Nguyen,ava{i}@company.com,active')
+    csv_body = "\n".join(rows) + "\n"
+    create_response = client.post(
+        "/api/jobs",
+        files={"file": ("test.csv", csv_body, "text/csv")},
+    )
+    assert create_response.status_code == 201
+    job_id = create_response.json()["job_id"]
+    assert (tmp_path / "jobs" / job_id / "working" / "row_index.json").exists()
+
+    page = client.get(f"/api/jobs/{job_id}/rows", params={"offset": 998, "limit": 5})
+    payload = page.json()
+    assert payload["total_filtered"] == 2500
+    assert [row["employee_id"] for row in payload["rows"]] == [
+        "E998",
+        "E999",
+        "E1000",
+        "E1001",
+        "E1002",
+    ]
+    assert payload["rows"][0]["first_name"] == "Ava\nMulti"
+
+    row_id = payload["rows"][2]["row_id"]
+    edit_response = client.post(
+        f"/api/jobs/{job_id}/edits",
+        json={"edits": [{"row_id": row_id, "column": "first_name", "value": "A" * 50}]},
+    )
+    assert edit_response.status_code == 200
+    page = client.get(f"/api/jobs/{job_id}/rows", params={"offset": 2000, "limit": 1})
+    assert page.json()["rows"][0]["employee_id"] == "E2000"
+
+    (tmp_path / "jobs" / job_id / "working" / "row_index.json").unlink()
+    page = client.get(f"/api/jobs/{job_id}/rows", params={"offset": 2499, "limit": 10})
+    assert [row["employee_id"] for row in page.json()["rows"]] == ["E2499"]
+    empty = client.get(f"/api/jobs/{job_id}/rows", params={"offset": 3000, "limit": 10})
+    assert empty.json()["rows"] == []
+    job_store.clear_active_job()
+
+
+def test_facets_track_ingest_edits_and_bulk(tmp_path, monkeypatch) -> None:
+    client = _make_client(tmp_path, monkeypatch)
+    csv_body = (
+        "employee_id,first_name,last_name,work_email,employment_status,hire_date\n"
+        "E10001,Ava,Nguyen,ava@company.com,Active,2021-03-15\n"
+        "E10002,Noah,Patel,noah@company.com,Active,03/01/2019\n"
+        "E10003,Mia,Chen,mia@company.com,Former,\n"
+        "E10004,Leo,Diaz,leo@company.com,,2023-11-30\n"
+    )
+    response = client.post(
+        "/api/jobs",
+        files={"file": ("test.csv", csv_body, "text/csv")},
+    )
+    assert response.status_code == 201
+    job_id = response.json()["job_id"]
+
+    facets_response = client.get(
+        f"/api/jobs/{job_id}/facets",
+        params={"columns": "employment_status,hire_date"},
+    )
+    assert facets_response.status_code == 200
+    columns = facets_response.json()["columns"]
+    assert columns["employment_status"] == {
+        "null_count": 1,
+        "distinct_count": 2,
+        "top_values": [{"value": "Active", "count": 2}, {"value": "Former", "count": 1}],
+        "truncated": False,
+    }
+    assert columns["hire_date"]["min"] == "2019-03-01"
+    assert columns["hire_date"]["max"] == "2023-11-30"
+
+    rows = client.get(f"/api/jobs/{job_id}/rows", params={"offset": 0, "limit": 4}).json()
+    edit = {"row_id": rows["rows"][3]["row_id"], "column": "employment_status", "value": "Active"}
+    client.post(f"/api/jobs/{job_id}/edits", json={"edits": [edit]})
+    client.post(
+        f"/api/jobs/{job_id}/bulk",
+        json={
+            "action_type": "map",
+            "column": "employment_status",
+            "params": {"mapping": {"Active": "active", "Former": "terminated"}},
+        },
+    )
+    profile_path = tmp_path / "jobs" / job_id / "working" / "profile.json"
+    profile_mtime = profile_path.stat().st_mtime_ns
+    facets_response = client.get(
+        f"/api/jobs/{job_id}/facets", params={"columns": "employment_status"}
+    )
+    assert facets_response.json()["columns"]["employment_status"]["top_values"] == [
+        {"value": "active", "count": 3},
+        {"value": "terminated", "count": 1},
+    ]
+    assert facets_response.json()["columns"]["employment_status"]["null_count"] == 0
+    assert profile_path.stat().st_mtime_ns == profile_mtime
+
+    invalid_response = client.get(f"/api/jobs/{job_id}/facets", params={"columns": "salary"})
+    assert invalid_response.status_code == 422
+    job_store.clear_active_job()
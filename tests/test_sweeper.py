@@ -0,0 +1,76 @@
+import importlib
+import os
+import time
+
+from fastapi.testclient import TestClient
+
+import app.core.config as config
+from app.core import job_store
+
+
+def _make_client(tmp_path, monkeypatch) -> TestClient:
+    monkeypatch.setenv("DATABUDDY_STORAGE_ROOT", str(tmp_path))
+    importlib.reload(config)
+    import app.main as main
+
+    importlib.reload(main)
+    return TestClient(main.app)
+
+
+def _age_job(job_root, seconds: float) -> None:
+    stamp = time.time() - seconds
+    for path in [job_root, *job_root.rglob("*")]:
+        os.utime(path, (stamp, stamp))
+
+
+def test_sweeper_expires_idle_jobs_and_enforces_quota(tmp_path, monkeypatch) -> None:
+    from app.core.sweeper import sweep_storage
+
+    client = _make_client(tmp_path, monkeypatch)
+    csv_body = (
+        "employee_id,first_name,last_name,work_email,employment_status\n"
+        "E10001,Ava,Nguyen,ava@company.com,active\n"
+    )
+    create_response = client.post(
+        "/api/jobs",
+        files={"file": ("test.csv", csv_body, "text/csv")},
+    )
+    assert create_response.status_code == 201
+    job_id = create_response.json()["job_id"]
+    job_root = tmp_path / "jobs" / job_id
+    export_response = client.get(
+        f"/api/jobs/{job_id}/export", headers={"Accept-Encoding": "gzip"}
+    )
+    assert export_response.status_code == 200
+    stale_export = job_root / "exports" / "output.csv"
+    stale_export.write_text("old copy", encoding="utf-8")
+    old_stamp = time.time() - 60
+    os.utime(stale_export, (old_stamp, old_stamp))
+
+    abandoned = [tmp_path / "jobs" / f"job_old{index}" for index in range(3)]
+    for index, job in enumerate(abandoned):
+        (job / "working").mkdir(parents=True)
+        (job / "metadata.json").write_text("{}", encoding="utf-8")
+        (job / "working" / "working.csv").write_bytes(b"x" * 1000)
+        _age_job(job, 3600 * (index + 1))
+
+    active_bytes = sum(path.stat().st_size for path in job_root.rglob("*") if path.is_file())
+    quota = active_bytes - len("old copy") + 1500
+    report = sweep_storage(tmp_path, job_ttl_seconds=2.5 * 3600, quota_bytes=quota)
+    assert report.expired_jobs == ["job_old2"]
+    assert report.evicted_jobs == ["job_old1"]
+    assert report.stale_exports == 1
+    assert report.reclaimed_bytes >= 2000 + len("old copy")
+    assert not stale_export.exists()
+    assert list((job_root / "exports").glob("output-*.csv.gz"))
+    assert (tmp_path / "jobs" / "job_old0").exists()
+    assert job_store.get_active_job().job_id == job_id
+
+    _age_job(job_root, 7200)
+    monkeypatch.setattr(job_store, "_last_access", {})
+    report = sweep_storage(tmp_path, job_ttl_seconds=3600, quota_bytes=0)
+    assert job_id in report.expired_jobs
+    assert job_store.get_active_job() is None
+    metrics = client.get("/metrics").text
+    assert 'databuddy_jobs_evicted_total{reason="ttl"}' in metrics
+    job_store.clear_active_job()
@@ -105,6 +105,18 @@ def test_invalid_row_id_returns_422(tmp_path, monkeypatch) -> None:
     assert edit_response.status_code == 422
     payload = edit_response.json()
     assert payload["error"] == "invalid_edit"
+
+    for row_id, column, base_version in (
+        (5, "first_name", None),
+        (["E10001"], "first_name", 1),
+        ("E10001", ["first_name"], None),
+    ):
+        body = {"edits": [{"row_id": row_id, "column": column, "value": "Ava"}]}
+        if base_version is not None:
+            body["base_version"] = base_version
+        response = client.post(f"/api/jobs/{job_id}/edits", json=body)
+        assert response.status_code == 422
+        assert response.json()["error"] == "invalid_edit"
     job_store.clear_active_job()
 
 
@@ -253,3 +265,170 @@ def test_bulk_replace_mapping(tmp_path, monkeypatch) -> None:
     assert rows[0]["employment_status"] == "active"
     assert rows[1]["employment_status"] == "active"
     job_store.clear_active_job()
+
+
+def test_edit_revalidates_only_changed_cells_in_row_order(tmp_path, monkeypatch) -> None:
+    client = _make_client(tmp_path, monkeypatch)
+    csv_body = (
+        "employee_id,first_name,last_name,work_email,employment_status\n"
+        "E10001,,Nguyen,ava@company.com,paused\n"
+        "E10002,Noah,Patel,noah@company.com,active\n"
+        "E10003,,Kim,bad-email,active\n"
+    )
+    create_response = client.post(
+        "/api/jobs",
+        files={"file": ("test.csv", csv_body, "text/csv")},
+    )
+    assert create_response.status_code == 201
+    job_id = create_response.json()["job_id"]
+
+    rows_response = client.get(f"/api/jobs/{job_id}/rows", params={"offset": 0, "limit": 3})
+    row_id = rows_response.json()["rows"][1]["row_id"]
+    edit_response = client.post(
+        f"/api/jobs/{job_id}/edits",
+        json={"edits": [{"row_id": row_id, "column": "work_email", "value": "broken"}]},
+    )
+    assert edit_response.status_code == 200
+    issues = edit_response.json()["issues"]
+    assert [(issue["row_number"], issue["column"]) for issue in issues] == [
+        (1, "first_name"),
+        (1, "employment_status"),
+        (2, "work_email"),
+        (3, "first_name"),
+        (3, "work_email"),
+    ]
+    assert edit_response.json()["validation"]["error_count"] == 5
+    job_store.clear_active_job()
+
+
+def test_bulk_pipeline_applies_steps_in_one_pass(tmp_path, monkeypatch) -> None:
+    client = _make_client(tmp_path, monkeypatch)
+    csv_body = (
+        "employee_id,first_name,last_name,work_email,employment_status,hire_date\n"
+        'E10001,,," Ava.Nguyen@Company.com ",Active,03/15/2021\n'
+        "E10002,Noah,Patel,noah@company.com,TERMINATED,not a date\n"
+    )
+    create_response = client.post(
+        "/api/jobs",
+        files={"file": ("test.csv", csv_body, "text/csv")},
+    )
+    assert create_response.status_code == 201
+    job_id = create_response.json()["job_id"]
+    assert create_response.json()["validation"]["error_count"] == 2
+    steps = [
+        {"op": "trim", "column": "work_email"},
+        {"op": "case", "column": "work_email", "mode": "lower"},
+        {"op": "regex_replace", "column": "first_name", "pattern": "^$", "replacement": "?"},
+        {
+            "op": "split",
+            "column": "work_email",
+            "separator": "@",
+            "into": ["first_name", "last_name"],
+        },
+        {"op": "regex_replace", "column": "first_name", "pattern": r"\.", "replacement": " "},
+        {"op": "case", "column": "employment_status", "mode": "lower"},
+        {"op": "date_reformat", "column": "hire_date", "from": "%m/%d/%Y", "to": "%Y-%m-%d"},
+        {
+            "op": "set",
+            "column": "last_name",
+            "value": "Unknown",
+            "when": {"column": "employee_id", "op": "equals", "value": "E10001"},
+        },
+        {"op": "concat", "columns": ["first_name", "last_name"], "into": "first_name"},
+    ]
+
+    dry_run = client.post(
+        f"/api/jobs/{job_id}/bulk",
+        json={"action_type": "pipeline", "params": {"steps": steps}, "dry_run": True},
+    )
+    assert dry_run.status_code == 200
+    assert dry_run.json()["affected_rows"] == 2
+    assert dry_run.json()["dataset_version"] == 1
+    rows_response = client.get(f"/api/jobs/{job_id}/rows", params={"offset": 0, "limit": 2})
+    assert rows_response.json()["rows"][0]["first_name"] is None
+
+    bulk_response = client.post(
+        f"/api/jobs/{job_id}/bulk",
+        json={"action_type": "pipeline", "params": {"steps": steps}},
+    )
+    assert bulk_response.status_code == 200
+    payload = bulk_response.json()
+    assert payload["affected_rows"] == 2
+    assert payload["dataset_version"] == 2
+    assert payload["validation"]["error_count"] == 0
+    rows_response = client.get(f"/api/jobs/{job_id}/rows", params={"offset": 0, "limit": 2})
+    rows = rows_response.json()["rows"]
+    assert rows[0]["work_email"] == "ava.nguyen@company.com"
+    assert rows[0]["first_name"] == "ava nguyen Unknown"
+    assert rows[0]["last_name"] == "Unknown"
+    assert rows[0]["employment_status"] == "active"
+    assert rows[0]["hire_date"] == "2021-03-15"
+    assert rows[1]["first_name"] == "noah company.com"
+    assert rows[1]["hire_date"] == "not a date"
+
+    invalid_response = client.post(
+        f"/api/jobs/{job_id}/bulk",
+        json={"action_type": "pipeline", "params": {"steps": [{"op": "explode"}]}},
+    )
+    assert invalid_response.status_code == 422
+    assert invalid_response.json()["error"] == "invalid_bulk"
+    assert invalid_response.json()["details"] == {"step": 0, "op": "explode"}
+
+    bad_template = {
+        "op": "regex_replace",
+        "column": "first_name",
+        "pattern": "a",
+        "replacement": "\\9",
+    }
+    template_response = client.post(
+        f"/api/jobs/{job_id}/bulk",
+        json={"action_type": "pipeline", "params": {"steps": [bad_template]}},
+    )
+    assert template_response.status_code == 422
+    assert template_response.json()["error"] == "invalid_bulk"
+    assert not list((tmp_path / "jobs" / job_id / "working").glob("*.tmp"))
+    job_store.clear_active_job()
+
+
+def test_bulk_preview_predicts_without_writing(tmp_path, monkeypatch) -> None:
+    client = _make_client(tmp_path, monkeypatch)
+    csv_body = (
+        "employee_id,first_name,last_name,work_email,employment_status\n"
+        "E10001,Ava,Nguyen,ava@company.com,Active\n"
+        "E10002,Noah,Patel,noah@company.com,Former\n"
+        "E10003,Mia,Chen,mia@company.com,Former\n"
+        "E10004,Leo,Diaz,leo@company.com,On Leave\n"
+    )
+    create_response = client.post(
+        "/api/jobs",
+        files={"file": ("test.csv", csv_body, "text/csv")},
+    )
+    assert create_response.status_code == 201
+    job_id = create_response.json()["job_id"]
+    working_path = tmp_path / "jobs" / job_id / "working" / "working.csv"
+    before = working_path.read_bytes()
+
+    preview_response = client.post(
+        f"/api/jobs/{job_id}/bulk",
+        json={
+            "action_type": "map",
+            "column": "employment_status",
+            "preview": True,
+            "params": {
+                "mapping": {"active": "active", "Former": "terminated"},
+                "default": "On Leave?",
+            },
+            "case_insensitive": True,
+        },
+    )
+    assert preview_response.status_code == 200
+    payload = preview_response.json()
+    assert payload["affected_rows"] == 4
+    assert payload["keys"] == {"active": 1, "Former": 2}
+    assert payload["default_rows"] == 1
+    assert payload["samples"][0] == {"before": "Former", "after": "terminated", "rows": 2}
+    assert payload["issues_resolved"] == 2
+    assert payload["issues_introduced"] == 0
+    assert payload["dataset_version"] == 1
+    assert working_path.read_bytes() == before
+    job_store.clear_active_job()
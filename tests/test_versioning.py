@@ -0,0 +1,202 @@
+import importlib
+
+from fastapi.testclient import TestClient
+
+import app.core.config as config
+from app.core import job_store
+
+
+def _make_client(tmp_path, monkeypatch) -> TestClient:
+    monkeypatch.setenv("DATABUDDY_STORAGE_ROOT", str(tmp_path))
+    importlib.reload(config)
+    import app.main as main
+
+    importlib.reload(main)
+    return TestClient(main.app)
+
+
+def test_conditional_get_returns_304_until_edit(tmp_path, monkeypatch) -> None:
+    client = _make_client(tmp_path, monkeypatch)
+    csv_body = (
+        "employee_id,first_name,last_name,work_email,employment_status\n"
+        "E10001,,Nguyen,ava@company.com,active\n"
+    )
+    create_response = client.post(
+        "/api/jobs",
+        files={"file": ("test.csv", csv_body, "text/csv")},
+    )
+    assert create_response.status_code == 201
+    job_id = create_response.json()["job_id"]
+    assert create_response.json()["dataset_version"] == 1
+    etag = create_response.headers["etag"]
+
+    for path in (f"/api/jobs/{job_id}", f"/api/jobs/{job_id}/issues"):
+        response = client.get(path, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+    rows_response = client.get(
+        f"/api/jobs/{job_id}/rows",
+        params={"offset": 0, "limit": 1},
+        headers={"If-None-Match": etag},
+    )
+    assert rows_response.status_code == 304
+
+    rows_response = client.get(f"/api/jobs/{job_id}/rows", params={"offset": 0, "limit": 1})
+    row_id = rows_response.json()["rows"][0]["row_id"]
+    edit_response = client.post(
+        f"/api/jobs/{job_id}/edits",
+        json={"edits": [{"row_id": row_id, "column": "first_name", "value": "Ava"}]},
+    )
+    assert edit_response.status_code == 200
+    assert edit_response.json()["dataset_version"] == 2
+    assert edit_response.headers["etag"] != etag
+
+    refreshed = client.get(f"/api/jobs/{job_id}", headers={"If-None-Match": etag})
+    assert refreshed.status_code == 200
+    assert refreshed.json()["dataset_version"] == 2
+    job_store.clear_active_job()
+
+
+def test_if_match_rejects_stale_edits(tmp_path, monkeypatch) -> None:
+    client = _make_client(tmp_path, monkeypatch)
+    csv_body = (
+        "employee_id,first_name,last_name,work_email,employment_status\n"
+        "E10001,Ava,Nguyen,ava@company.com,active\n"
+    )
+    create_response = client.post(
+        "/api/jobs",
+        files={"file": ("test.csv", csv_body, "text/csv")},
+    )
+    assert create_response.status_code == 201
+    job_id = create_response.json()["job_id"]
+    etag = create_response.headers["etag"]
+
+    bulk_response = client.post(
+        f"/api/jobs/{job_id}/bulk",
+        json={
+            "action_type": "replace",
+            "column": "first_name",
+            "params": {"from": "Ava", "to": "Eva"},
+        },
+        headers={"If-Match": etag},
+    )
+    assert bulk_response.status_code == 200
+
+    stale_response = client.post(
+        f"/api/jobs/{job_id}/bulk",
+        json={
+            "action_type": "replace",
+            "column": "first_name",
+            "params": {"from": "Eva", "to": "Ava"},
+        },
+        headers={"If-Match": etag},
+    )
+    assert stale_response.status_code == 412
+    payload = stale_response.json()
+    assert payload["error"] == "version_mismatch"
+    assert payload["details"]["dataset_version"] == 2
+    job_store.clear_active_job()
+
+
+def test_base_version_merges_disjoint_edits_and_rejects_same_cell(tmp_path, monkeypatch) -> None:
+    client = _make_client(tmp_path, monkeypatch)
+    csv_body = (
+        "employee_id,first_name,last_name,work_email,employment_status\n"
+        "E10001,Ava,Nguyen,ava@company.com,active\n"
+        "E10002,Noah,Patel,noah@company.com,active\n"
+    )
+    create_response = client.post(
+        "/api/jobs",
+        files={"file": ("test.csv", csv_body, "text/csv")},
+    )
+    job_id = create_response.json()["job_id"]
+    rows = client.get(f"/api/jobs/{job_id}/rows", params={"offset": 0, "limit": 2}).json()
+    first, second = (row["row_id"] for row in rows["rows"])
+
+    def edit(row_id: str, value: str, base_version: int):
+        return client.post(
+            f"/api/jobs/{job_id}/edits",
+            json={
+                "base_version": base_version,
+                "edits": [{"row_id": row_id, "column": "first_name", "value": value}],
+            },
+        )
+
+    assert edit(first, "Eva", 1).status_code == 200
+    merged = edit(second, "Noel", 1)
+    assert merged.status_code == 200
+    assert merged.json()["dataset_version"] == 3
+
+    conflict = edit(first, "Ada", 1)
+    assert conflict.status_code == 409
+    assert conflict.json()["error"] == "edit_conflict"
+    assert conflict.json()["details"]["conflicts"] == [{"row_id": first, "column": "first_name"}]
+    assert conflict.json()["details"]["dataset_version"] == 3
+
+    working_path = tmp_path / "jobs" / job_id / "working" / "working.csv"
+    before = working_path.read_bytes()
+    before_stat = working_path.stat()
+    bulk = {
+        "action_type": "map",
+        "column": "first_name",
+        "params": {"mapping": {}, "default": "X"},
+    }
+    bulk_conflict = client.post(f"/api/jobs/{job_id}/bulk", json={**bulk, "base_version": 2})
+    assert bulk_conflict.status_code == 409
+    assert bulk_conflict.json()["details"]["conflict_count"] == 1
+    pipeline_conflict = client.post(
+        f"/api/jobs/{job_id}/bulk",
+        json={
+            "action_type": "pipeline",
+            "params": {"steps": [{"op": "case", "column": "first_name", "mode": "upper"}]},
+            "base_version": 2,
+        },
+    )
+    assert pipeline_conflict.status_code == 409
+    assert pipeline_conflict.json()["details"]["conflict_count"] == 1
+    assert working_path.read_bytes() == before
+    after_stat = working_path.stat()
+    assert (after_stat.st_ino, after_stat.st_mtime_ns) == (
+        before_stat.st_ino,
+        before_stat.st_mtime_ns,
+    )
+    bulk_response = client.post(f"/api/jobs/{job_id}/bulk", json={**bulk, "base_version": 3})
+    assert bulk_response.status_code == 200
+    assert bulk_response.json()["dataset_version"] == 4
+
+    assert edit(first, "Ada", 0).status_code == 422
+    job_store.clear_active_job()
+
+
+def test_torn_version_log_line_is_skipped(tmp_path, monkeypatch) -> None:
+    client = _make_client(tmp_path, monkeypatch)
+    csv_body = (
+        "employee_id,first_name,last_name,work_email,employment_status\n"
+        "E10001,Ava,Nguyen,ava@company.com,active\n"
+        "E10002,Noah,Patel,noah@company.com,active\n"
+    )
+    create_response = client.post(
+        "/api/jobs",
+        files={"file": ("test.csv", csv_body, "text/csv")},
+    )
+    job_id = create_response.json()["job_id"]
+    rows = client.get(f"/api/jobs/{job_id}/rows", params={"offset": 0, "limit": 2}).json()
+    first, second = (row["row_id"] for row in rows["rows"])
+
+    def edit(row_id: str, value: str, base_version: int):
+        return client.post(
+            f"/api/jobs/{job_id}/edits",
+            json={
+                "base_version": base_version,
+                "edits": [{"row_id": row_id, "column": "first_name", "value": value}],
+            },
+        )
+
+    assert edit(first, "Eva", 1).status_code == 200
+    log_path = tmp_path / "jobs" / job_id / "history" / "versions.jsonl"
+    with log_path.open("ab") as log:
+        log.write(b'{"version": 3, "cel')
+
+    assert edit(second, "Noel", 1).status_code == 200
+    assert edit(second, "Nora", 1).status_code == 409
+    assert edit(first, "Ada", 3).status_code == 200
+    job_store.clear_active_job()